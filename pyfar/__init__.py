@@ -6,6 +6,7 @@ __author__ = """The pyfar developers"""
 __email__ = ''
 __version__ = '0.5.3'
 
+import importlib
 
 from .classes.audio import Signal, TimeData, FrequencyData
 from .classes.audio import (add, subtract, multiply, divide, power,
@@ -14,11 +15,11 @@ from .classes.coordinates import Coordinates
 from .classes.orientations import Orientations
 from .classes.filter import FilterFIR, FilterIIR, FilterSOS
 
-from . import plot
-from . import samplings
-from . import io
 from . import dsp
-from . import signals
+
+# subpackages with costly imports, e.g., matplotlib, sofar, and large
+# sampling tables, are imported upon first access (see __getattr__)
+_lazy_subpackages = ('plot', 'samplings', 'io', 'signals')
 
 
 __all__ = [
@@ -41,3 +42,16 @@ __all__ = [
     'io',
     'dsp',
     'signals']
+
+
+def __getattr__(name):
+    """Import subpackages listed in `_lazy_subpackages` on first access."""
+    if name in _lazy_subpackages:
+        # importing a subpackage adds it to the globals of this module.
+        # __getattr__ is thus called only once per subpackage
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_subpackages))
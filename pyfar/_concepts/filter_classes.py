@@ -75,6 +75,17 @@ Another option for initialization is
 which makes sure that the first sample of the output is the same as the first
 sample of the input.
 
+Long signals that do not fit into memory can be filtered in the same way by
+passing an iterable of blocks to ``process_blocks``. The blocks can be
+Signals or arrays, and the state is initialized with zeros if it was not
+initialized before
+
+.. code-block:: python
+
+    blocks = (input[..., n:n+2] for n in range(0, 4, 2))
+    for block in filter.process_blocks(blocks, reset=True):
+        print(block.time)
+
 To disable tracking the state, call ``process`` with ``reset=True``
 
 .. code-block:: python
@@ -0,0 +1,31 @@
+"""Private helper functions shared between the pyfar subpackages."""
+import os
+import multiprocessing
+
+
+def _check_workers(workers):
+    """
+    Check the number of workers for parallel processing and return the
+    number of CPU cores if `workers` is ``-1``.
+    """
+    if workers == -1:
+        return multiprocessing.cpu_count()
+    if not isinstance(workers, int) or workers < 1:
+        raise ValueError(
+            f"workers must be -1 or a positive integer but is {workers}")
+    return workers
+
+
+def _file_mode(filename):
+    """
+    Return the permissions for writing `filename` through a temporary file.
+
+    Temporary files are only accessible by the owner. They get the mode of
+    the file they replace, or the mode of a newly created file, i.e.,
+    ``0o666`` restricted by the umask of the process.
+    """
+    if os.path.isfile(filename):
+        return os.stat(filename).st_mode & 0o777
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
@@ -25,13 +25,14 @@ class _Audio():
     # (e.g. __rmul__)
     __array_priority__ = 1.0
 
-    def __init__(self, domain, comment=None):
+    def __init__(self, domain, comment=None, dtype=np.float64):
 
         # initialize valid parameter spaces
         self._VALID_DOMAINS = ["time", "freq"]
 
         # initialize global parameters
         self.comment = comment
+        self._dtype = _check_dtype(dtype)
         if domain in self._VALID_DOMAINS:
             self._domain = domain
         else:
@@ -46,6 +47,32 @@ class _Audio():
         """The domain the data is stored in."""
         return self._domain
 
+    @property
+    def dtype(self):
+        """
+        The precision of the data.
+
+        Can be ``numpy.float64`` (double precision) or ``numpy.float32``
+        (single precision). Real valued data is stored with this type and
+        complex valued data with the corresponding complex type, i.e.,
+        ``numpy.complex128`` or ``numpy.complex64``. Setting the dtype
+        converts the data.
+        """
+        return self._dtype
+
+    @dtype.setter
+    def dtype(self, value):
+        """Set the precision of the data."""
+        self._dtype = _check_dtype(value)
+        self._data = self._data.astype(
+            self._complex_dtype if self._data.dtype.kind == "c"
+            else self._dtype, copy=False)
+
+    @property
+    def _complex_dtype(self):
+        """The complex type corresponding to `dtype`."""
+        return np.result_type(self._dtype, np.complex64).type
+
     @property
     def cshape(self):
         """
@@ -188,7 +215,7 @@ class TimeData(_Audio):
     to frequency domain, i.e., non-equidistant samples.
 
     """
-    def __init__(self, data, times, comment=None):
+    def __init__(self, data, times, comment=None, dtype=np.float64):
         """Create TimeData object with data, and times.
 
         Parameters
@@ -197,15 +224,19 @@ class TimeData(_Audio):
             Raw data in the time domain. The memory layout of data is 'C'.
             E.g. data of ``shape = (3, 2, 1024)`` has 3 x 2 channels with
             1024 samples each. The data can be ``int`` or ``float`` and is
-            converted to ``float`` in any case.
+            converted to `dtype` in any case.
         times : array, double
             Times in seconds at which the data is sampled. The number of times
             must match the `size` of the last dimension of `data`.
         comment : str, optional
             A comment related to `data`. The default is ``'none'``.
+        dtype : numpy.float64, numpy.float32, optional
+            The precision of the data. Single precision requires half the
+            memory at the cost of a lower accuracy. The default is
+            ``numpy.float64``.
         """
 
-        _Audio.__init__(self, 'time', comment)
+        _Audio.__init__(self, 'time', comment, dtype)
 
         self.time = data
 
@@ -231,7 +262,7 @@ class TimeData(_Audio):
         elif data.dtype.kind != "f":
             raise ValueError(
                 f"time data is {data.dtype}  must be int or float")
-        data = np.atleast_2d(np.asarray(value, dtype=float))
+        data = np.atleast_2d(np.asarray(value, dtype=self._dtype))
         self._data = data
         self._n_samples = data.shape[-1]
         # setting the domain is only required for Signal. Setting it here
@@ -285,7 +316,7 @@ class TimeData(_Audio):
     def _return_item(self, data):
         """Return new :py:func:`TimeData` object with data."""
         item = TimeData(
-            data, times=self.times, comment=self.comment)
+            data, times=self.times, comment=self.comment, dtype=self.dtype)
         return item
 
     def __repr__(self):
@@ -353,7 +384,7 @@ class FrequencyData(_Audio):
     incomplete spectra.
 
     """
-    def __init__(self, data, frequencies, comment=None):
+    def __init__(self, data, frequencies, comment=None, dtype=np.float64):
         """Create FrequencyData with data, and frequencies.
 
         Parameters
@@ -362,12 +393,17 @@ class FrequencyData(_Audio):
             Raw data in the frequency domain. The memory layout of Data is 'C'.
             E.g. data of ``shape = (3, 2, 1024)`` has 3 x 2 channels with 1024
             frequency bins each. Data can be ``int``, ``float`` or ``complex``.
-            Data of type ``int`` is converted to ``float``.
+            Data of type ``int`` and ``float`` is converted to `dtype` and
+            complex data to the corresponding complex type.
         frequencies : array, double
             Frequencies of the data in Hz. The number of frequencies must match
             the size of the last dimension of data.
         comment : str, optional
             A comment related to the data. The default is ``'none'``.
+        dtype : numpy.float64, numpy.float32, optional
+            The precision of the data. Single precision requires half the
+            memory at the cost of a lower accuracy. The default is
+            ``numpy.float64``.
 
         Notes
         -----
@@ -384,7 +420,7 @@ class FrequencyData(_Audio):
 
         """
 
-        _Audio.__init__(self, 'freq', comment)
+        _Audio.__init__(self, 'freq', comment, dtype)
 
         # init
         freqs = np.atleast_1d(np.asarray(frequencies).flatten())
@@ -409,9 +445,11 @@ class FrequencyData(_Audio):
 
         # check data type
         data = np.atleast_2d(np.asarray(value))
-        if data.dtype.kind == "i":
-            data = data.astype("float")
-        elif data.dtype.kind not in ["f", "c"]:
+        if data.dtype.kind in ["i", "f"]:
+            data = data.astype(self._dtype, copy=False)
+        elif data.dtype.kind == "c":
+            data = data.astype(self._complex_dtype, copy=False)
+        else:
             raise ValueError((f"frequency data is {data.dtype} must be int, "
                               "float, or complex"))
 
@@ -465,7 +503,7 @@ class FrequencyData(_Audio):
         """Return new FrequencyData object with data."""
         item = FrequencyData(
             data, frequencies=self.frequencies,
-            comment=self.comment)
+            comment=self.comment, dtype=self.dtype)
         return item
 
     def __repr__(self):
@@ -541,7 +579,8 @@ class Signal(FrequencyData, TimeData):
             n_samples=None,
             domain='time',
             fft_norm='none',
-            comment=None):
+            comment=None,
+            dtype=np.float64):
         """Create Signal with data, and sampling rate.
 
         Parameters
@@ -550,9 +589,10 @@ class Signal(FrequencyData, TimeData):
             Raw data of the signal in the time or frequency domain. The memory
             layout of data is 'C'. E.g. data of ``shape = (3, 2, 1024)`` has
             3 x 2 channels with 1024 samples or frequency bins each. Time data
-            is converted to ``float``. Frequency is converted to ``complex``
-            and must be provided as single sided spectra, i.e., for all
-            frequencies between 0 Hz and half the sampling rate.
+            is converted to `dtype`. Frequency is converted to the
+            corresponding complex type and must be provided as single sided
+            spectra, i.e., for all frequencies between 0 Hz and half the
+            sampling rate.
         sampling_rate : double
             Sampling rate in Hz
         n_samples : int, optional
@@ -569,6 +609,14 @@ class Signal(FrequencyData, TimeData):
             used for energy signals, such as impulse responses.
         comment : str
             A comment related to `data`. The default is ``None``.
+        dtype : numpy.float64, numpy.float32, optional
+            The precision of the data. ``numpy.float64`` stores the data in
+            double precision, i.e., ``float64`` time and ``complex128``
+            frequency data. ``numpy.float32`` stores the data in single
+            precision, i.e., ``float32`` time and ``complex64`` frequency
+            data, which requires half the memory. The precision is kept by
+            the Fourier transforms, arithmetic operations, and filters. The
+            default is ``numpy.float64``.
 
         References
         ----------
@@ -581,6 +629,8 @@ class Signal(FrequencyData, TimeData):
 
         # initialize signal specific parameters
         self._sampling_rate = sampling_rate
+        self._cache_domains = False
+        self._cached_data = None
         self._VALID_FFT_NORMS = [
             "none", "unitary", "amplitude", "rms", "power", "psd"]
 
@@ -599,7 +649,7 @@ class Signal(FrequencyData, TimeData):
             self._n_samples = data.shape[-1]
             times = np.atleast_1d(
                 np.arange(0, self._n_samples) / sampling_rate)
-            TimeData.__init__(self, data, times, comment)
+            TimeData.__init__(self, data, times, comment, dtype)
         elif domain == 'freq':
             # check and set n_samples
             if n_samples is None:
@@ -612,7 +662,8 @@ class Signal(FrequencyData, TimeData):
                                   "2 * data.shape[-1] - 2"))
             self._n_samples = n_samples
             # Init remaining parameters
-            FrequencyData.__init__(self, data, self.frequencies, comment)
+            FrequencyData.__init__(
+                self, data, self.frequencies, comment, dtype)
             delattr(self, '_frequencies')
         else:
             raise ValueError("Invalid domain. Has to be 'time' or 'freq'.")
@@ -625,6 +676,12 @@ class Signal(FrequencyData, TimeData):
 
         return super().time
 
+    @time.setter
+    def time(self, value):
+        """Set the time data."""
+        self._cached_data = None
+        TimeData.time.fset(self, value)
+
     @FrequencyData.freq.getter
     def freq(self):
         """Return the normalized frequency domain data.
@@ -654,13 +711,14 @@ class Signal(FrequencyData, TimeData):
                 "Number of frequency bins changed, assuming an even "
                 "number of samples from the number of frequency bins.")))
             self._n_samples = (data.shape[-1] - 1)*2
-        # set domain
+        # set domain and discard cached data
         self._domain = 'freq'
+        self._cached_data = None
         # remove normalization
         data_denorm = fft.normalization(
                 data, self._n_samples, self._sampling_rate,
                 self._fft_norm, inverse=True)
-        self._data = data_denorm.astype(complex)
+        self._data = data_denorm.astype(self._complex_dtype)
 
     @property
     def freq_raw(self):
@@ -689,7 +747,8 @@ class Signal(FrequencyData, TimeData):
                 "number of samples from the number of frequency bins.")))
             self._n_samples = (data.shape[-1] - 1)*2
         self._domain = 'freq'
-        self._data = data.astype(complex)
+        self._cached_data = None
+        self._data = data.astype(self._complex_dtype)
 
     @_Audio.domain.setter
     def domain(self, new_domain):
@@ -699,21 +758,85 @@ class Signal(FrequencyData, TimeData):
 
         if self._domain != new_domain:
             # Only process if we change domain
-            if new_domain == 'time':
-                # If the new domain should be time, we had a saved spectrum
-                # (without normalization)
-                # and need to do an inverse Fourier Transform
-                self._data = fft.irfft(
-                    self._data, self.n_samples, self._sampling_rate,
-                    fft_norm='none')
-            elif new_domain == 'freq':
-                # If the new domain should be freq, we had sampled time data
-                # and need to do a Fourier Transform (without normalization)
-                self._data = fft.rfft(
-                    self._data, self.n_samples, self._sampling_rate,
-                    fft_norm='none')
+            if self._cached_data is not None:
+                # The data is cached in the new domain and is still valid
+                self._data, self._cached_data = self._cached_data, self._data
+            else:
+                if new_domain == 'time':
+                    # If the new domain should be time, we had a saved
+                    # spectrum (without normalization) and need to do an
+                    # inverse Fourier Transform
+                    data = fft.irfft(
+                        self._data, self.n_samples, self._sampling_rate,
+                        fft_norm='none').astype(self._dtype, copy=False)
+                elif new_domain == 'freq':
+                    # If the new domain should be freq, we had sampled time
+                    # data and need to do a Fourier Transform (without
+                    # normalization)
+                    data = fft.rfft(
+                        self._data, self.n_samples, self._sampling_rate,
+                        fft_norm='none').astype(
+                            self._complex_dtype, copy=False)
+                if self._cache_domains:
+                    # keep the data of the old domain. Both arrays are made
+                    # read-only because in-place changes would invalidate the
+                    # cache without notice. The old data is copied, because
+                    # arrays that were returned before can still be changed
+                    self._cached_data = self._data.copy()
+                    self._cached_data.flags.writeable = False
+                    data.flags.writeable = False
+                self._data = data
             self._domain = new_domain
 
+    @property
+    def cache_domains(self):
+        """
+        Keep the data in the time and frequency domain.
+
+        If ``True``, the data of the previous domain is kept when the data is
+        accessed in the other domain. Accessing ``time`` after ``freq_raw``
+        or vice versa then does not require a new Fourier transform. This
+        can save a lot of computations if the data is repeatedly accessed in
+        both domains, but doubles the memory that is required by the signal.
+
+        The cached data is discarded if the data is changed through
+        ``time``, ``freq``, ``freq_raw``, or by setting channels of the
+        signal. While data is cached, the arrays that are returned by
+        ``time`` and ``freq_raw`` are read-only, because in-place
+        modifications would not be noticed by the signal. As without the
+        cache, changing arrays that were returned before the domain changed
+        does not change the signal. Setting
+        ``cache_domains`` to ``False`` discards the cached data and frees
+        the memory. Copies of the signal do not contain cached data.
+
+        The default is ``False``.
+        """
+        return self._cache_domains
+
+    @cache_domains.setter
+    def cache_domains(self, value):
+        if not isinstance(value, bool):
+            raise TypeError("cache_domains must be a bool.")
+        self._cache_domains = value
+        if not value:
+            self._discard_cached_data()
+
+    def _discard_cached_data(self):
+        """Discard cached data and make the data writeable again."""
+        if self._cached_data is not None:
+            self._cached_data = None
+            try:
+                self._data.flags.writeable = True
+            except ValueError:
+                # the data is a view on a read-only array
+                pass
+
+    @_Audio.dtype.setter
+    def dtype(self, value):
+        """Set the precision of the data."""
+        self._discard_cached_data()
+        _Audio.dtype.fset(self, value)
+
     @property
     def sampling_rate(self):
         """The sampling rate of the signal."""
@@ -773,11 +896,39 @@ class Signal(FrequencyData, TimeData):
         if self.fft_norm != other.fft_norm:
             raise ValueError("The FFT norms do not match.")
 
+    def __setitem__(self, key, value):
+        """
+        Set channels of audio object at key.
+
+        Examples
+        --------
+        Set the first channel of a multi channel audio object
+
+        >>> import pyfar as pf
+        >>> signal = pf.signals.noise(10, rms=[1, 1])
+        >>> signal[0] = pf.signals.noise(10, rms=2)
+        """
+        self._discard_cached_data()
+        super().__setitem__(key, value)
+
+    def __eq__(self, other):
+        """Check for equality of two objects."""
+        return not deepdiff.DeepDiff(
+            self.__dict__, other.__dict__,
+            exclude_paths=["root['_cache_domains']", "root['_cached_data']"])
+
+    def __getstate__(self):
+        """Return the state for copying and pickling without cached data."""
+        state = self.__dict__.copy()
+        state['_cached_data'] = None
+        return state
+
     def _return_item(self, data):
         """Return new Signal object with data."""
         item = Signal(data, sampling_rate=self.sampling_rate,
                       n_samples=self.n_samples, domain=self.domain,
-                      fft_norm=self.fft_norm, comment=self.comment)
+                      fft_norm=self.fft_norm, comment=self.comment,
+                      dtype=self.dtype)
         return item
 
     def _encode(self):
@@ -785,6 +936,9 @@ class Signal(FrequencyData, TimeData):
         selfcopy = self.copy()
         selfcopy.domain = "time"
         class_dict = selfcopy.__dict__
+        # caching is a run-time setting and not written to disk
+        del class_dict['_cache_domains']
+        del class_dict['_cached_data']
         return class_dict
 
     @classmethod
@@ -1262,6 +1416,10 @@ def _arithmetic(data: tuple, domain: str, operation: Callable, **kwargs):
     sampling_rate, n_samples, fft_norm, times, frequencies, audio_type, \
         cshape = \
         _assert_match_for_arithmetic(data, domain, division, matmul)
+    # single precision is only kept if all audio objects are single precision
+    dtype = np.float32 if all(
+        d.dtype == np.float32 for d in data
+        if isinstance(d, (Signal, TimeData, FrequencyData))) else np.float64
 
     # apply arithmetic operation
     result = _get_arithmetic_data(data[0], domain, cshape, matmul, audio_type)
@@ -1278,13 +1436,14 @@ def _arithmetic(data: tuple, domain: str, operation: Callable, **kwargs):
     if audio_type == Signal:
         # Set unnormalized spectrum
         result = Signal(
-            result, sampling_rate, n_samples, domain, fft_norm='none')
+            result, sampling_rate, n_samples, domain, fft_norm='none',
+            dtype=dtype)
         # Set fft norm
         result.fft_norm = fft_norm
     elif audio_type == TimeData:
-        result = TimeData(result, times)
+        result = TimeData(result, times, dtype=dtype)
     elif audio_type == FrequencyData:
-        result = FrequencyData(result, frequencies)
+        result = FrequencyData(result, frequencies, dtype=dtype)
 
     return result
 
@@ -1494,6 +1653,18 @@ def _matrix_multiplication(a, b, axes, audio_type):
     return np.matmul(a, b, axes=axes)
 
 
+def _check_dtype(dtype):
+    """Check the precision of audio data and return it as numpy type."""
+    try:
+        dtype = np.dtype(dtype).type
+    except TypeError:
+        dtype = None
+    if dtype not in [np.float64, np.float32]:
+        raise ValueError(
+            "dtype must be numpy.float64 or numpy.float32")
+    return dtype
+
+
 def _match_fft_norm(fft_norm_1, fft_norm_2, division=False):
     """
     Helper function to determine the fft_norm resulting from an
@@ -5,11 +5,13 @@ coordinate conversion. More background information is given in
 Available sampling schemes are listed at :py:mod:`~pyfar.samplings`.
 """
 import numpy as np
+import scipy
 from scipy.spatial import cKDTree
 from scipy.spatial.transform import Rotation as sp_rot
 import deepdiff
 import re
 from copy import deepcopy
+from functools import lru_cache
 
 import pyfar as pf
 
@@ -23,10 +25,12 @@ class Coordinates():
     # Notes on the structure for developing -----------------------------------
     #
     # * All implemented cordinate systems are defined in a nested dictionary.
-    #   The dictionary is returned by self._systems()
+    #   The dictionary is returned by self._systems(). It is made only once
+    #   and is read-only.
     #
     # * The current coordinate system is contained in self._system. It is
-    #   generated by self._make_system()
+    #   generated by self._make_system(), which caches the systems in
+    #   _made_systems
     #
     # * A dictionary search is used to check if domain, coordinates, and units
     #   are valid
@@ -34,6 +38,15 @@ class Coordinates():
     # * The coordinate points are stored in sefl._points and returned by the
     #   getter functions.
     #
+    # * The KDTree for searching points is stored in self._kdtree. It is made
+    #   upon the first search and discarded whenever self._points is set by
+    #   self._set_points(). It is not copied or written to disk.
+    #
+    # * Points that were converted to other coordinate systems by the getter
+    #   functions are stored as read-only arrays in self._converted_points
+    #   with the keys (domain, convention, unit). They are discarded together
+    #   with the KDTree.
+    #
     # To implement a new coordinate system -----------------------------------
     #
     # * Add the system to self._systems()
@@ -127,6 +140,8 @@ class Coordinates():
 
         # init emtpy object
         super(Coordinates, self).__init__()
+        self._kdtree = None
+        self._converted_points = {}
 
         # set the coordinate system
         self._system = self._make_system(domain, convention, unit)
@@ -226,6 +241,11 @@ class Coordinates():
         if self._system == new_system:
             return self._points
 
+        # return if points were already converted
+        points = self._get_converted_points(new_system)
+        if points is not None and not convert:
+            return points
+
         # convert to radians
         pts = self._points.copy()
         for nn, unit in enumerate(self._system['units']):
@@ -376,13 +396,18 @@ class Coordinates():
         if new_system == self._system:
             return self._points
 
+        # return if points were already converted
+        points = self._get_converted_points(new_system)
+        if points is not None and not convert:
+            return points
+
         # get cartesian system first
         if not (self._system['domain'] == 'cart' and
                 self._system['convention'] == 'right'):
             pts = self.get_cart('right', 'met')
             # remove noise below eps
             eps = np.finfo(np.float64).eps
-            pts[np.abs(pts) < eps] = 0
+            pts = np.where(np.abs(pts) < eps, 0, pts)
         else:
             pts = self._points.copy()
 
@@ -510,13 +535,18 @@ class Coordinates():
         if new_system == self._system:
             return self._points
 
+        # return if points were already converted
+        points = self._get_converted_points(new_system)
+        if points is not None and not convert:
+            return points
+
         # convert to cartesian system first
         if not (self._system['domain'] == 'cart' and
                 self._system['convention'] == 'right'):
             pts = self.get_cart('right', 'met')
             # remove noise below eps
             eps = np.finfo(np.float64).eps
-            pts[np.abs(pts) < eps] = 0
+            pts = np.where(np.abs(pts) < eps, 0, pts)
         else:
             pts = self._points.copy()
 
@@ -788,6 +818,70 @@ class Coordinates():
 
         return index, mask
 
+    def find_nearest(self, find, k=1, workers=1):
+        """
+        Find the k nearest coordinate points for many query points at once.
+
+        In contrast to :py:func:`~find_nearest_k`, the Euclidean distances to
+        the nearest points are returned and no mask is computed, which makes
+        this the fastest option for searching a large number of points, e.g.,
+        for selecting head-related transfer functions during head tracking.
+        The search tree is built only once and reused until the coordinate
+        points of the object change.
+
+        Parameters
+        ----------
+        find : Coordinates
+            Coordinates object containing the query points. The points can be
+            in any coordinate system.
+        k : int, optional
+            Number of points to return. k must be > 0 and <= ``csize``. The
+            default is ``1``.
+        workers : int, optional
+            Number of workers to use for parallel processing. ``-1`` uses all
+            available CPU cores. The default is ``1``.
+
+        Returns
+        -------
+        distance : numpy array of floats
+            The Euclidean distances in meters between the query points and
+            their nearest neighbors of shape ``find.cshape`` if ``k=1`` and
+            ``find.cshape + (k, )`` otherwise.
+        index : numpy array of ints
+            The locations of the neighbors in the reshaped coordinate points
+            of the same shape as `distance`. To access the points use
+
+            >>> points_reshaped = self.get_cart().reshape((self.csize, 3))
+            >>> points_reshaped[index]
+
+        Examples
+        --------
+        Find the nearest points for a trajectory of head orientations
+
+        >>> import pyfar as pf
+        >>> import numpy as np
+        >>> coords = pf.samplings.sph_lebedev(sh_order=10)
+        >>> azimuth = np.linspace(0, 2 * np.pi, 1000, endpoint=False)
+        >>> find = pf.Coordinates(azimuth, np.pi / 2, 1, 'sph', 'top_colat')
+        >>> distance, index = coords.find_nearest(find)
+        """
+
+        # check the input
+        if not isinstance(find, Coordinates):
+            raise ValueError("find must be a pyfar.Coordinates object.")
+        if find.cshape == (0, ):
+            raise ValueError("find must not be empty.")
+        if not isinstance(k, int) or k < 1 or k > self.csize:
+            raise ValueError("k must be an integer > 0 and <= self.csize.")
+
+        # query all points at once
+        points = find.get_cart().reshape((find.csize, 3))
+        distance, index = self._make_kdtree().query(
+            points, k=k, **{_kdtree_workers: workers})
+
+        shape = find.cshape if k == 1 else find.cshape + (k, )
+        return distance.reshape(shape), index.reshape(shape)
+
     def find_nearest_cart(self, points_1, points_2, points_3, distance,
                           domain='cart', convention='right', unit='met',
                           show=False, atol=1e-15):
@@ -1143,7 +1237,12 @@ class Coordinates():
 
     def _encode(self):
         """Return dictionary for the encoding."""
-        return self.copy().__dict__
+        class_dict = self.copy().__dict__
+        # the search tree and converted points are run-time caches and not
+        # written to disk
+        del class_dict['_kdtree']
+        del class_dict['_converted_points']
+        return class_dict
 
     @classmethod
     def _decode(cls, obj_dict):
@@ -1153,10 +1252,13 @@ class Coordinates():
         return obj
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _systems():
         """
         Get class internal information about all coordinate systems.
 
+        The dictionary is made upon the first call and is read-only.
+
         Returns
         -------
         _systems : nested dictionary
@@ -1344,7 +1446,7 @@ class Coordinates():
             }
         }
 
-        return _systems
+        return _freeze(_systems)
 
     def _exist_system(self, domain=None, convention=None, unit=None):
         """
@@ -1425,16 +1527,22 @@ class Coordinates():
     def _make_system(self, domain=None, convention=None, unit=None):
         """
         Make and return class internal information about coordinate system.
+
+        The systems are made once and a copy is returned on subsequent calls.
         """
 
+        if (domain, convention, unit) in _made_systems:
+            return _thaw(_made_systems[(domain, convention, unit)])
+
         # check if coordinate system exists
         self._exist_system(domain, convention, unit)
+        key = (domain, convention, unit)
 
         # get the new system
         system = self._systems()
         if convention is None:
             convention = list(system[domain])[0]
-        system = system[domain][convention]
+        system = _thaw(system[domain][convention])
 
         # get the units
         if unit is not None:
@@ -1451,7 +1559,8 @@ class Coordinates():
         system['unit'] = unit
         system['units'] = units
 
-        return system
+        _made_systems[key] = _freeze(system)
+        return _thaw(_made_systems[key])
 
     def _return_system(self, pts1, pts2, pts3, new_system, convert):
 
@@ -1462,8 +1571,21 @@ class Coordinates():
             self._set_points(pts1, pts2, pts3, True)
             return self._points
         else:
-            # return points without conversion
-            return self._set_points(pts1, pts2, pts3, system=new_system)
+            # return points without conversion and keep them for later calls.
+            # The kept points are read-only and callers get copies.
+            points = self._set_points(pts1, pts2, pts3, system=new_system)
+            points.flags.writeable = False
+            self._converted_points[(new_system['domain'],
+                                    new_system['convention'],
+                                    new_system['unit'])] = points
+            return points.copy()
+
+    def _get_converted_points(self, system):
+        """Return a copy of points that were converted to `system` or None.
+        """
+        points = self._converted_points.get(
+            (system['domain'], system['convention'], system['unit']))
+        return None if points is None else points.copy()
 
     def _set_points(self, points_1, points_2, points_3,
                     convert=False, system=None):
@@ -1548,8 +1670,11 @@ class Coordinates():
         pts[np.abs(pts) < eps] = 0
 
         if convert:
-            # save to class variable
+            # save to class variable and discard the outdated search tree
+            # and converted points
             self._points = pts
+            self._kdtree = None
+            self._converted_points = {}
         else:
             return pts
 
@@ -1624,12 +1749,18 @@ class Coordinates():
         return distance, index, mask
 
     def _make_kdtree(self):
-        """Make a numpy KDTree for fast search of nearest points."""
+        """
+        Return a numpy KDTree for fast search of nearest points.
+
+        The tree is made upon the first call and stored until the points
+        change.
+        """
 
-        xyz = self.get_cart()
-        kdtree = cKDTree(xyz.reshape((self.csize, 3)))
+        if self._kdtree is None:
+            xyz = self.get_cart()
+            self._kdtree = cKDTree(xyz.reshape((self.csize, 3)))
 
-        return kdtree
+        return self._kdtree
 
     def __getitem__(self, index):
         """Return copied slice of Coordinates object at index."""
@@ -1637,6 +1768,8 @@ class Coordinates():
         new = self.copy()
         # slice points
         new._points = np.atleast_2d(new._points[index])
+        new._kdtree = None
+        new._converted_points = {}
         # slice weights
         if new._weights is not None:
             new._weights = new._weights[index]
@@ -1691,7 +1824,57 @@ class Coordinates():
 
     def __eq__(self, other):
         """Check for equality of two objects."""
-        return not deepdiff.DeepDiff(self, other)
+        return not deepdiff.DeepDiff(
+            self, other,
+            exclude_paths=["root._kdtree", "root._converted_points"])
+
+    def __getstate__(self):
+        """
+        Return the state for copying and pickling without search tree and
+        converted points.
+        """
+        state = self.__dict__.copy()
+        state['_kdtree'] = None
+        state['_converted_points'] = {}
+        return state
+
+
+class _FrozenDict(dict):
+    """Read-only dictionary used for the coordinate systems."""
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("The coordinate systems are read-only.")
+
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+
+def _freeze(value):
+    """Convert nested dictionaries and lists to read-only containers."""
+    if isinstance(value, dict):
+        return _FrozenDict((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value):
+    """Convert read-only containers from :py:func:`_freeze` to dictionaries
+    and lists."""
+    if isinstance(value, dict):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+# cache for Coordinates._make_system
+_made_systems = {}
+
+# name of the parameter for parallel queries of cKDTree, which is 'n_jobs'
+# in scipy < 1.6
+_kdtree_workers = 'workers' if tuple(
+    int(v) for v in scipy.__version__.split('.')[:2]) >= (1, 6) else 'n_jobs'
 
 
 def cart2sph(x, y, z):
@@ -7,11 +7,13 @@ documented in :py:mod:`pyfar.dsp.filter`.
 """
 import deepdiff
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import scipy.signal as spsignal
 
 import pyfar as pf
+from pyfar._utils import _check_workers
 from copy import deepcopy
 
 
@@ -196,7 +198,7 @@ class Filter(object):
     def _process(coefficients, data, zi=None):
         raise NotImplementedError("Abstract class method.")
 
-    def process(self, signal, reset=False):
+    def process(self, signal, reset=False, workers=1):
         """Apply the filter to a signal.
 
         Parameters
@@ -209,11 +211,18 @@ class Filter(object):
             is ``None``, this option will have no effect. Use ``init_state``
             to initialize a filter with no previously set state. The default
             is ``'False'``.
+        workers : int, optional
+            The maximum number of threads that are used to apply the filter
+            channels in parallel. All channels of the signal are processed
+            at once for each filter channel. ``-1`` uses all available CPU
+            cores. Using multiple threads can speed up the processing of
+            filter banks with many channels. The default is ``1``.
 
         Returns
         -------
         filtered : Signal
-            A filtered copy of the input signal.
+            A filtered copy of the input signal. The precision of the input
+            signal is kept (see :py:attr:`Signal.dtype`).
         """
         if not isinstance(signal, pf.Signal):
             raise ValueError("The input needs to be a Signal object.")
@@ -225,30 +234,145 @@ class Filter(object):
         if reset is True:
             self.reset()
 
-        # shape of the output signal. if n_channels is 1, it will be squeezed
-        # below
-        filtered_signal_data = np.zeros(
-            (self.n_channels, *signal.time.shape),
-            dtype=signal.time.dtype)
-
-        if self.state is not None:
-            new_state = np.zeros_like(self._state)
-            for idx, (coeff, state) in enumerate(
-                    zip(self._coefficients, self._state)):
-                filtered_signal_data[idx, ...], new_state[idx, ...] = \
-                    self._process(coeff, signal.time, state)
-            self._state = new_state
-        else:
-            for idx, coeff in enumerate(self._coefficients):
-                filtered_signal_data[idx, ...] = self._process(
-                    coeff, signal.time, zi=None)
+        # the time data is obtained only once to avoid repeated domain
+        # changes of the input signal
+        filtered = np.squeeze(self._process_data(signal.time, workers))
 
         # prepare output signal
-        filtered_signal = deepcopy(signal)
-        filtered_signal.time = np.squeeze(filtered_signal_data)
+        filtered_signal = pf.Signal(
+            filtered, signal.sampling_rate, fft_norm=signal.fft_norm,
+            comment=signal.comment, dtype=signal.dtype)
 
         return filtered_signal
 
+    def process_blocks(self, blocks, reset=False, workers=1):
+        """Apply the filter to a stream of signal blocks.
+
+        The filter state is initialized with zeros if it is ``None`` and
+        tracked across all blocks. Processing a signal block by block thus
+        yields the same output as processing the entire signal at once, while
+        only a single block has to be kept in memory. Refer to the
+        :py:mod:`filter concepts <pyfar._concepts.filter_classes>` for more
+        information.
+
+        Parameters
+        ----------
+        blocks : iterable
+            The blocks to be filtered. Each block can be a
+            :py:class:`~pyfar.classes.audio.Signal` or an array like time
+            signal with dimensions ``(*cshape, n_samples)``. The channel
+            shape must be the same for all blocks, the number of samples can
+            vary. The precision of the blocks is kept if they are single or
+            double precision.
+        reset : bool, optional
+            If set to ``True``, the filter state will be reset to zeros before
+            the first block is processed. The default is ``'False'``.
+        workers : int, optional
+            The maximum number of threads that are used to apply the filter
+            channels in parallel. See :py:meth:`process`. The default is
+            ``1``.
+
+        Yields
+        ------
+        filtered : Signal, numpy array
+            The filtered block. Signals are returned for Signals and arrays
+            for arrays. The output has the dimensions
+            ``(n_channels, *cshape, n_samples)``, where dimensions of size one
+            are removed as in :py:meth:`process`.
+
+        Examples
+        --------
+        Filter a signal in blocks of 128 samples
+
+        >>> import pyfar as pf
+        >>> signal = pf.signals.noise(1024, seed=1)
+        >>> lowpass = pf.dsp.filter.butterworth(
+        >>>     None, 4, 1000, 'lowpass', 44100)
+        >>> blocks = (signal[..., n:n+128] for n in range(0, 1024, 128))
+        >>> for filtered in lowpass.process_blocks(blocks):
+        >>>     print(filtered.n_samples)
+        """
+        if reset is True:
+            self.reset()
+
+        for block in blocks:
+            if isinstance(block, pf.Signal):
+                if self.sampling_rate != block.sampling_rate:
+                    raise ValueError(
+                        "The sampling rates of filter and signal do not match")
+                data = block.time
+            else:
+                data = np.atleast_2d(np.asarray(block))
+                if data.dtype not in [np.float32, np.float64]:
+                    data = data.astype(float)
+
+            if self._state is None:
+                self.init_state(data.shape[:-1], state='zeros')
+
+            # remove dimensions of size one as in process but keep the
+            # samples, which could be a single one
+            filtered = self._process_data(data, workers)
+            filtered = np.squeeze(filtered, axis=tuple(
+                idx for idx, n in enumerate(filtered.shape[:-1]) if n == 1))
+
+            if isinstance(block, pf.Signal):
+                yield pf.Signal(
+                    filtered, block.sampling_rate, fft_norm=block.fft_norm,
+                    comment=block.comment, dtype=block.dtype)
+            else:
+                yield filtered
+
+    def _process_data(self, data, workers=1):
+        """Filter time data with all filter channels.
+
+        The state is updated if it is tracked.
+
+        Parameters
+        ----------
+        data : numpy array
+            The time data with dimensions ``(*cshape, n_samples)``.
+        workers : int, optional
+            The maximum number of threads for processing the filter channels.
+            ``-1`` uses all available CPU cores. The default is ``1``.
+
+        Returns
+        -------
+        filtered : numpy array
+            The filtered data with dimensions
+            ``(n_channels, *cshape, n_samples)``.
+        """
+        workers = _check_workers(workers)
+
+        # all channels of the data are processed at once for each filter
+        # channel. A contiguous array avoids copying the data in each call.
+        data = np.ascontiguousarray(data)
+        filtered_data = np.zeros(
+            (self.n_channels, *data.shape), dtype=data.dtype)
+        state = self._state
+        new_state = None if state is None else np.zeros_like(state)
+
+        def process_channel(idx):
+            if state is None:
+                filtered_data[idx] = self._process(
+                    self._coefficients[idx], data, zi=None)
+            else:
+                filtered_data[idx], new_state[idx] = self._process(
+                    self._coefficients[idx], data, state[idx])
+
+        if workers == 1 or self.n_channels == 1:
+            for idx in range(self.n_channels):
+                process_channel(idx)
+        else:
+            # scipy releases the GIL during filtering, which makes threads
+            # efficient here
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(process_channel, range(self.n_channels)))
+
+        if state is not None:
+            self._state = new_state
+
+        return filtered_data
+
     def reset(self):
         """Reset the filter state by filling it with zeros."""
         if self._state is not None:
@@ -528,10 +652,10 @@ class FilterSOS(Filter):
         function in the parent class.
         """
         if zi is not None:
-            zi = zi.transpose(1, 0, 2)
+            zi = np.moveaxis(zi, -2, 0)
         res = spsignal.sosfilt(sos, data, zi=zi, axis=-1)
         if zi is not None:
-            zi = res[1].transpose(1, 0, 2)
+            zi = np.moveaxis(res[1], 0, -2)
             return res[0], zi
         else:
             return res
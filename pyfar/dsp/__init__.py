@@ -6,6 +6,7 @@ from .dsp import (
     linear_phase,
     zero_phase,
     spectrogram,
+    STFT,
     regularized_spectrum_inversion,
     pad_zeros,
     time_shift,
@@ -15,6 +16,7 @@ from .dsp import (
     find_impulse_response_start,
     deconvolve,
     convolve,
+    Convolver,
     decibel,
     energy,
     power,
@@ -27,6 +29,7 @@ from .interpolation import (
     smooth_fractional_octave,
     fractional_time_shift,
     resample,
+    Resampler,
     InterpolateSpectrum
 )
 
@@ -43,6 +46,7 @@ __all__ = [
     'linear_phase',
     'zero_phase',
     'spectrogram',
+    'STFT',
     'regularized_spectrum_inversion',
     'minimum_phase',
     'pad_zeros',
@@ -53,6 +57,7 @@ __all__ = [
     'find_impulse_response_start',
     'deconvolve',
     'convolve',
+    'Convolver',
     'decibel',
     'energy',
     'power',
@@ -60,6 +65,7 @@ __all__ = [
     'InterpolateSpectrum',
     'smooth_fractional_octave',
     'resample',
+    'Resampler',
     'average',
     'normalize',
     'fractional_time_shift'
@@ -1,8 +1,11 @@
-import multiprocessing
 import numpy as np
 from scipy import signal as sgn
+from scipy import fft as sfft
 import pyfar
 from pyfar.dsp import fft
+from pyfar._utils import _check_workers
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
 import warnings
 
 
@@ -295,9 +298,10 @@ def spectrogram(signal, window='hann', window_length=1024,
     window_overlap = int(window_length * window_overlap_fct)
     window = sgn.get_window(window, window_length)
 
-    frequencies, times, spectrogram = sgn.spectrogram(
-        x=signal.time.squeeze(), fs=signal.sampling_rate, window=window,
-        noverlap=window_overlap, mode='magnitude', scaling='spectrum')
+    with fft._scipy_options():
+        frequencies, times, spectrogram = sgn.spectrogram(
+            x=signal.time.squeeze(), fs=signal.sampling_rate, window=window,
+            noverlap=window_overlap, mode='magnitude', scaling='spectrum')
 
     # remove normalization from scipy.signal.spectrogram
     spectrogram /= np.sqrt(1 / window.sum()**2)
@@ -930,9 +934,6 @@ def minimum_phase(signal, n_fft=None, truncate=True):
         >>> axs[2].set_ylim(-2.5, 2.5)
 
     """
-    from scipy.fft import fft, ifft
-
-    workers = multiprocessing.cpu_count()
     # center the energy by taking the linear phase signal (using n_samples//2
     # performs better than using n_samples/2)
     signal = pyfar.dsp.linear_phase(
@@ -946,12 +947,12 @@ def minimum_phase(signal, n_fft=None, truncate=True):
             "which is the length of the input signal"))
 
     # add eps to the magnitude spectrum to avoid nans in log
-    H = np.abs(fft(signal.time, n=n_fft, workers=workers, axis=-1))
+    H = np.abs(fft._transform('fft', signal.time, n_fft))
     H[H == 0] = np.finfo(float).eps
 
     # calculate the minimum phase using the Hilbert transform
-    phase = -np.imag(sgn.hilbert(np.log(H), N=n_fft, axis=-1))
-    data = ifft(H*np.exp(1j*phase), axis=-1, workers=workers).real
+    phase = -np.imag(_analytic_signal(np.log(H)))
+    data = fft._transform('ifft', H*np.exp(1j*phase), n_fft).real
 
     # cut to length
     if truncate:
@@ -1029,7 +1030,8 @@ def pad_zeros(signal, pad_width, mode='after'):
 
 
 def time_shift(
-        signal, shift, mode='cyclic', unit='samples', pad_value=0.):
+        signal, shift, mode='cyclic', unit='samples', pad_value=0.,
+        inplace=False):
     """Apply a cyclic or linear time-shift to a signal.
 
     This function only allows integer value sample shifts. If unit ``'time'``
@@ -1037,6 +1039,9 @@ def time_shift(
     For a shift using fractional sample values see
     :py:func:`~pf.dsp.fractional_time_shift`.
 
+    All channels are shifted at once, which makes individual shifts of many
+    channels, e.g., of microphone array data, fast.
+
     Parameters
     ----------
     signal : Signal
@@ -1077,6 +1082,12 @@ def time_shift(
         power of a signal. Note that if NaNs are padded, the returned data
         will be a :py:class:`~pyfar.classes.audio.TimeData` instead of
         :py:class:`~pyfar.classes.audio.Signal` object.
+    inplace : bool, optional
+        If ``True``, the time data of `signal` is replaced by the shifted
+        data instead of shifting a copy of `signal`. This saves copying
+        large signals. A ``ValueError`` is raised if the shifted data
+        contains NaNs, because it can not be written to `signal` in this
+        case. The default is ``False``.
 
     Returns
     -------
@@ -1146,30 +1157,34 @@ def time_shift(
         raise ValueError(("Can not shift by more samples than signal.n_samples"
                           " if mode is 'linear'"))
 
-    shifted = signal.copy()
-    for ch in np.ndindex(signal.cshape):
-        shifted.time[ch] = np.roll(
-            shifted.time[ch],
-            shift_samples[ch],
-            axis=-1)
-
-        if mode == 'linear':
-            if shift_samples[ch] > 0:
-                samples = slice(0, shift_samples[ch])
-                shifted.time[ch + (samples, )] = pad_value
-            elif shift_samples[ch] < 0:
-                samples = slice(shifted.n_samples + shift_samples[ch],
-                                shifted.n_samples)
-                shifted.time[ch + (samples, )] = pad_value
-
-    if np.any(np.isnan(shifted.time)):
-        shifted = pyfar.TimeData(
-            shifted.time, shifted.times, comment=shifted.comment)
+    # shift all channels by gathering the samples in one indexing operation
+    samples = np.arange(signal.n_samples)
+    shift_samples = shift_samples[..., np.newaxis]
+    time = np.take_along_axis(
+        signal.time, (samples - shift_samples) % signal.n_samples, axis=-1)
+
+    if mode == 'linear':
+        # pad samples that were wrapped around
+        pad = (samples < shift_samples) | \
+            (samples >= signal.n_samples + shift_samples)
+        time[pad] = pad_value
+
+    if np.any(np.isnan(time)):
+        # Signals can not contain NaNs
+        if inplace:
+            raise ValueError((
+                "The shifted data contains NaNs and can not be written to "
+                "the signal. Use inplace=False to get a TimeData object."))
+        return pyfar.TimeData(
+            time, signal.times, comment=signal.comment, dtype=signal.dtype)
+
+    shifted = signal if inplace else signal.copy()
+    shifted.time = time
 
     return shifted
 
 
-def find_impulse_response_delay(impulse_response, N=1):
+def find_impulse_response_delay(impulse_response, N=1, workers=1):
     """Find the delay in sub-sample values of an impulse response.
 
     The method relies on the analytic part of the cross-correlation function
@@ -1191,6 +1206,10 @@ def find_impulse_response_delay(impulse_response, N=1):
         The impulse response.
     N : int, optional
         The order of the polynom used for root finding, by default 1.
+    workers : int, optional
+        The maximum number of threads that are used to process blocks of
+        channels in parallel. ``-1`` uses all available CPU cores. The
+        default is ``1``.
 
     Returns
     -------
@@ -1228,53 +1247,154 @@ def find_impulse_response_delay(impulse_response, N=1):
         >>> ax.legend()
 
     """
-    n = int(np.ceil((N+2)/2))
+    workers = _check_workers(workers)
+    n_samples = impulse_response.n_samples
+
+    # process blocks of channels at once. This limits the memory that is
+    # required for the zero padded spectra of many channels
+    time = impulse_response.time.reshape(-1, n_samples)
+    block_size = max(1, 2**18 // n_samples)
+    blocks = [time[idx:idx + block_size]
+              for idx in range(0, time.shape[0], block_size)]
+
+    if workers == 1:
+        start_samples = [_find_impulse_response_delay(block, N)
+                         for block in blocks]
+    else:
+        # run the jobs in copies of the current context to apply the FFT
+        # options that are set by pyfar.dsp.fft.options in the threads
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            jobs = [executor.submit(
+                contextvars.copy_context().run,
+                _find_impulse_response_delay, block, N) for block in blocks]
+            start_samples = [job.result() for job in jobs]
+
+    start_samples = np.concatenate(start_samples).reshape(
+        impulse_response.cshape)
+
+    for ch in np.argwhere(np.isnan(start_samples)):
+        warnings.warn(
+            f"Starting sample not found for channel {tuple(ch.tolist())}")
+
+    return start_samples
 
-    start_samples = np.zeros(impulse_response.cshape)
-    for ch in np.ndindex(impulse_response.cshape):
-        # Calculate the correlation between the impulse response and its
-        # minimum phase equivalent. This requires a minimum phase equivalent
-        # in the strict sense, instead of the appriximation implemented in
-        # pyfar.
-        n_samples = impulse_response.n_samples
-        ir_minphase = sgn.minimum_phase(
-            impulse_response.time[ch], n_fft=4*n_samples)
-        correlation = sgn.correlate(
-            impulse_response.time[ch],
-            np.pad(ir_minphase, (0, n_samples - (n_samples + 1)//2)),
-            mode='full')
-        lags = np.arange(-n_samples + 1, n_samples)
-
-        # calculate the analytic signal of the correlation function
-        correlation_analytic = sgn.hilbert(correlation)
-
-        # find the maximum of the analytic part of the correlation function
-        # and define the search range around the maximum
-        argmax = np.argmax(np.abs(correlation_analytic))
-        search_region_range = np.arange(argmax-n, argmax+n)
-        search_region = np.imag(correlation_analytic[search_region_range])
-
-        # mask values with a negative gradient
-        mask = np.gradient(search_region, search_region_range) > 0
-
-        # fit a polygon and estimate its roots
-        search_region_poly = np.polyfit(
-            search_region_range[mask]-argmax, search_region[mask], N)
-        roots = np.roots(search_region_poly)
-
-        # Use only real-valued roots
-        if np.all(np.isreal(roots)):
-            root = roots[np.abs(roots) == np.min(np.abs(roots))]
-            start_sample = lags[argmax] + root
-        else:
-            start_sample = np.nan
-            warnings.warn(f"Starting sample not found for channel {ch}")
 
-        start_samples[ch] = start_sample
+def _find_impulse_response_delay(time, N):
+    """
+    Find the delay of impulse responses given as a two-dimensional array of
+    shape (n_channels, n_samples).
+
+    See :py:func:`~find_impulse_response_delay` for more information. The
+    delay is NaN for channels without real-valued roots.
+    """
+    n = int(np.ceil((N+2)/2))
+    n_samples = time.shape[-1]
+
+    # Calculate the correlation between the impulse responses and their
+    # minimum phase equivalents. This requires a minimum phase equivalent
+    # in the strict sense, instead of the appriximation implemented in
+    # pyfar.
+    ir_minphase = _minimum_phase_homomorphic(time, n_fft=4*n_samples)
+    ir_minphase = np.pad(
+        ir_minphase, ((0, 0), (0, n_samples - (n_samples + 1)//2)))
+    n_correlation = 2 * n_samples - 1
+    n_fft = sfft.next_fast_len(n_correlation, real=True)
+    correlation = fft._transform('irfft', fft._transform(
+        'rfft', time, n_fft) * fft._transform(
+            'rfft', ir_minphase[:, ::-1], n_fft), n_fft)[:, :n_correlation]
+    lags = np.arange(-n_samples + 1, n_samples)
+
+    # calculate the analytic signal of the correlation functions
+    correlation_analytic = _analytic_signal(correlation)
+
+    # find the maximum of the analytic part of the correlation functions
+    # and define the search ranges around the maxima
+    argmax = np.argmax(np.abs(correlation_analytic), axis=-1)
+    search_region_range = np.arange(-n, n)
+    search_region = np.imag(np.take_along_axis(
+        correlation_analytic,
+        argmax[:, np.newaxis] + search_region_range, axis=-1))
+
+    # mask values with a negative gradient
+    mask = np.gradient(search_region, search_region_range, axis=-1) > 0
+
+    # fit polygons to all channels by least squares, masked values are
+    # excluded by weighting them with zero. The columns are scaled and the
+    # singular values are truncated as in numpy.polyfit
+    vander = np.vander(search_region_range, N + 1) * mask[..., np.newaxis]
+    scale = np.sqrt(np.sum(vander**2, axis=-2, keepdims=True))
+    scale[scale == 0] = 1
+    rcond = np.sum(mask, axis=-1) * np.finfo(float).eps
+    search_region_poly = (np.linalg.pinv(vander / scale, rcond) @ np.where(
+        mask, search_region, 0)[..., np.newaxis])[..., 0] / scale[:, 0]
+
+    # estimate the roots as the eigenvalues of the companion matrices
+    # (this is what numpy.roots does for a single polygon)
+    companion = np.zeros((time.shape[0], N, N))
+    companion[:, 0] = -search_region_poly[:, 1:] / search_region_poly[:, :1]
+    companion[:, 1:, :-1] = np.eye(N - 1)
+    roots = np.linalg.eigvals(companion)
+
+    # Use only real-valued roots
+    root = np.take_along_axis(
+        roots, np.argmin(np.abs(roots), axis=-1)[:, np.newaxis], axis=-1)
+    start_samples = lags[argmax] + np.real(root[:, 0])
+    start_samples[~np.all(np.isreal(roots), axis=-1)] = np.nan
 
     return start_samples
 
 
+def _minimum_phase_homomorphic(time, n_fft):
+    """
+    Minimum phase equivalents of filters with the homomorphic method.
+
+    This computes ``scipy.signal.minimum_phase(h, 'homomorphic', n_fft)``
+    for all filters `h` of the two-dimensional array `time` at once.
+    """
+    n_samples = time.shape[-1]
+
+    # zero-pad; calculate the DFT
+    h_temp = np.abs(fft._transform('fft', time, n_fft))
+    # take 0.25*log(|H|**2) = 0.5*log(|H|) and don't let the log blow up
+    h_min = np.min(np.where(h_temp > 0, h_temp, np.inf), axis=-1)
+    h_temp += 1e-7 * h_min[:, np.newaxis]
+    h_temp = .5 * np.log(h_temp)
+    # IDFT
+    h_temp = fft._transform('ifft', h_temp, n_fft).real
+    # multiply pointwise by the homomorphic filter
+    # lmin[n] = 2u[n] - d[n]
+    win = np.zeros(n_fft)
+    win[0] = 1
+    stop = (n_samples + 1) // 2
+    win[1:stop] = 2
+    if n_samples % 2:
+        win[stop] = 1
+    h_temp *= win
+    h_temp = fft._transform(
+        'ifft', np.exp(fft._transform('fft', h_temp, n_fft)), n_fft)
+
+    return h_temp.real[:, :n_samples // 2 + n_samples % 2]
+
+
+def _analytic_signal(data):
+    """
+    Analytic signal along the last axis of `data`.
+
+    This is the same as ``scipy.signal.hilbert(data, axis=-1)`` but uses the
+    FFT options of pyfar.
+    """
+    n_fft = data.shape[-1]
+    hilbert = np.zeros(n_fft)
+    hilbert[0] = 1
+    if n_fft % 2:
+        hilbert[1:(n_fft + 1) // 2] = 2
+    else:
+        hilbert[n_fft // 2] = 1
+        hilbert[1:n_fft // 2] = 2
+    return fft._transform(
+        'ifft', fft._transform('fft', data, n_fft) * hilbert, n_fft)
+
+
 def find_impulse_response_start(
         impulse_response,
         threshold=20):
@@ -1380,25 +1500,25 @@ def find_impulse_response_start(
             "The SNR seems lower than the specified threshold value. Check "
             "if this is a valid impulse response with sufficient SNR.")
 
-    start_sample = max_sample.copy()
-
-    for ch in np.ndindex(impulse_response.cshape):
-        # Only look for the start sample if the maximum index is bigger than 0
-        if start_sample[ch] > 0:
-            # Check samples before maximum
-            ir_before_max = np.squeeze(
-                ir_squared[ch][:max_sample[ch]+1] / max_value[ch])
-            # First sample above or at the threshold level
-            idx_first_above_thresh = np.where(
-                ir_before_max >= 10**(-threshold/10))[0]
-            if idx_first_above_thresh.size > 0:
-                # The start sample is the last sample below the threshold
-                start_sample[ch] = np.min(idx_first_above_thresh) - 1
-            else:
-                start_sample[ch] = 0
-                warnings.warn(
-                    f'No values below threshold found found for channel {ch}',
-                    'defaulting to 0')
+    # Check samples before and at the maximum of all channels at once
+    samples = np.arange(impulse_response.n_samples)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        above_thresh = \
+            ir_squared / max_value[..., np.newaxis] >= 10**(-threshold/10)
+    above_thresh &= samples <= max_sample[..., np.newaxis]
+    found = np.any(above_thresh, axis=-1)
+
+    # The start sample is the last sample below the threshold. Only look for
+    # the start sample if the maximum index is bigger than 0
+    start_sample = np.where(
+        max_sample > 0,
+        np.where(found, np.argmax(above_thresh, axis=-1) - 1, 0),
+        max_sample)
+
+    for ch in np.argwhere((max_sample > 0) & ~found):
+        warnings.warn(
+            'No values below threshold found found for channel '
+            f'{tuple(ch.tolist())}, defaulting to 0')
 
     return np.squeeze(start_sample)
 
@@ -1610,12 +1730,14 @@ def convolve(signal1, signal2, mode='full', method='overlap_add'):
             "'full', 'cut' or 'cyclic'.")
 
     if method == 'overlap_add':
-        res = sgn.oaconvolve(signal1.time, signal2.time, mode='full', axes=-1)
+        convolve = sgn.oaconvolve
     elif method == 'fft':
-        res = sgn.fftconvolve(signal1.time, signal2.time, mode='full', axes=-1)
+        convolve = sgn.fftconvolve
     else:
         raise ValueError(
             f"Invalid method {method}, needs to be 'overlap_add' or 'fft'.")
+    with fft._scipy_options():
+        res = convolve(signal1.time, signal2.time, mode='full', axes=-1)
 
     if mode == 'cut':
         res = res[..., :np.max((signal1.n_samples, signal2.n_samples))]
@@ -1629,6 +1751,591 @@ def convolve(signal1, signal2, mode='full', method='overlap_add'):
         res, signal1.sampling_rate, domain='time', fft_norm=fft_norm)
 
 
+class Convolver():
+    """
+    Block-wise convolution with a filter using uniformly partitioned
+    overlap-save.
+
+    The filter is split into partitions of `block_size` samples, whose spectra
+    are computed once upon initialization. Blocks of an input signal are then
+    convolved with the filter by calling the convolver. The state, i.e., the
+    spectra of the previous input blocks, is kept between calls. This makes it
+    possible to convolve long signals with long filters, e.g., room impulse
+    responses, without having the entire input signal in memory. The
+    concatenated output blocks equal the first samples of the result of
+    :py:func:`convolve` using ``mode='full'``.
+
+    Parameters
+    ----------
+    filter : Signal
+        The filter, e.g., an impulse response. The channel shape of the filter
+        and the input blocks must be broadcastable.
+    block_size : int
+        The number of samples of the input and output blocks. Small block sizes
+        reduce the latency but increase the computational effort.
+
+    Returns
+    -------
+    convolver : :py:class:`Convolver`
+        The convolver can be called to convolve the next block of the input
+        signal. It returns the convolved block as a
+        :py:class:`~pyfar.classes.audio.Signal` and has the following
+        parameters
+
+        `signal` : Signal
+            The next block of the input signal. It must have `block_size`
+            samples. A shorter last block is zero-padded and the output is
+            truncated to the length of the input.
+
+    Examples
+    --------
+    Convolve a noise signal with a decaying noise in blocks of 256 samples
+
+    >>> import pyfar as pf
+    >>> import numpy as np
+    >>>
+    >>> rir = pf.signals.noise(4096, seed=1) * np.exp(-np.arange(4096) / 500)
+    >>> signal = pf.signals.noise(44100, seed=2)
+    >>>
+    >>> convolver = pf.dsp.Convolver(rir, 256)
+    >>> blocks = [convolver(signal[..., n:n+256])
+    >>>           for n in range(0, signal.n_samples, 256)]
+    """
+
+    def __init__(self, filter, block_size):
+
+        if not isinstance(filter, pyfar.Signal):
+            raise ValueError("The filter must be a Signal object.")
+        if not isinstance(block_size, int) or block_size < 1:
+            raise ValueError("block_size must be a positive integer.")
+
+        self._sampling_rate = filter.sampling_rate
+        self._fft_norm = filter.fft_norm
+        self._block_size = block_size
+        self._filter_cshape = filter.cshape
+
+        # zero-pad the filter to an integer multiple of the block size and
+        # compute the spectra of the partitions. Each partition is zero-padded
+        # to twice the block size for the overlap-save.
+        n_partitions = int(np.ceil(filter.n_samples / block_size))
+        partitions = np.zeros(
+            (n_partitions, *filter.cshape, 2 * block_size))
+        time = filter.time
+        for pp in range(n_partitions):
+            partition = time[..., pp*block_size:(pp+1)*block_size]
+            partitions[pp, ..., :partition.shape[-1]] = partition
+        self._spectra = fft.rfft(
+            partitions, 2 * block_size, self._sampling_rate, 'none')
+
+        self.reset()
+
+    @property
+    def block_size(self):
+        """The number of samples of the input and output blocks."""
+        return self._block_size
+
+    @property
+    def n_partitions(self):
+        """The number of partitions of the filter."""
+        return self._spectra.shape[0]
+
+    @property
+    def sampling_rate(self):
+        """The sampling rate of the filter in Hz."""
+        return self._sampling_rate
+
+    def reset(self):
+        """Reset the state of the convolver.
+
+        This must be done before convolving a new input signal.
+        """
+        # input buffer holding the last two blocks
+        self._buffer = None
+        # frequency domain delay line holding the spectra of the last
+        # n_partitions input blocks
+        self._delay_line = None
+        # index of the most recent spectrum in the delay line
+        self._position = 0
+
+    def __call__(self, signal):
+        """Convolve the next block of the input signal."""
+
+        if not isinstance(signal, pyfar.Signal):
+            raise ValueError("The input must be a Signal object.")
+        if signal.sampling_rate != self.sampling_rate:
+            raise ValueError("The sampling rates do not match")
+        if signal.n_samples > self.block_size:
+            raise ValueError((
+                f"The input has {signal.n_samples} samples but must not be "
+                f"longer than the block size of {self.block_size}."))
+        fft_norm = pyfar.classes.audio._match_fft_norm(
+            signal.fft_norm, self._fft_norm)
+
+        # initialize the state upon the first block
+        if self._buffer is None:
+            try:
+                cshape = np.broadcast_shapes(
+                    signal.cshape, self._filter_cshape)
+            except ValueError:
+                raise ValueError(
+                    "The cshapes of the input and filter can not be "
+                    "broadcasted.")
+            # prepend dimensions to align the partitions of the filter and
+            # input for broadcasting
+            self._cshape = signal.cshape
+            self._buffer = np.zeros((*signal.cshape, 2 * self.block_size))
+            self._delay_line = np.zeros(
+                (self.n_partitions, *_expand_shape(signal.cshape, cshape),
+                 self.block_size + 1), dtype=complex)
+            self._filter_spectra = self._spectra.reshape(
+                (self.n_partitions,
+                 *_expand_shape(self._filter_cshape, cshape),
+                 self.block_size + 1))
+        elif signal.cshape != self._cshape:
+            raise ValueError((
+                f"The cshape of the input is {signal.cshape} but must be "
+                f"{self._cshape}. Call reset() before convolving a new "
+                "signal."))
+
+        # update the input buffer with the new block
+        n_samples = signal.n_samples
+        self._buffer[..., :self.block_size] = \
+            self._buffer[..., self.block_size:]
+        self._buffer[..., self.block_size:] = 0
+        self._buffer[..., self.block_size:self.block_size + n_samples] = \
+            signal.time
+
+        # write the spectrum of the buffer to the delay line
+        self._position = (self._position + 1) % self.n_partitions
+        self._delay_line[self._position] = fft.rfft(
+            self._buffer, 2 * self.block_size, self.sampling_rate, 'none')
+
+        # multiply and accumulate. partition p is applied to the spectrum
+        # of the input block that is p blocks old
+        order = (self._position - np.arange(self.n_partitions)) % \
+            self.n_partitions
+        spectrum = np.sum(
+            self._delay_line[order] * self._filter_spectra, axis=0)
+
+        # the second half of the circular convolution contains the aliasing
+        # free output
+        data = fft.irfft(
+            spectrum, 2 * self.block_size, self.sampling_rate, 'none')
+        data = data[..., self.block_size:self.block_size + n_samples]
+
+        return pyfar.Signal(data, self.sampling_rate, fft_norm=fft_norm)
+
+
+class STFT():
+    """
+    Short-time Fourier transform (STFT) and its inverse.
+
+    The STFT splits a signal into overlapping frames of `window_length`
+    samples that are `hop_size` samples apart, multiplies each frame with
+    the window, and computes its discrete Fourier transform. In contrast to
+    :py:func:`spectrogram`, the complex spectra are kept and signals of any
+    ``cshape`` are transformed at once. The inverse uses weighted overlap-add
+    (WOLA) with the same window for synthesis, which perfectly reconstructs
+    unmodified signals.
+
+    The window, the normalization of the overlap-add, and the frame layout
+    are computed once upon initialization. Whole signals are transformed
+    with :py:func:`~STFT.stft` and :py:func:`~STFT.istft`. Blocks of signals
+    of arbitrary length are transformed frame-by-frame with
+    :py:func:`~STFT.analyze` and :py:func:`~STFT.synthesize`, which keep the
+    required state between calls.
+
+    The signal is zero-padded by ``window_length - hop_size`` samples at the
+    beginning and at the end. This makes sure that each sample is contained
+    in the same number of frames. The spectra are not normalized, i.e., they
+    are the spectra of the windowed frames (see
+    :py:func:`~pyfar.dsp.fft.rfft`).
+
+    Parameters
+    ----------
+    window_length : int, optional
+        The length of the frames in samples. The default is ``1024``.
+    hop_size : int, optional
+        The distance between the beginnings of successive frames in samples.
+        Must be between ``1`` and `window_length`. The default is ``None``,
+        which uses ``window_length // 2``.
+    window : str, tuple, array like, optional
+        The window that is passed to ``scipy.signal.get_window`` or an array
+        of length `window_length`. The window must overlap-add to values
+        larger than zero for the inverse transform. The default is
+        ``'hann'``.
+    n_fft : int, optional
+        The length of the DFT. Frames are zero-padded if `n_fft` is larger
+        than `window_length`. The default is ``None``, which uses
+        `window_length`.
+    sampling_rate : number, optional
+        The sampling rate of the transformed signals in Hz. The default is
+        ``44100``.
+
+    Examples
+    --------
+    Transform a multichannel noise signal, remove the high frequencies, and
+    transform it back
+
+    >>> import pyfar as pf
+    >>> import numpy as np
+    >>>
+    >>> signal = pf.signals.noise(44100, rms=[1, 1], seed=1)
+    >>> stft = pf.dsp.STFT(1024, 256)
+    >>> spectra = stft.stft(signal)
+    >>> spectra[..., stft.frequencies > 4000, :] = 0
+    >>> lowpass = stft.istft(spectra, signal.n_samples)
+
+    Do the same in blocks of 512 samples
+
+    >>> blocks = []
+    >>> for n in range(0, signal.n_samples, 512):
+    ...     spectra = stft.analyze(signal[..., n:n+512])
+    ...     spectra[..., stft.frequencies > 4000, :] = 0
+    ...     blocks.append(stft.synthesize(spectra))
+    """
+
+    def __init__(self, window_length=1024, hop_size=None, window='hann',
+                 n_fft=None, sampling_rate=44100):
+
+        hop_size = window_length // 2 if hop_size is None else hop_size
+        n_fft = window_length if n_fft is None else n_fft
+
+        if not isinstance(window_length, int) or window_length < 1:
+            raise ValueError("window_length must be a positive integer.")
+        if not isinstance(hop_size, int) or not 0 < hop_size <= window_length:
+            raise ValueError(
+                "hop_size must be an integer between 1 and window_length.")
+        if not isinstance(n_fft, int) or n_fft < window_length:
+            raise ValueError(
+                "n_fft must be an integer not smaller than window_length.")
+
+        if isinstance(window, (str, tuple)):
+            window = sgn.get_window(window, window_length)
+        window = np.asarray(window, dtype=float)
+        if window.shape != (window_length, ):
+            raise ValueError(
+                f"The window must have {window_length} samples.")
+
+        self._window_length = window_length
+        self._hop_size = hop_size
+        self._n_fft = n_fft
+        self._sampling_rate = sampling_rate
+        self._window = window
+        self._window.flags.writeable = False
+
+        # number of hops per frame. Frames are zero-padded to n_hops *
+        # hop_size samples for the overlap-add
+        self._n_hops = int(np.ceil(window_length / hop_size))
+        self._padding = window_length - hop_size
+        # the inverse requires overlapping squared windows larger than zero
+        self._invertible = all(
+            np.sum(window[hh::hop_size]**2) > np.finfo(float).eps
+            for hh in range(hop_size))
+
+        self.reset()
+
+    @property
+    def window_length(self):
+        """The length of the frames in samples."""
+        return self._window_length
+
+    @property
+    def hop_size(self):
+        """The distance between successive frames in samples."""
+        return self._hop_size
+
+    @property
+    def n_fft(self):
+        """The length of the DFT."""
+        return self._n_fft
+
+    @property
+    def n_bins(self):
+        """The number of frequency bins of the spectra."""
+        return self._n_fft // 2 + 1
+
+    @property
+    def window(self):
+        """The analysis and synthesis window."""
+        return self._window
+
+    @property
+    def sampling_rate(self):
+        """The sampling rate in Hz."""
+        return self._sampling_rate
+
+    @property
+    def frequencies(self):
+        """The frequencies of the spectra in Hz."""
+        return fft.rfftfreq(self.n_fft, self.sampling_rate)
+
+    def times(self, n_frames):
+        """
+        Get the times of the frames.
+
+        Parameters
+        ----------
+        n_frames : int
+            The number of frames.
+
+        Returns
+        -------
+        times : numpy array
+            The time of the center of each frame in seconds relative to the
+            first sample of the signal. The first frames have negative
+            times due to the zero-padding at the beginning of the signal.
+        """
+        return (np.arange(n_frames) * self.hop_size - self._padding
+                + self.window_length / 2) / self.sampling_rate
+
+    def reset(self):
+        """Reset the state of the frame-by-frame processing.
+
+        This must be done before processing a new signal with
+        :py:func:`~STFT.analyze` and :py:func:`~STFT.synthesize`.
+        """
+        # samples that were not yet analyzed, starting with the zero-padding
+        self._input = None
+        # overlap-add tails of the signal and squared window
+        self._output = None
+        self._output_norm = None
+        # number of synthesized samples that belong to the zero-padding
+        self._discard = self._padding
+
+    def stft(self, signal):
+        """
+        Compute the STFT of a signal.
+
+        Parameters
+        ----------
+        signal : Signal
+            The signal to be transformed.
+
+        Returns
+        -------
+        spectra : numpy array
+            The complex spectra of shape ``(*signal.cshape, n_bins,
+            n_frames)``. The number of frames is
+            ``(window_length - hop_size + signal.n_samples - 1) // hop_size
+            + 1``.
+        """
+        self._check_signal(signal)
+        n_frames = (self._padding + signal.n_samples - 1) // self.hop_size + 1
+        n_end = (n_frames - 1) * self.hop_size + self.window_length - \
+            self._padding - signal.n_samples
+        time = np.pad(signal.time, [(0, 0)] * len(signal.cshape) +
+                      [(self._padding, n_end)])
+        spectra, _ = self._analyze(time)
+        return spectra
+
+    def istft(self, spectra, n_samples=None):
+        """
+        Compute the inverse STFT.
+
+        Parameters
+        ----------
+        spectra : array like
+            The complex spectra of shape ``(..., n_bins, n_frames)``, e.g.,
+            as returned by :py:func:`~STFT.stft`.
+        n_samples : int, optional
+            The number of samples of the output signal. Pass the number of
+            samples of the transformed signal to remove the zero-padding at
+            the end. The default is ``None``, which returns all samples.
+
+        Returns
+        -------
+        signal : Signal
+            The signal obtained from the spectra by weighted overlap-add.
+        """
+        spectra = self._check_spectra(spectra)
+        time, norm = self._frames_to_time(spectra)
+        cshape = time.shape[:-2]
+
+        zeros = np.zeros(cshape + (self._padding_ola, ))
+        data, tail, norm, norm_tail = self._overlap_add(
+            time, norm, zeros, np.zeros(self._padding_ola))
+        data = np.concatenate((data, tail), axis=-1)
+        norm = np.concatenate((norm, norm_tail))
+
+        # remove zero-padding at the beginning and end
+        data = self._normalize(data, norm)[..., self._padding:]
+        if n_samples is not None:
+            data = data[..., :n_samples]
+
+        return pyfar.Signal(data, self.sampling_rate)
+
+    def analyze(self, signal):
+        """
+        Compute the spectra of the next block of a signal.
+
+        Parameters
+        ----------
+        signal : Signal
+            The next block of the signal. The blocks can have any number of
+            samples.
+
+        Returns
+        -------
+        spectra : numpy array
+            The spectra of all frames that were completed by the block
+            of shape ``(*signal.cshape, n_bins, n_frames)``. The spectra
+            equal those returned by :py:func:`~STFT.stft` for the
+            concatenated blocks. `n_frames` is zero if no frame was completed.
+        """
+        self._check_signal(signal)
+        if self._input is None:
+            self._input = np.zeros(signal.cshape + (self._padding, ))
+        elif signal.cshape != self._input.shape[:-1]:
+            raise ValueError((
+                f"The cshape of the input is {signal.cshape} but must be "
+                f"{self._input.shape[:-1]}. Call reset() before processing "
+                "a new signal."))
+
+        spectra, self._input = self._analyze(
+            np.concatenate((self._input, signal.time), axis=-1))
+        return spectra
+
+    def synthesize(self, spectra):
+        """
+        Synthesize the next block of a signal from spectra.
+
+        Parameters
+        ----------
+        spectra : array like
+            The spectra of the next frames of shape ``(..., n_bins,
+            n_frames)``, e.g., as returned by :py:func:`~STFT.analyze`.
+
+        Returns
+        -------
+        signal : Signal
+            The next block of the signal with ``n_frames * hop_size``
+            samples. The block is shorter for the first frames because the
+            samples that belong to the zero-padding at the beginning are
+            removed. The concatenated blocks equal the signal returned by
+            :py:func:`~STFT.istft` except for the last samples, which are
+            not complete until further frames are synthesized.
+        """
+        spectra = self._check_spectra(spectra)
+        time, norm = self._frames_to_time(spectra)
+        cshape = time.shape[:-2]
+
+        if self._output is None:
+            self._output = np.zeros(cshape + (self._padding_ola, ))
+            self._output_norm = np.zeros(self._padding_ola)
+        elif cshape != self._output.shape[:-1]:
+            raise ValueError((
+                f"The cshape of the spectra is {cshape} but must be "
+                f"{self._output.shape[:-1]}. Call reset() before processing "
+                "a new signal."))
+
+        data, self._output, norm, self._output_norm = self._overlap_add(
+            time, norm, self._output, self._output_norm)
+        data = self._normalize(data, norm)
+
+        # remove zero-padding at the beginning
+        discard = min(self._discard, data.shape[-1])
+        self._discard -= discard
+
+        return pyfar.Signal(data[..., discard:], self.sampling_rate)
+
+    @property
+    def _padding_ola(self):
+        """Number of samples in the overlap-add tail."""
+        return (self._n_hops - 1) * self.hop_size
+
+    def _check_signal(self, signal):
+        """Check the input signal."""
+        if not isinstance(signal, pyfar.Signal):
+            raise ValueError("The input must be a Signal object.")
+        if signal.sampling_rate != self.sampling_rate:
+            raise ValueError("The sampling rates do not match")
+
+    def _check_spectra(self, spectra):
+        """Check the input spectra."""
+        spectra = np.asarray(spectra)
+        if spectra.ndim < 2 or spectra.shape[-2] != self.n_bins:
+            raise ValueError((
+                "The spectra must be of shape (..., n_bins, n_frames) with "
+                f"n_bins={self.n_bins}."))
+        return spectra
+
+    def _analyze(self, time):
+        """
+        Compute the spectra of all complete frames of `time` and return them
+        together with the samples that are required for the next frame.
+        """
+        if time.shape[-1] < self.window_length:
+            return np.zeros(time.shape[:-1] + (self.n_bins, 0), complex), time
+
+        frames = np.lib.stride_tricks.sliding_window_view(
+            time, self.window_length, axis=-1)[..., ::self.hop_size, :]
+        spectra = fft.rfft(
+            frames * self.window, self.n_fft, self.sampling_rate, 'none')
+        n_frames = spectra.shape[-2]
+
+        return np.swapaxes(spectra, -1, -2), \
+            time[..., n_frames * self.hop_size:]
+
+    def _frames_to_time(self, spectra):
+        """
+        Get the windowed frames and squared windows of shape
+        ``(..., n_frames, n_hops * hop_size)`` for the overlap-add.
+        """
+        time = fft.irfft(np.swapaxes(spectra, -1, -2), self.n_fft,
+                         self.sampling_rate, 'none')
+        time = time[..., :self.window_length] * self.window
+
+        n_pad = self._n_hops * self.hop_size - self.window_length
+        time = np.pad(time, [(0, 0)] * (time.ndim - 1) + [(0, n_pad)])
+        norm = np.tile(np.pad(self.window**2, (0, n_pad)),
+                       (spectra.shape[-1], 1))
+
+        return time, norm
+
+    def _overlap_add(self, time, norm, tail, norm_tail):
+        """
+        Overlap-add the frames of the signal and squared window to the tails
+        of the previous frames. Returns the completed samples and the new
+        tails.
+        """
+        n_frames = time.shape[-2]
+        hop = self.hop_size
+        n_out = (n_frames + self._n_hops - 1) * hop
+
+        data = np.zeros(time.shape[:-2] + (n_out, ))
+        data[..., :tail.shape[-1]] = tail
+        norm_out = np.zeros(n_out)
+        norm_out[:norm_tail.shape[-1]] = norm_tail
+
+        # add the frames hop by hop. Each hop of a frame is added to all
+        # frames at once
+        for hh in range(self._n_hops):
+            segment = slice(hh * hop, (hh + n_frames) * hop)
+            frames = slice(hh * hop, (hh + 1) * hop)
+            data[..., segment] += time[..., frames].reshape(
+                time.shape[:-2] + (n_frames * hop, ))
+            norm_out[segment] += norm[..., frames].flatten()
+
+        return (data[..., :n_frames * hop], data[..., n_frames * hop:],
+                norm_out[:n_frames * hop], norm_out[n_frames * hop:])
+
+    def _normalize(self, data, norm):
+        """Normalize the overlap-added signal by the squared windows."""
+        if not self._invertible:
+            raise ValueError((
+                "The window does not overlap-add to values larger than zero "
+                "and can not be inverted. Use a smaller hop_size."))
+        # the squared windows are only zero in the zero-padding
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(norm > 0, data / norm, 0)
+
+
+def _expand_shape(shape, target_shape):
+    """Prepend dimensions of size one to shape to match len(target_shape)."""
+    return (1, ) * (len(target_shape) - len(shape)) + tuple(shape)
+
+
 def decibel(signal, domain='freq', log_prefix=None, log_reference=1,
             return_prefix=False):
     r"""Convert data of the selected signal domain into decibels (dB).
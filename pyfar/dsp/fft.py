@@ -1,13 +1,272 @@
 """
 The following documents the FFT functionality. More details and background is
 given in the :py:mod:`FFT concepts <pyfar._concepts.fft>`.
+
+All Fourier transforms in pyfar are computed with the FFT backend and number
+of workers that are selected by :py:func:`~pyfar.dsp.fft.set_options` or
+temporarily by :py:func:`~pyfar.dsp.fft.options`.
 """
+import contextlib
+import contextvars
+import inspect
 import multiprocessing
 
 import numpy as np
 from scipy import fft
 
 
+class _NumpyBackend():
+    """
+    Wrap numpy.fft to match the interface of scipy.fft. numpy does not
+    support multiple workers.
+    """
+    @staticmethod
+    def fft(x, n=None, axis=-1, workers=None):
+        return np.fft.fft(x, n=n, axis=axis)
+
+    @staticmethod
+    def ifft(x, n=None, axis=-1, workers=None):
+        return np.fft.ifft(x, n=n, axis=axis)
+
+    @staticmethod
+    def rfft(x, n=None, axis=-1, workers=None):
+        return np.fft.rfft(x, n=n, axis=axis)
+
+    @staticmethod
+    def irfft(x, n=None, axis=-1, workers=None):
+        return np.fft.irfft(x, n=n, axis=axis)
+
+
+# available backends
+_backends = {
+    'scipy': fft,
+    'numpy': _NumpyBackend,
+}
+
+# options that are used globally
+_global_options = {
+    'backend': 'scipy',
+    'workers': -1,
+}
+
+# options that are used inside the context manager `options`
+_context_options = contextvars.ContextVar('pyfar_fft_options', default=None)
+
+
+def register_backend(name, backend):
+    """
+    Register an FFT backend.
+
+    Parameters
+    ----------
+    name : str
+        The name of the backend. This is used to select the backend with
+        :py:func:`~pyfar.dsp.fft.set_options` and
+        :py:func:`~pyfar.dsp.fft.options`.
+    backend : module, object
+        The backend must provide the functions ``fft``, ``ifft``, ``rfft``,
+        and ``irfft`` with the same signature as in ``scipy.fft``, i.e.,
+        ``rfft(x, n=None, axis=-1, workers=None)``. For example,
+        ``pyfftw.interfaces.scipy_fft`` can be registered. Caching of FFT
+        plans is done by the backend. ``scipy.fft`` and ``numpy.fft`` keep
+        plans for recently used FFT lengths. Other backends might require
+        enabling a cache, e.g., ``pyfftw.interfaces.cache.enable()``.
+
+    Examples
+    --------
+    Register and use pyFFTW (if installed)
+
+    >>> import pyfar as pf
+    >>> import pyfftw
+    >>> pf.dsp.fft.register_backend(
+    >>>     'pyfftw', pyfftw.interfaces.scipy_fft)
+    >>> pf.dsp.fft.set_options(backend='pyfftw')
+    """
+    if not isinstance(name, str):
+        raise TypeError("The name of the backend must be a string.")
+    for function in ['fft', 'ifft', 'rfft', 'irfft']:
+        if not callable(getattr(backend, function, None)):
+            raise ValueError(
+                f"The backend must have a function '{function}'.")
+    _backends[name] = backend
+
+
+def get_options():
+    """
+    Get the currently used FFT options.
+
+    Returns
+    -------
+    options : dict
+        Dictionary with the keys ``'backend'`` and ``'workers'``. See
+        :py:func:`~pyfar.dsp.fft.set_options`.
+    """
+    options = _context_options.get()
+    return (_global_options if options is None else options).copy()
+
+
+def set_options(backend=None, workers=None):
+    """
+    Set the FFT options globally.
+
+    Parameters
+    ----------
+    backend : str, optional
+        The name of the FFT backend. ``'scipy'`` uses ``scipy.fft`` and
+        ``'numpy'`` uses ``numpy.fft``. Additional backends can be added with
+        :py:func:`~pyfar.dsp.fft.register_backend`. ``None`` does not change
+        the current backend. The default backend is ``'scipy'``.
+    workers : int, optional
+        The maximum number of workers that are used to compute FFTs of
+        multi-channel data in parallel. ``-1`` uses all available CPU cores.
+        A single worker is advisable if pyfar is used inside a process or
+        thread pool. ``numpy`` ignores this option. ``None`` does not change
+        the current value. The default number of workers is ``-1``.
+
+    Examples
+    --------
+    Use a single worker, e.g., when running pyfar in a process pool
+
+    >>> import pyfar as pf
+    >>> pf.dsp.fft.set_options(workers=1)
+    """
+    _global_options.update(_check_options(backend, workers))
+
+
+@contextlib.contextmanager
+def options(backend=None, workers=None):
+    """
+    Context manager for using FFT options temporarily.
+
+    The options apply only to the current thread and are restored after the
+    context is left.
+
+    Parameters
+    ----------
+    backend : str, optional
+        The name of the FFT backend. See
+        :py:func:`~pyfar.dsp.fft.set_options`. ``None`` uses the current
+        backend.
+    workers : int, optional
+        The maximum number of workers. See
+        :py:func:`~pyfar.dsp.fft.set_options`. ``None`` uses the current
+        number of workers.
+
+    Examples
+    --------
+    Compute the spectrum of a signal using numpy
+
+    >>> import pyfar as pf
+    >>> signal = pf.signals.noise(1024)
+    >>> with pf.dsp.fft.options(backend='numpy'):
+    >>>     signal.freq
+    """
+    new_options = get_options()
+    new_options.update(_check_options(backend, workers))
+    token = _context_options.set(new_options)
+    try:
+        yield
+    finally:
+        _context_options.reset(token)
+
+
+def _check_options(backend, workers):
+    """Check FFT options and return a dictionary with those not None."""
+    options = {}
+    if backend is not None:
+        if backend not in _backends:
+            raise ValueError((
+                f"backend is '{backend}' but must be one of "
+                f"{', '.join(_backends)}"))
+        options['backend'] = backend
+    if workers is not None:
+        if not isinstance(workers, int) or (workers < 1 and workers != -1):
+            raise ValueError(
+                f"workers must be -1 or a positive integer but is {workers}")
+        options['workers'] = workers
+    return options
+
+
+def _transform(name, data, n, axis=-1):
+    """
+    Compute the transform `name` ('fft', 'ifft', 'rfft', 'irfft') of `data`
+    using the current FFT options.
+    """
+    options = get_options()
+    workers = options['workers']
+    if workers == -1:
+        workers = multiprocessing.cpu_count()
+    transform = getattr(_backends[options['backend']], name)
+    return transform(data, n=n, axis=axis, workers=workers)
+
+
+@contextlib.contextmanager
+def _scipy_options():
+    """
+    Context manager that applies the current FFT options to functions that
+    use ``scipy.fft`` internally, e.g., ``scipy.signal.fftconvolve``.
+
+    The number of workers is set with ``scipy.fft.set_workers``. Backends
+    other than ``scipy.fft`` are set with ``scipy.fft.set_backend``.
+    """
+    options = get_options()
+    workers = options['workers']
+    if workers == -1:
+        workers = multiprocessing.cpu_count()
+    backend = _backends[options['backend']]
+
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(fft.set_workers(workers))
+        if backend is not fft:
+            stack.enter_context(
+                fft.set_backend(_ScipyBackend(backend, workers)))
+        yield
+
+
+class _ScipyBackend():
+    """
+    Wrap an FFT backend to be used with ``scipy.fft.set_backend``.
+
+    One-dimensional transforms and multi-dimensional transforms along a single
+    axis are computed with the backend. Other transforms are computed by
+    ``scipy.fft``.
+    """
+    __ua_domain__ = "numpy.scipy.fft"
+
+    def __init__(self, backend, workers):
+        self._backend = backend
+        self._workers = workers
+
+    def __ua_function__(self, method, args, kwargs):
+        name = method.__name__
+        if name not in ['fft', 'ifft', 'rfft', 'irfft',
+                        'fftn', 'ifftn', 'rfftn', 'irfftn']:
+            return NotImplemented
+        params = inspect.signature(method).bind(*args, **kwargs).arguments
+
+        if params.get('norm') not in [None, 'backward'] \
+                or params.get('plan') is not None:
+            return NotImplemented
+        workers = params.get('workers')
+        workers = self._workers if workers is None else workers
+
+        if name.endswith('n'):
+            # multi-dimensional transforms along a single axis
+            axes = params.get('axes')
+            if axes is None or np.size(axes) != 1:
+                return NotImplemented
+            shape = params.get('s')
+            n = None if shape is None else np.ravel(shape)[0]
+            axis = np.ravel(axes)[0]
+            name = name[:-1]
+        else:
+            n = params.get('n')
+            axis = params.get('axis', -1)
+
+        return getattr(self._backend, name)(
+            params['x'], n=n, axis=axis, workers=workers)
+
+
 def rfftfreq(n_samples, sampling_rate):
     """
     Returns the positive discrete frequencies for which the FFT is calculated.
@@ -62,8 +321,7 @@ def rfft(data, n_samples, sampling_rate, fft_norm):
     """
 
     # DFT
-    spec = fft.rfft(
-        data, n=n_samples, axis=-1, workers=multiprocessing.cpu_count())
+    spec = _transform('rfft', data, n_samples)
     # Normalization
     spec = normalization(spec, n_samples, sampling_rate, fft_norm,
                          inverse=False, single_sided=True)
@@ -105,8 +363,7 @@ def irfft(spec, n_samples, sampling_rate, fft_norm):
     spec = normalization(spec, n_samples, sampling_rate, fft_norm,
                          inverse=True, single_sided=True)
     # Inverse DFT
-    data = fft.irfft(
-        spec, n=n_samples, axis=-1, workers=multiprocessing.cpu_count())
+    data = _transform('irfft', spec, n_samples)
 
     return data
 
@@ -233,7 +490,7 @@ def normalization(spec, n_samples, sampling_rate, fft_norm='none',
         # altoug the power spectrum does usually not have phase information,
         # i.e., spec = np.abs(spec)**2
         if not inverse:
-            spec *= np.abs(spec)
+            spec = spec * np.abs(spec)
     elif fft_norm == 'psd':
         if window is None:
             # Equation 6 in Ahrens et al. 2020
@@ -245,7 +502,7 @@ def normalization(spec, n_samples, sampling_rate, fft_norm='none',
         # altoug the power spectrum does usually not have phase information,
         # i.e., spec = np.abs(spec)**2
         if not inverse:
-            spec *= np.abs(spec)
+            spec = spec * np.abs(spec)
     elif fft_norm != 'unitary':
         raise ValueError(("norm type must be 'unitary', 'amplitude', 'rms', "
                           f"'power', or 'psd' but is '{fft_norm}'"))
@@ -254,7 +511,10 @@ def normalization(spec, n_samples, sampling_rate, fft_norm='none',
     if inverse:
         norm = 1 / norm
 
-    # apply normalization
+    # apply normalization without casting single precision data to double
+    # precision
+    if spec.dtype in [np.float32, np.complex64]:
+        norm = norm.astype(np.float32)
     spec = spec * norm
 
     # scaling for single sided spectrum, i.e., to account for the lost
@@ -26,6 +26,12 @@ from .gammatone import (
     erb_frequencies
 )
 
+from ._design_cache import (
+    design_cache_info,
+    clear_design_cache,
+    set_design_cache_size
+)
+
 
 __all__ = [
     'butterworth',
@@ -43,5 +49,8 @@ __all__ = [
     'reconstructing_fractional_octave_bands',
     'fractional_octave_frequencies',
     'GammatoneBands',
-    'erb_frequencies'
+    'erb_frequencies',
+    'design_cache_info',
+    'clear_design_cache',
+    'set_design_cache_size'
 ]
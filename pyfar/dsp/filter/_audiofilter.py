@@ -30,8 +30,6 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 
 """
-import matplotlib.pyplot as plt
-from matplotlib.patches import Circle
 import numpy as np
 from scipy import signal
 
@@ -838,6 +836,8 @@ def zplane_plot(ax, z, p, k):
     currently we don't use the ax input parameter, we rather just plot
     in hope for getting an appropriate place for it from the calling function
     """
+    import matplotlib.pyplot as plt
+    from matplotlib.patches import Circle
     # draw unit circle
     Nf = 2**7
     Om = np.arange(Nf) * 2*np.pi/Nf
@@ -885,6 +885,7 @@ def bode_plot(B, A, b, a, fs, N, fig=None):
     output:
     bode plot as new figure
     """
+    import matplotlib.pyplot as plt
     if fig is None:
         fig = plt.figure()
     z, p, k = signal.tf2zpk(b, a)
@@ -967,6 +968,7 @@ def bode_plot(B, A, b, a, fs, N, fig=None):
 
 def magnitude_plot_overlay(x, y, title, legend, fig=None):
     """Realize a bode plot containing magnitude for overlay."""
+    import matplotlib.pyplot as plt
     if fig is None:
         plt.figure()
     sz = y.shape
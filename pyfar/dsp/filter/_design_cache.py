@@ -0,0 +1,160 @@
+"""
+Size-bounded least recently used (LRU) cache for filter designs.
+
+Designs are keyed by the design function and its parameters. The cache
+stores the designed coefficients together with the warnings that were
+raised during the design. Warnings are raised again on every cache hit, so
+cached and uncached calls behave the same. Callers always get copies of
+the cached arrays.
+"""
+import functools
+import threading
+import warnings
+from collections import OrderedDict
+import numpy as np
+
+
+_cache = OrderedDict()
+_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0, 'maxsize': 128}
+
+
+def design_cache_info():
+    """
+    Get statistics of the filter design cache.
+
+    The cache is used by :py:func:`~butterworth`, :py:func:`~chebyshev1`,
+    :py:func:`~chebyshev2`, :py:func:`~elliptic`, :py:func:`~bessel`,
+    :py:func:`~crossover`, :py:func:`~fractional_octave_bands`,
+    :py:func:`~reconstructing_fractional_octave_bands`, and
+    :py:class:`~GammatoneBands`. Filters that are designed repeatedly with
+    the same parameters are computed only once.
+
+    Returns
+    -------
+    info : dict
+        Dictionary with the keys ``'hits'`` (number of designs taken from the
+        cache), ``'misses'`` (number of computed designs), ``'maxsize'``
+        (maximum number of cached designs), and ``'currsize'`` (current
+        number of cached designs).
+
+    Examples
+    --------
+    >>> import pyfar as pf
+    >>> pf.dsp.filter.clear_design_cache()
+    >>> for _ in range(3):
+    ...     pf.dsp.filter.fractional_octave_bands(
+    ...         None, 3, sampling_rate=44100)
+    >>> pf.dsp.filter.design_cache_info()
+    {'hits': 2, 'misses': 1, 'maxsize': 128, 'currsize': 1}
+    """
+    with _lock:
+        return {'hits': _stats['hits'], 'misses': _stats['misses'],
+                'maxsize': _stats['maxsize'], 'currsize': len(_cache)}
+
+
+def clear_design_cache():
+    """
+    Remove all designs from the filter design cache and reset its statistics.
+
+    See :py:func:`~design_cache_info` for more information.
+    """
+    with _lock:
+        _cache.clear()
+        _stats['hits'] = 0
+        _stats['misses'] = 0
+
+
+def set_design_cache_size(maxsize):
+    """
+    Set the maximum number of designs in the filter design cache.
+
+    If the cache holds more designs than allowed, the least recently used
+    designs are removed. See :py:func:`~design_cache_info` for more
+    information.
+
+    Parameters
+    ----------
+    maxsize : int
+        The maximum number of cached designs. ``0`` disables the cache. The
+        default size is ``128``.
+    """
+    if not isinstance(maxsize, int) or isinstance(maxsize, bool) \
+            or maxsize < 0:
+        raise ValueError("maxsize must be a non-negative integer")
+    with _lock:
+        _stats['maxsize'] = maxsize
+        while len(_cache) > maxsize:
+            _cache.popitem(last=False)
+
+
+def _cached_design(design):
+    """
+    Decorate a filter design function to use the design cache.
+
+    Calls with parameters that can not be hashed bypass the cache.
+    """
+    @functools.wraps(design)
+    def wrapper(*args, **kwargs):
+        try:
+            key = (design.__module__, design.__qualname__,
+                   _hashable(args), _hashable(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            return design(*args, **kwargs)
+
+        with _lock:
+            entry = _cache.get(key)
+            if entry is None:
+                _stats['misses'] += 1
+            else:
+                _stats['hits'] += 1
+                _cache.move_to_end(key)
+
+        if entry is None:
+            try:
+                with warnings.catch_warnings(record=True) as caught:
+                    warnings.simplefilter('always')
+                    result = design(*args, **kwargs)
+            except Exception:
+                _warn([w.message for w in caught])
+                raise
+            entry = (result, [w.message for w in caught])
+            with _lock:
+                if _stats['maxsize'] > 0:
+                    _cache[key] = entry
+                    while len(_cache) > _stats['maxsize']:
+                        _cache.popitem(last=False)
+
+        result, caught = entry
+        _warn(caught)
+        return _copy(result)
+
+    return wrapper
+
+
+def _warn(caught):
+    """Raise recorded warnings."""
+    for message in caught:
+        warnings.warn(message, stacklevel=3)
+
+
+def _hashable(value):
+    """Convert design parameters to a hashable cache key."""
+    if isinstance(value, np.ndarray):
+        return ('ndarray', value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_hashable(v) for v in value))
+    if isinstance(value, np.generic):
+        value = value.item()
+    # the type distinguishes parameters that compare equal, e.g., 1 and 1.0
+    return (type(value).__name__, value)
+
+
+def _copy(result):
+    """Copy cached designs to protect the cache from changes."""
+    if isinstance(result, np.ndarray):
+        return result.copy()
+    if isinstance(result, tuple):
+        return tuple(_copy(r) for r in result)
+    return result
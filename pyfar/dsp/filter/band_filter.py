@@ -1,6 +1,14 @@
 import numpy as np
 import scipy.signal as spsignal
 import pyfar as pf
+from ._design_cache import _cached_design
+
+
+_butter = _cached_design(spsignal.butter)
+_cheby1 = _cached_design(spsignal.cheby1)
+_cheby2 = _cached_design(spsignal.cheby2)
+_ellip = _cached_design(spsignal.ellip)
+_bessel = _cached_design(spsignal.bessel)
 
 
 def butterworth(signal, N, frequency, btype='lowpass', sampling_rate=None):
@@ -47,7 +55,7 @@ def butterworth(signal, N, frequency, btype='lowpass', sampling_rate=None):
     frequency_norm = np.asarray(frequency) / fs * 2
 
     # get filter coefficients
-    sos = spsignal.butter(N, frequency_norm, btype, analog=False, output='sos')
+    sos = _butter(N, frequency_norm, btype, analog=False, output='sos')
 
     # generate filter object
     filt = pf.FilterSOS(sos, fs)
@@ -111,8 +119,8 @@ def chebyshev1(signal, N, ripple, frequency, btype='lowpass',
     frequency_norm = np.asarray(frequency) / fs * 2
 
     # get filter coefficients
-    sos = spsignal.cheby1(N, ripple, frequency_norm, btype, analog=False,
-                          output='sos')
+    sos = _cheby1(N, ripple, frequency_norm, btype, analog=False,
+                  output='sos')
 
     # generate filter object
     filt = pf.FilterSOS(sos, fs)
@@ -178,8 +186,8 @@ def chebyshev2(signal, N, attenuation, frequency, btype='lowpass',
     frequency_norm = np.asarray(frequency) / fs * 2
 
     # get filter coefficients
-    sos = spsignal.cheby2(N, attenuation, frequency_norm, btype, analog=False,
-                          output='sos')
+    sos = _cheby2(N, attenuation, frequency_norm, btype, analog=False,
+                  output='sos')
 
     # generate filter object
     filt = pf.FilterSOS(sos, fs)
@@ -246,8 +254,8 @@ def elliptic(signal, N, ripple, attenuation, frequency, btype='lowpass',
     frequency_norm = np.asarray(frequency) / fs * 2
 
     # get filter coefficients
-    sos = spsignal.ellip(N, ripple, attenuation, frequency_norm, btype,
-                         analog=False, output='sos')
+    sos = _ellip(N, ripple, attenuation, frequency_norm, btype,
+                 analog=False, output='sos')
 
     # generate filter object
     filt = pf.FilterSOS(sos, fs)
@@ -332,8 +340,8 @@ def bessel(signal, N, frequency, btype='lowpass', norm='phase',
     frequency_norm = np.asarray(frequency) / fs * 2
 
     # get filter coefficients
-    sos = spsignal.bessel(N, frequency_norm, btype, analog=False,
-                          output='sos', norm=norm)
+    sos = _bessel(N, frequency_norm, btype, analog=False,
+                  output='sos', norm=norm)
 
     # generate filter object
     filt = pf.FilterSOS(sos, fs)
@@ -411,20 +419,20 @@ def crossover(signal, N, frequency, sampling_rate=None):
                   (freq.size + 1, SOS_dim_2, 1))
 
     # get filter coefficients for lowpass
-    sos = spsignal.butter(N, freq[0], 'lowpass', analog=False, output='sos')
+    sos = _butter(N, freq[0], 'lowpass', analog=False, output='sos')
     SOS[0, 0:n_sos] = sos
 
     # get filter coefficients for the bandpass if more than one frequency is
     # provided
     for n in range(1, freq.size):
-        sos_high = spsignal.butter(
+        sos_high = _butter(
             N, freq[n-1], 'highpass', analog=False, output='sos')
-        sos_low = spsignal.butter(
+        sos_low = _butter(
             N, freq[n], 'lowpass', analog=False, output='sos')
         SOS[n] = np.concatenate((sos_high, sos_low))
 
     # get filter coefficients for the highpass
-    sos = spsignal.butter(
+    sos = _butter(
         N, freq[-1], 'highpass', analog=False, output='sos')
     SOS[-1, 0:n_sos] = sos
 
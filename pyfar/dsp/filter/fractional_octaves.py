@@ -2,6 +2,7 @@ import warnings
 import numpy as np
 import scipy.signal as spsignal
 import pyfar as pf
+from ._design_cache import _cached_design
 
 
 def fractional_octave_frequencies(
@@ -252,6 +253,7 @@ def fractional_octave_bands(
         return signal_filt
 
 
+@_cached_design
 def _coefficients_fractional_octave_bands(
         sampling_rate, num_fractions,
         freq_range=(20.0, 20e3), order=14):
@@ -428,6 +430,44 @@ def reconstructing_fractional_octave_bands(
     sampling_rate = \
         signal.sampling_rate if sampling_rate is None else sampling_rate
 
+    time, frequencies = _coefficients_reconstructing_fractional_octave_bands(
+        num_fractions, frequency_range, overlap, slope, n_samples,
+        sampling_rate)
+
+    # create filter object
+    filt = pf.FilterFIR(time, sampling_rate)
+    filt.comment = (
+        "Reconstructing linear phase fractional octave filter bank."
+        f"(num_fractions={num_fractions}, frequency_range={frequency_range}, "
+        f"overlap={overlap}, slope={slope})")
+
+    if signal is None:
+        # return the filter object
+        return filt, frequencies
+    else:
+        # return the filtered signal
+        signal_filt = filt.process(signal)
+        return signal_filt, frequencies
+
+
+@_cached_design
+def _coefficients_reconstructing_fractional_octave_bands(
+        num_fractions, frequency_range, overlap, slope, n_samples,
+        sampling_rate):
+    """Calculate the FIR filter coefficients of the reconstructing
+    fractional octave filter bank.
+
+    See :py:func:`~reconstructing_fractional_octave_bands` for a description
+    of the parameters.
+
+    Returns
+    -------
+    time : array, float
+        FIR filter coefficients of shape (num_bands, n_samples).
+    frequencies : array, float
+        The center frequencies of the filters.
+    """
+
     # number of frequency bins
     n_bins = int(n_samples // 2 + 1)
 
@@ -495,17 +535,4 @@ def reconstructing_fractional_octave_bands(
     # window
     time *= spsignal.windows.hann(time.shape[-1])
 
-    # create filter object
-    filt = pf.FilterFIR(time, sampling_rate)
-    filt.comment = (
-        "Reconstructing linear phase fractional octave filter bank."
-        f"(num_fractions={num_fractions}, frequency_range={frequency_range}, "
-        f"overlap={overlap}, slope={slope})")
-
-    if signal is None:
-        # return the filter object
-        return filt, f_m[f_id]
-    else:
-        # return the filtered signal
-        signal_filt = filt.process(signal)
-        return signal_filt, f_m[f_id]
+    return time, f_m[f_id]
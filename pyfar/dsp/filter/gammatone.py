@@ -1,8 +1,11 @@
 import numpy as np
 import scipy.signal as sgn
 from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
 from deepdiff import DeepDiff
 import pyfar as pf
+from pyfar._utils import _check_workers
+from ._design_cache import _cached_design
 
 
 class GammatoneBands():
@@ -131,18 +134,14 @@ class GammatoneBands():
         self._delay = delay
         self._sampling_rate = sampling_rate
 
-        # compute center frequencies
-        self._frequencies = erb_frequencies(
-            freq_range, resolution, reference_frequency)
-        # compute filter coefficients
-        self._coefficients, self._normalizations = self._get_coefficients()
+        # compute center frequencies, filter coefficients, and the filter
+        # delays, phase factors, and gains (required for the re-synthesis)
+        (self._frequencies, self._coefficients, self._normalizations,
+         self._sos, self._delays, self._phase_factors, self._gains) = \
+            _gammatone_design(freq_range, resolution, reference_frequency,
+                              delay, sampling_rate)
         # initialize the internal filter state
         self._state = None
-        # compute the filter delay, phase factor, and gains
-        # (required for the re-synthesis)
-        self._delays, self._phase_factors = \
-            self._get_delays_and_phase_factors()
-        self._gains = self._get_gains()
 
     def __repr__(self):
         """Nice string representation of class instances"""
@@ -264,6 +263,27 @@ class GammatoneBands():
 
         return coefficients, normalizations
 
+    def _get_sos(self):
+        """
+        Compute the second order sections of all bands.
+
+        Each band is a cascade of four complex one-pole filters, whose
+        coefficients are written to four second order sections. This is
+        faster than calling ``sgn.lfilter`` four times in a row.
+
+        Returns
+        -------
+        sos : numpy array
+            The second order sections of shape ``(n_bands, 4, 6)``.
+        """
+        sos = np.zeros((self.n_bands, 4, 6), dtype=complex)
+        sos[..., 0] = 1
+        sos[..., 3] = 1
+        sos[..., 4] = -self._coefficients[:, None]
+        sos[:, 3, 0] = self._normalizations
+
+        return sos
+
     def _get_delays_and_phase_factors(self):
         """
         Section 4 in Hohmann 2002 describes how to derive these values. This
@@ -331,7 +351,7 @@ class GammatoneBands():
 
         return gains.flatten()
 
-    def process(self, signal, reset=True):
+    def process(self, signal, reset=True, workers=1, dtype='double'):
         """
         Filter an input signal.
 
@@ -353,6 +373,17 @@ class GammatoneBands():
             If true the internal state of the filter bank is reset before the
             filters are applied. Not resetting the state can be useful for
             blockwise processing. The default is ``True``.
+        workers : int, optional
+            The maximum number of threads that are used to filter the bands
+            in parallel. ``-1`` uses all available CPU cores. The default is
+            ``1``.
+        dtype : str, optional
+            The precision that is used for filtering. ``'double'`` filters
+            with complex128 data and ``'single'`` with complex64 data, which
+            is faster and requires less memory. Note that the state is
+            reset if the precision changes between blockwise calls. The
+            output signals have the same precision (see
+            :py:attr:`~pyfar.Signal.dtype`). The default is ``'double'``.
 
         Returns
         -------
@@ -381,15 +412,25 @@ class GammatoneBands():
             raise ValueError(("The sampling rates of the signal and Gammatone"
                               " filter bank do not match"))
 
+        if dtype not in ['double', 'single']:
+            raise ValueError(
+                f"dtype must be 'double' or 'single' but is '{dtype}'")
+        real_dtype, dtype = (np.float64, np.complex128) \
+            if dtype == 'double' else (np.float32, np.complex64)
+        workers = _check_workers(workers)
+
         # prepare multi-dimensional signals
-        time_in = signal.flatten().time
-        time_out = np.zeros((self.n_bands, ) + time_in.shape, dtype=complex)
+        time_in = signal.time.reshape((-1, signal.n_samples))
+        time_in = time_in.astype(real_dtype, copy=False)
+        time_out = np.zeros((self.n_bands, ) + time_in.shape, dtype=dtype)
+        sos = self._sos.astype(dtype)
 
         # reset or initialize the state as a list of as many zero arrays as
         # the filter bank has bands
-        if reset or self._state is None:
-            state = np.zeros((4, time_in.shape[0], 2), dtype=complex)
-            self._state = [state for _ in range(self.n_bands)]
+        if reset or self._state is None \
+                or self._state[0].dtype != dtype:
+            self._state = [np.zeros((4, time_in.shape[0], 2), dtype=dtype)
+                           for _ in range(self.n_bands)]
         elif len(self._state) != self.n_bands \
                 or self._state[0].shape != (4, time_in.shape[0], 2):
             raise ValueError((
@@ -398,17 +439,18 @@ class GammatoneBands():
                 "or with the signal that it was previously used with."
             ))
 
-        # apply the filter band by band
-        # using second order sections is faster than a manual call of
-        # sgn.lfilter four time in a row
-        for bb in range(self.n_bands):
-
-            sos_section = np.tile(np.atleast_2d(
-                [1, 0, 0, 1, -self._coefficients[bb], 0]),
-                (4, 1))
-            sos_section[3, 0] = self._normalizations[bb]
+        def process_band(bb):
             time_out[bb], self._state[bb] = sgn.sosfilt(
-                sos_section, time_in, axis=-1, zi=self._state[bb])
+                sos[bb], time_in, axis=-1, zi=self._state[bb])
+
+        # apply the filter band by band. scipy releases the GIL during
+        # filtering, which makes threads efficient here
+        if workers == 1:
+            for bb in range(self.n_bands):
+                process_band(bb)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(process_band, range(self.n_bands)))
 
         # restore original channel shape
         time_out = np.reshape(time_out,
@@ -419,10 +461,12 @@ class GammatoneBands():
             time_out = np.squeeze(time_out)
 
         # return real and immaginary part of output as pyfar Signal objects
-        real = signal.copy()
-        real.time = np.real(time_out)
-        imag = signal.copy()
-        imag.time = np.imag(time_out)
+        real = pf.Signal(np.real(time_out), signal.sampling_rate,
+                         fft_norm=signal.fft_norm, comment=signal.comment,
+                         dtype=real_dtype)
+        imag = pf.Signal(np.imag(time_out), signal.sampling_rate,
+                         fft_norm=signal.fft_norm, comment=signal.comment,
+                         dtype=real_dtype)
 
         return real, imag
 
@@ -502,6 +546,39 @@ class GammatoneBands():
         return obj
 
 
+@_cached_design
+def _gammatone_design(freq_range, resolution, reference_frequency, delay,
+                      sampling_rate):
+    """
+    Design a Gammatone filter bank.
+
+    See :py:class:`~GammatoneBands` for a description of the parameters.
+
+    Returns
+    -------
+    design : tuple
+        The center frequencies, coefficients, normalizations, second order
+        sections, delays, phase factors, and gains of the filter bank.
+    """
+    bank = GammatoneBands.__new__(GammatoneBands)
+    bank._freq_range = freq_range
+    bank._resolution = resolution
+    bank._reference_frequency = reference_frequency
+    bank._delay = delay
+    bank._sampling_rate = sampling_rate
+
+    bank._frequencies = erb_frequencies(
+        freq_range, resolution, reference_frequency)
+    bank._coefficients, bank._normalizations = bank._get_coefficients()
+    bank._sos = bank._get_sos()
+    bank._state = None
+    bank._delays, bank._phase_factors = bank._get_delays_and_phase_factors()
+    bank._gains = bank._get_gains()
+
+    return (bank._frequencies, bank._coefficients, bank._normalizations,
+            bank._sos, bank._delays, bank._phase_factors, bank._gains)
+
+
 def erb_frequencies(freq_range, resolution=1, reference_frequency=1000):
     """
     Get frequencies that are linearly spaced on the ERB frequency scale.
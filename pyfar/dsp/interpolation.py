@@ -1,45 +1,17 @@
 import numpy as np
 from scipy.special import iv as bessel_first_mod
 from scipy.interpolate import interp1d
+from scipy.sparse import coo_matrix
+from scipy.sparse.linalg import splu
 import scipy.signal as sgn
-import matplotlib.pyplot as plt
 import pyfar as pf
-from scipy.ndimage import generic_filter1d
+from functools import lru_cache
+from collections import OrderedDict
 from fractions import Fraction
 from decimal import Decimal
 import warnings
 
 
-def _weighted_moving_average(input, output, weights):
-    """Moving average filter of length N and arbitrary.
-
-    Parameters
-    ----------
-    input : numpy.ndarray
-        The input array
-    output : numpy.ndarray
-        The output buffer
-    N : int
-        Length of the filter
-    weights : numpy.ndarray
-        The weights used for averaging. The length of the weights also
-        specifies the length of the filter.
-
-    Note
-    ----
-    This function is primarily intended to be used in combination with
-    ``scipy.ndimage.generic_filter1d``. The input is strided instead of
-    reshaped, leaving the memory layout unchanged. The function does also not
-    return it's output but requires the output buffer as function input, which
-    is required by ``scipy.ndimage.generic_filter1d``.
-
-    """
-    strided = np.lib.stride_tricks.as_strided(
-        input, strides=input.strides*2,
-        shape=(weights.size, input.size - (weights.size-1)))
-    output[:] = np.average(strided, weights=weights, axis=0)
-
-
 def smooth_fractional_octave(signal, num_fractions, mode="magnitude_zerophase",
                              window="boxcar"):
     """
@@ -167,58 +139,20 @@ def smooth_fractional_octave(signal, num_fractions, mode="magnitude_zerophase",
         raise ValueError((f"mode is '{mode}' but must be 'magnitude_zerophase'"
                           ", 'magnitude_phase', 'magnitude', or 'complex'"))
 
-    # linearly and logarithmically spaced frequency bins ----------------------
-    N = signal.n_bins
-    n_lin = np.arange(N)
-    n_log = N**(n_lin/(N-1))
-
-    # frequency bin spacing in octaves: log2(n_log[n]/n_log[n-1])
-    # Note: n_log[0] = 1
-    delta_n = np.log2(n_log[1])
-
-    # width of the window in logarithmically spaced samples
-    # Note: Forcing the window to have an odd length increases the deviation
-    #       from the exact width, but makes sure that the delay introduced in
-    #       the convolution is integer and can be easily compensated
-    n_window = int(2 * np.floor(1 / (num_fractions * delta_n * 2)) + 1)
-
-    if n_window == 1:
-        raise ValueError((
-            "The smoothing width given by num_fractions is below the frequency"
-            " resolution of the signal. Increase the signal length or decrease"
-            " num_fractions"))
-
-    # generate the smoothing window
+    # get the smoothing operator --------------------------------------------
     if isinstance(window, str):
-        window = sgn.windows.get_window(window, n_window, fftbins=False)
+        operator = _fractional_octave_smoothing_operator(
+            signal.n_bins, num_fractions, window)
     elif isinstance(window, (list, np.ndarray)):
         # undocumented possibility for testing
-        window = np.asanyarray(window, dtype=float)
-        if window.shape != (n_window, ):
-            raise ValueError(
-                f"window.shape is {window.shape} but must be ({n_window}, )")
+        operator = _FractionalOctaveSmoothing(
+            signal.n_bins, num_fractions, np.asanyarray(window, dtype=float))
     else:
         raise ValueError(f"window is of type {str(type(window))} but must be "
                          "of type string")
 
-    for nn in range(len(data)):
-        # interpolate to logarithmically spaced frequencies
-        interpolator = interp1d(
-            n_lin + 1, data[nn], "cubic", copy=False, assume_sorted=True)
-        data[nn] = interpolator(n_log)
-
-        # apply a moving average filter based on the window function
-        data[nn] = generic_filter1d(
-            data[nn],
-            function=_weighted_moving_average,
-            filter_size=n_window,
-            mode='nearest',
-            extra_arguments=(window,))
-
-        # interpolate to original frequency axis
-        interpolator = interp1d(
-            n_log, data[nn], "cubic", copy=False, assume_sorted=True)
-        data[nn] = interpolator(n_lin + 1)
+    # smooth all channels and data components at once
+    data = operator(np.stack(data))
 
     # generate return signal --------------------------------------------------
     if mode == "magnitude_zerophase":
@@ -238,7 +172,157 @@ def smooth_fractional_octave(signal, num_fractions, mode="magnitude_zerophase",
     signal = signal.copy()
     signal.freq_raw = data
 
-    return signal, (n_window, 1 / (n_window * delta_n))
+    return signal, (operator.n_window, operator.num_fractions)
+
+
+@lru_cache(maxsize=32)
+def _fractional_octave_smoothing_operator(n_bins, num_fractions, window):
+    """
+    Get the smoothing operator for `smooth_fractional_octave`.
+
+    The operators are cached, because spectra with the same number of bins
+    are usually smoothed repeatedly.
+    """
+    return _FractionalOctaveSmoothing(n_bins, num_fractions, window)
+
+
+class _FractionalOctaveSmoothing():
+    """
+    Fractional octave smoothing of spectra with `n_bins` frequency bins.
+
+    The smoothing consists of three linear operations that are applied along
+    the last axis of the data (see `smooth_fractional_octave`):
+
+    1. Cubic spline interpolation from linearly to logarithmically spaced
+       frequency bins. The spline coefficients are obtained from the
+       collocation matrix, whose LU decomposition is computed once, and
+       evaluated with a sparse design matrix.
+    2. Weighted moving average with the smoothing window given as a sparse
+       banded matrix. The data is extended by repeating the first and last
+       values.
+    3. Cubic spline interpolation back to linearly spaced frequency bins.
+
+    This gives the same results as ``scipy.interpolate.interp1d`` with
+    ``kind='cubic'`` and ``scipy.ndimage.generic_filter1d`` but avoids
+    repeating the setup for each call and the Python callback for each
+    channel.
+
+    Parameters
+    ----------
+    n_bins : int
+        The number of frequency bins.
+    num_fractions : number
+        The width of the smoothing window in fractional octaves.
+    window : str, numpy array
+        The smoothing window as a string or array.
+    """
+
+    def __init__(self, n_bins, num_fractions, window):
+
+        # linearly and logarithmically spaced frequency bins ------------------
+        N = n_bins
+        n_lin = np.arange(N) + 1.
+        n_log = N**((n_lin - 1)/(N-1))
+
+        # frequency bin spacing in octaves: log2(n_log[n]/n_log[n-1])
+        # Note: n_log[0] = 1
+        delta_n = np.log2(n_log[1])
+
+        # width of the window in logarithmically spaced samples
+        # Note: Forcing the window to have an odd length increases the
+        #       deviation from the exact width, but makes sure that the delay
+        #       introduced in the convolution is integer and can be easily
+        #       compensated
+        n_window = int(2 * np.floor(1 / (num_fractions * delta_n * 2)) + 1)
+
+        if n_window == 1:
+            raise ValueError((
+                "The smoothing width given by num_fractions is below the "
+                "frequency resolution of the signal. Increase the signal "
+                "length or decrease num_fractions"))
+
+        # generate the smoothing window
+        if isinstance(window, str):
+            window = sgn.windows.get_window(window, n_window, fftbins=False)
+        elif window.shape != (n_window, ):
+            raise ValueError(
+                f"window.shape is {window.shape} but must be ({n_window}, )")
+
+        self.n_window = n_window
+        self.num_fractions = 1 / (n_window * delta_n)
+
+        # interpolation to logarithmically spaced bins and back
+        self._to_log = self._interpolation(n_lin, n_log)
+        self._to_lin = self._interpolation(n_log, n_lin)
+
+        # moving average with constant extension of the first and last values
+        # as a sparse banded matrix
+        offsets = np.arange(n_window) - n_window // 2
+        rows = np.repeat(np.arange(N), n_window)
+        cols = np.clip(rows + np.tile(offsets, N), 0, N - 1)
+        weights = np.tile(window / np.sum(window), N)
+        self._average = coo_matrix(
+            (weights, (rows, cols)), shape=(N, N)).tocsr()
+
+    @staticmethod
+    def _interpolation(x, x_new):
+        """
+        Cubic spline interpolation with not-a-knot boundary conditions from
+        `x` to `x_new` as a pair of a LU decomposition and design matrix.
+        """
+        knots = np.concatenate(([x[0]] * 4, x[2:-2], [x[-1]] * 4))
+        collocation = _bspline_design_matrix(x, knots)
+        design = _bspline_design_matrix(np.clip(x_new, x[0], x[-1]), knots)
+        return splu(collocation.tocsc()), design.tocsr()
+
+    def __call__(self, data):
+        """Smooth the data along the last axis."""
+        shape = data.shape
+        data = data.reshape(-1, shape[-1]).T
+
+        for step in [self._to_log, self._average, self._to_lin]:
+            if isinstance(step, tuple):
+                lu, design = step
+                data = design @ lu.solve(np.asfortranarray(data))
+            else:
+                data = step @ data
+
+        return data.T.reshape(shape)
+
+
+def _bspline_design_matrix(x, knots, k=3):
+    """
+    Sparse matrix with the values of the B-spline basis functions of degree
+    `k` at `x`.
+
+    This is the same as ``scipy.interpolate.BSpline.design_matrix``, which
+    requires scipy 1.8. The `k` + 1 non-zero basis functions at each `x` are
+    evaluated with the Cox-de Boor recursion. `x` must be within
+    ``knots[k]`` and ``knots[-k-1]``.
+    """
+    n_basis = len(knots) - k - 1
+    # index of the knot interval that contains x
+    interval = np.clip(
+        np.searchsorted(knots, x, side='right') - 1, k, n_basis - 1)
+
+    values = np.zeros((x.size, k + 1))
+    values[:, 0] = 1
+    left = np.zeros((x.size, k + 1))
+    right = np.zeros((x.size, k + 1))
+    for j in range(1, k + 1):
+        left[:, j] = x - knots[interval + 1 - j]
+        right[:, j] = knots[interval + j] - x
+        saved = np.zeros(x.size)
+        for r in range(j):
+            temp = values[:, r] / (right[:, r + 1] + left[:, j - r])
+            values[:, r] = saved + right[:, r + 1] * temp
+            saved = left[:, j - r] * temp
+        values[:, j] = saved
+
+    rows = np.repeat(np.arange(x.size), k + 1)
+    cols = (interval[:, np.newaxis] - k + np.arange(k + 1)).flatten()
+    return coo_matrix(
+        (values.flatten(), (rows, cols)), shape=(x.size, n_basis))
 
 
 def fractional_time_shift(signal, shift, unit="samples", order=30,
@@ -387,13 +471,11 @@ def fractional_time_shift(signal, shift, unit="samples", order=30,
     else:
         M_opt = np.round(delay_frac) - order / 2
 
-    # get matrix versions of the fractional shift and M_opt
-    delay_frac_matrix = np.tile(
-        delay_frac[..., np.newaxis],
-        tuple(np.ones(delay_frac.ndim, dtype="int")) + (order + 1, ))
-    M_opt_matrix = np.tile(
-        M_opt[..., np.newaxis],
-        tuple(np.ones(M_opt.ndim, dtype="int")) + (order + 1, ))
+    # get matrix versions of the fractional shift and M_opt to compute the
+    # filters of all channels at once
+    delay_frac_matrix = np.broadcast_to(
+        delay_frac[..., np.newaxis], delay_frac.shape + (order + 1, ))
+    M_opt_matrix = M_opt[..., np.newaxis]
 
     # discrete time vector
     n = np.arange(order + 1) + M_opt_matrix - delay_frac_matrix
@@ -438,7 +520,7 @@ def fractional_time_shift(signal, shift, unit="samples", order=30,
     # apply integer shift -----------------------------------------------------
     # account for shift from applying the fractional filter
     delay_int += M_opt.astype("int")
-    signal = pf.dsp.time_shift(signal, delay_int, mode)
+    signal = pf.dsp.time_shift(signal, delay_int, mode, inplace=True)
 
     # truncate signal (got padded during convolution with mode='full')
     if mode == "linear":
@@ -562,6 +644,45 @@ def resample(signal, sampling_rate, match_amplitude="auto", frac_limit=None,
     # calculate factor L for up- or downsampling
     sampling_rate_old = signal.sampling_rate
     L = sampling_rate / sampling_rate_old
+    # set gain depending on domain to match aplitude in
+    gain = _resampling_gain(signal, match_amplitude, L)
+    # check if one of the sampling rates is not divisible by 10
+    if sampling_rate % 10 or sampling_rate_old % 10:
+        warnings.warn((
+            'At least one sampling rate is not divisible by 10, , which can '
+            'cause a infinite loop in `scipy.resample_poly`. If this occurs, '
+            'interrupt and choose different sampling rates or decrease '
+            'frac_limit. However, this can cause an error in the target '
+            'sampling rate realisation.'))
+    # give the numerator and denomitor of the fraction for factor L
+    up, down = _resampling_factors(
+        sampling_rate_old, sampling_rate, frac_limit)
+    # resample data with scipy resampe_poly function using the cached
+    # anti-aliasing filter
+    if up == down:
+        data = signal.time.copy()
+    else:
+        data = sgn.resample_poly(
+            signal.time, up, down, axis=-1,
+            window=_resampling_filter(up, down).astype(signal.time.dtype))
+    data = pf.Signal(data * gain, sampling_rate, fft_norm=signal.fft_norm,
+                     comment=signal.comment)
+
+    if post_filter and L > 1:
+        # apply zero-phase filter
+        sos = _resampling_post_filter(sampling_rate_old, sampling_rate).copy()
+        time = sgn.sosfilt(sos, data.time, axis=-1)
+        time = sgn.sosfilt(sos, np.flip(time, axis=-1), axis=-1)
+        data.time = np.flip(time, axis=-1)
+
+    return data
+
+
+def _resampling_gain(signal, match_amplitude, L):
+    """
+    Get the gain that matches the amplitude of the resampled signal in the
+    time or frequency domain (see `resample`).
+    """
     # set match_amplitude domain depending on signal.signal_type
     if match_amplitude == "auto":
         match_amplitude = "freq" if signal.signal_type == "energy" else "time"
@@ -579,14 +700,15 @@ def resample(signal, sampling_rate, match_amplitude="auto", frac_limit=None,
     else:
         raise ValueError((f"match_amplitude is '{match_amplitude}' but must be"
                           " 'auto', 'time' or 'freq'"))
-    # check if one of the sampling rates is not divisible by 10
-    if sampling_rate % 10 or sampling_rate_old % 10:
-        warnings.warn((
-            'At least one sampling rate is not divisible by 10, , which can '
-            'cause a infinite loop in `scipy.resample_poly`. If this occurs, '
-            'interrupt and choose different sampling rates or decrease '
-            'frac_limit. However, this can cause an error in the target '
-            'sampling rate realisation.'))
+    return gain
+
+
+def _resampling_factors(sampling_rate_old, sampling_rate, frac_limit):
+    """
+    Approximate the resampling factor by a fraction `up/down` and warn if the
+    target sampling rate can not be realized exactly (see `resample`).
+    """
+    L = sampling_rate / sampling_rate_old
     # give the numerator and denomitor of the fraction for factor L
     if frac_limit is None:
         frac = Fraction(Decimal(L)).limit_denominator()
@@ -601,32 +723,271 @@ def resample(signal, sampling_rate, match_amplitude="auto", frac_limit=None,
             f'The error might be decreased by setting `frac_limit` to a value '
             f'larger than {down} (This warning is not shown, if the target '
             'sampling rate can exactly be realized).'))
-    # resample data with scipy resampe_poly function
-    data = sgn.resample_poly(signal.time, up, down, axis=-1)
-    data = pf.Signal(data * gain, sampling_rate, fft_norm=signal.fft_norm,
-                     comment=signal.comment)
+    return up, down
 
-    if post_filter and L > 1:
 
-        # Design elliptic filter
-        # (pass band is given by nyquist frequency of input signal, other
-        # parameters are freely chosen)
-        wp = sampling_rate_old / 2 / sampling_rate * 2
-        ws = min(1, 1.05 * wp)
-        gpass = .1
-        gstop = 60
+@lru_cache(maxsize=32)
+def _resampling_filter(up, down):
+    """
+    Design the linear phase anti-aliasing filter of
+    ``scipy.signal.resample_poly`` for the factors `up` and `down`.
+    """
+    max_rate = max(up, down)
+    # cutoff of FIR filter (rel. to Nyquist)
+    f_c = 1. / max_rate
+    # reasonable cutoff for sinc-like function
+    half_len = 10 * max_rate
+    h = sgn.firwin(2 * half_len + 1, f_c, window=('kaiser', 5.0))
+    h.flags.writeable = False
+    return h
+
+
+@lru_cache(maxsize=32)
+def _resampling_post_filter(sampling_rate_old, sampling_rate):
+    """
+    Design the elliptic filter that suppresses artifacts above the Nyquist
+    frequency of the input signal after up-sampling (see `resample`).
+    """
+    # Design elliptic filter
+    # (pass band is given by nyquist frequency of input signal, other
+    # parameters are freely chosen)
+    wp = sampling_rate_old / 2 / sampling_rate * 2
+    ws = min(1, 1.05 * wp)
+    gpass = .1
+    gstop = 60
 
-        # calculate the required order and -3 dB cut-off frequency
-        N, f_c = sgn.ellipord(wp, ws, gpass, gstop/2, fs=sampling_rate)
-        f_c *= sampling_rate / 2
+    # calculate the required order and -3 dB cut-off frequency
+    N, f_c = sgn.ellipord(wp, ws, gpass, gstop/2, fs=sampling_rate)
+    f_c *= sampling_rate / 2
 
-        # apply zero-phase filter
-        data = pf.dsp.filter.elliptic(data, N, gpass, gstop/2, f_c, 'lowpass')
-        data.time = np.flip(data.time, axis=-1)
-        data = pf.dsp.filter.elliptic(data, N, gpass, gstop/2, f_c, 'lowpass')
-        data.time = np.flip(data.time, axis=-1)
+    sos = pf.dsp.filter.elliptic(
+        None, N, gpass, gstop/2, f_c, 'lowpass', sampling_rate).coefficients[0]
+    sos.flags.writeable = False
+    return sos
 
-    return data
+
+class Resampler():
+    """
+    Block-wise polyphase resampling.
+
+    The resampling factor is approximated by a fraction `up/down` and the
+    signal is filtered with the same anti-aliasing filter as in
+    :py:func:`resample`. The filters are designed once upon initialization.
+    Blocks of the input signal are then resampled by calling the resampler.
+    The state, i.e., the input samples that are required for the next output
+    samples, is kept between calls. This makes it possible to resample long
+    signals without having the entire signal in memory.
+
+    The anti-aliasing filter is a linear phase FIR filter whose delay is
+    compensated. Output samples are thus returned with a latency of
+    ``10 * max(up, down) / up`` input samples, and the remaining samples are
+    returned by :py:func:`~flush` after the last block. The concatenated
+    output blocks equal the result of :py:func:`resample` if the optional
+    post filter is not used. The post filter is applied causally to the
+    blocks, i.e., it is not zero-phase. Use :py:func:`~resample` to resample
+    entire signals with a zero-phase post filter.
+
+    Parameters
+    ----------
+    sampling_rate_old : number
+        The sampling rate of the input signal in Hz.
+    sampling_rate : number
+        The new sampling rate in Hz.
+    match_amplitude : string, optional
+        Define the domain to match the amplitude of the resampled data. See
+        :py:func:`resample`. The default is ``'auto'``.
+    frac_limit : int, optional
+        Limit the denominator for approximating the resampling factor. See
+        :py:func:`resample`. The default is ``None``.
+    post_filter : bool, optional
+        Suppress artifacts above the Nyquist frequency of the input signal
+        after up-sampling. See :py:func:`resample`. The default is ``False``.
+
+    Returns
+    -------
+    resampler : :py:class:`Resampler`
+        The resampler can be called to resample the next block of the input
+        signal. It returns the resampled block as a
+        :py:class:`~pyfar.classes.audio.Signal` and has the following
+        parameters
+
+        `signal` : Signal
+            The next block of the input signal. The blocks can have any
+            number of samples.
+
+    Examples
+    --------
+    Resample a noise from 44.1 kHz to 48 kHz in blocks of 4096 samples
+
+    >>> import pyfar as pf
+    >>> import numpy as np
+    >>>
+    >>> signal = pf.signals.noise(44100, seed=1)
+    >>> resampler = pf.dsp.Resampler(44100, 48000)
+    >>> blocks = [resampler(signal[..., n:n+4096])
+    ...           for n in range(0, signal.n_samples, 4096)]
+    >>> blocks.append(resampler.flush())
+    >>> resampled = np.concatenate([block.time for block in blocks], -1)
+    """
+
+    def __init__(self, sampling_rate_old, sampling_rate,
+                 match_amplitude="auto", frac_limit=None, post_filter=False):
+
+        if match_amplitude not in ["auto", "time", "freq"]:
+            raise ValueError((f"match_amplitude is '{match_amplitude}' but "
+                              "must be 'auto', 'time' or 'freq'"))
+
+        self._sampling_rate_old = sampling_rate_old
+        self._sampling_rate = sampling_rate
+        self._match_amplitude = match_amplitude
+        self._up, self._down = _resampling_factors(
+            sampling_rate_old, sampling_rate, frac_limit)
+
+        # polyphase decomposition of the anti-aliasing filter. Column p
+        # contains every up-th filter coefficient starting at p
+        if self._up == self._down:
+            h = np.ones(1)
+        else:
+            h = _resampling_filter(self._up, self._down) * self._up
+        self._half_len = (h.size - 1) // 2
+        n_taps = int(np.ceil(h.size / self._up))
+        self._polyphase = np.zeros(n_taps * self._up)
+        self._polyphase[:h.size] = h
+        self._polyphase = self._polyphase.reshape(n_taps, self._up)
+
+        if post_filter and sampling_rate > sampling_rate_old:
+            self._sos = _resampling_post_filter(
+                sampling_rate_old, sampling_rate).copy()
+        else:
+            self._sos = None
+
+        self.reset()
+
+    @property
+    def sampling_rate_old(self):
+        """The sampling rate of the input signal in Hz."""
+        return self._sampling_rate_old
+
+    @property
+    def sampling_rate(self):
+        """The sampling rate of the output signal in Hz."""
+        return self._sampling_rate
+
+    @property
+    def up(self):
+        """The up-sampling factor."""
+        return self._up
+
+    @property
+    def down(self):
+        """The down-sampling factor."""
+        return self._down
+
+    def reset(self):
+        """Reset the state of the resampler.
+
+        This must be done before resampling a new input signal. It is done
+        automatically by :py:func:`~flush`.
+        """
+        # input samples starting at the global input sample self._offset.
+        # The buffer starts with zeros preceding the signal
+        self._buffer = None
+        self._offset = -self._polyphase.shape[0]
+        # number of input and output samples
+        self._n_in = 0
+        self._n_out = 0
+        # properties of the input signal and state of the post filter
+        self._properties = None
+        self._zi = None
+
+    def __call__(self, signal):
+        """Resample the next block of the input signal."""
+
+        if not isinstance(signal, pf.Signal):
+            raise ValueError("The input must be a Signal object.")
+        if signal.sampling_rate != self.sampling_rate_old:
+            raise ValueError("The sampling rates do not match")
+
+        # initialize the state upon the first block
+        if self._buffer is None:
+            gain = _resampling_gain(
+                signal, self._match_amplitude,
+                self.sampling_rate / self.sampling_rate_old)
+            self._properties = (gain, signal.fft_norm, signal.comment)
+            self._buffer = np.zeros(
+                signal.cshape + (self._polyphase.shape[0], ))
+            if self._sos is not None:
+                self._zi = np.zeros(
+                    (self._sos.shape[0], ) + signal.cshape + (2, ))
+        elif signal.cshape != self._buffer.shape[:-1]:
+            raise ValueError((
+                f"The cshape of the input is {signal.cshape} but must be "
+                f"{self._buffer.shape[:-1]}. Call reset() before resampling "
+                "a new signal."))
+
+        self._buffer = np.concatenate(
+            (self._buffer, signal.time), axis=-1)
+        self._n_in += signal.n_samples
+
+        # number of output samples whose input samples are available
+        n_out = (self._n_in * self._up - 1 - self._half_len) // self._down + 1
+
+        return self._resample(max(n_out, self._n_out))
+
+    def flush(self):
+        """
+        Return the remaining output samples and reset the resampler.
+
+        The input signal is assumed to be zero after the last block. The
+        total number of output samples is ``ceil(n_samples * up / down)``
+        with `n_samples` being the total number of input samples.
+        """
+        if self._buffer is None:
+            raise ValueError("No input was resampled since the last reset.")
+
+        # total number of output samples and zeros that are required to
+        # compute them
+        n_out = -(-self._n_in * self._up // self._down)
+        n_in = ((n_out - 1) * self._down + self._half_len) // self._up + 1
+        n_zeros = max(0, n_in - self._n_in)
+        self._buffer = np.concatenate((
+            self._buffer, np.zeros(self._buffer.shape[:-1] + (n_zeros, ))),
+            axis=-1)
+
+        signal = self._resample(n_out)
+        self.reset()
+        return signal
+
+    def _resample(self, n_out):
+        """
+        Compute the output samples up to `n_out` and return them as a
+        Signal.
+        """
+        # output sample i is given by the sum over the input samples
+        # x[n_0 - j] weighted by the filter coefficients in column p of the
+        # polyphase filter with n_0 and p given by the integer division and
+        # remainder of (i * down + half_len) / up.
+        idx = np.arange(self._n_out, n_out) * self._down + self._half_len
+        n_0, phase = np.divmod(idx, self._up)
+        n_taps = self._polyphase.shape[0]
+        taps = n_0[:, np.newaxis] - np.arange(n_taps) - self._offset
+        data = np.einsum('...ij,ij->...i', self._buffer[..., taps],
+                         self._polyphase[:, phase].T)
+        self._n_out = n_out
+
+        # discard input samples that are not required anymore
+        n_next = (n_out * self._down + self._half_len) // self._up
+        n_discard = max(0, n_next - n_taps + 1 - self._offset)
+        self._buffer = self._buffer[..., n_discard:]
+        self._offset += n_discard
+
+        gain, fft_norm, comment = self._properties
+        if self._sos is not None:
+            data, self._zi = sgn.sosfilt(
+                self._sos, data, axis=-1, zi=self._zi)
+
+        return pf.Signal(data * gain, self.sampling_rate, fft_norm=fft_norm,
+                         comment=comment)
 
 
 class InterpolateSpectrum():
@@ -702,6 +1063,10 @@ class InterpolateSpectrum():
         `show` : bool, optional
             Show a plot of the input and output data. The default is ``False``.
 
+        The frequency grids and interpolators are cached for each combination
+        of `n_samples` and `sampling_rate`. Use :py:func:`~batch` to
+        interpolate signals of different lengths or sampling rates at once.
+
     Examples
     --------
     Interpolate a magnitude spectrum, add an artificial linear phase and
@@ -809,75 +1174,21 @@ class InterpolateSpectrum():
         # frequencies for interpolation (store for testing)
         self._f_in = data.frequencies.copy()
 
+        # frequency grids, interpolation ranges, and interpolators per
+        # (n_samples, sampling_rate) for the most recently used combinations
+        self._plans = OrderedDict()
+        self._max_plans = 32
+
     def __call__(self, n_samples, sampling_rate, show=False):
         """
         Interpolate a Signal with n_samples length.
         (see class docstring) for more information.
         """
 
-        # length of half sided spectrum and highest frequency
-        n_fft = n_samples//2 + 1
-        f_max = sampling_rate / n_samples * (n_fft - 1)
-        # get the frequency values
-        if self._fscale == "linear":
-            # linearly spaced frequencies
-            self._f_query = pf.dsp.fft.rfftfreq(n_samples, sampling_rate)
-            self._f_base = self._f_in
-        else:
-            # logarithmically scaled frequencies between 0 and log10(n_fft)
-            self._f_query = np.log10(np.arange(1, n_fft+1))
-            self._f_base = np.log10(self._f_in / f_max * (n_fft - 1) + 1)
-
-        # frequency range
-        self._freq_range = [self._f_base[0], self._f_base[-1]]
-
-        # get the interpolators
-        self._interpolators = []
-        for d in self._data:
-            interpolators = []
-            for idx, k in enumerate(self._kind):
-                if idx == 1:
-                    interpolators.append(interp1d(self._f_base, d, k))
-                else:
-                    interpolators.append(interp1d(
-                        self._f_base, d, k, fill_value="extrapolate"))
-            self._interpolators.append(interpolators)
-
-        # get interpolation ranges
-        id_below = self._f_query < self._freq_range[0]
-        id_within = np.logical_and(self._f_query >= self._freq_range[0],
-                                   self._f_query <= self._freq_range[1])
-        id_above = self._f_query > self._freq_range[1]
-
-        # interpolate the data
-        interpolated = []
-        for data in self._interpolators:
-            data_interpolated = np.concatenate((
-                (data[0](self._f_query[id_below])),
-                (data[1](self._f_query[id_within])),
-                (data[2](self._f_query[id_above]))),
-                axis=-1)
-            interpolated.append(data_interpolated)
-
-        # get half sided spectrum
-        if self._method == "complex":
-            freq = interpolated[0] + 1j * interpolated[1]
-        elif self._method == 'magnitude_phase':
-            freq = interpolated[0] * np.exp(-1j * interpolated[1])
-        else:
-            freq = interpolated[0]
-
-        # get initial signal
-        signal = pf.Signal(freq, sampling_rate, n_samples, "freq")
-
-        # clip the magnitude
-        if self._clip:
-            signal.freq = np.clip(
-                np.abs(signal.freq),
-                self._clip[0],
-                self._clip[1]) * np.exp(-1j * pf.dsp.phase(signal))
+        signal = self.batch(n_samples, sampling_rate)[0]
 
         if show:
+            import matplotlib.pyplot as plt
             # plot input and output data
             with pf.plot.context():
                 _, ax = plt.subplots(2, 2)
@@ -901,3 +1212,156 @@ class InterpolateSpectrum():
                 ax[1, 1].legend(loc='best')
 
         return signal
+
+    def batch(self, n_samples, sampling_rate):
+        """
+        Interpolate Signals with different lengths and sampling rates.
+
+        For linear frequency scales, the data is interpolated at the
+        frequencies of all signals in one pass.
+
+        Parameters
+        ----------
+        n_samples : int, array like
+            Lengths of the interpolated time signals in samples.
+        sampling_rate : number, array like
+            Sampling rates of the interpolated signals in Hz. `n_samples` and
+            `sampling_rate` must broadcast to the same shape.
+
+        Returns
+        -------
+        signals : list
+            The interpolated :py:class:`~pyfar.classes.audio.Signal` objects
+            for each combination of `n_samples` and `sampling_rate`.
+
+        Examples
+        --------
+        >>> import pyfar as pf
+        >>> data = pf.FrequencyData([1, 2, 1], [100, 1000, 10000])
+        >>> interpolator = pf.dsp.InterpolateSpectrum(
+        ...     data, 'magnitude', ('nearest', 'linear', 'nearest'))
+        >>> signals = interpolator.batch([64, 128, 256], 44100)
+        """
+        n_samples, sampling_rate = np.broadcast_arrays(
+            np.atleast_1d(n_samples), np.atleast_1d(sampling_rate))
+        keys = [(int(n), sr.item()) for n, sr in zip(
+            n_samples.flatten(), sampling_rate.flatten())]
+        plans = [self._get_plan(*key) for key in keys]
+
+        # interpolate all plans that share interpolators at once
+        if self._fscale == "linear":
+            groups = [plans]
+        else:
+            groups = [[plan] for plan in plans]
+        interpolated = []
+        for group in groups:
+            interpolated += self._interpolate(group)
+
+        signals = []
+        for (n, sr), data in zip(keys, interpolated):
+            # get half sided spectrum
+            if self._method == "complex":
+                freq = data[0] + 1j * data[1]
+            elif self._method == 'magnitude_phase':
+                freq = data[0] * np.exp(-1j * data[1])
+            else:
+                freq = data[0]
+
+            # clip the magnitude
+            if self._clip:
+                freq = np.clip(
+                    np.abs(freq),
+                    self._clip[0],
+                    self._clip[1]) * np.exp(-1j * np.angle(freq))
+
+            signals.append(pf.Signal(freq, sr, n, "freq"))
+
+        return signals
+
+    def _get_plan(self, n_samples, sampling_rate):
+        """
+        Get the query frequencies, interpolation ranges, and interpolators
+        for signals with `n_samples` at `sampling_rate`.
+        """
+        key = (n_samples, sampling_rate)
+        if key in self._plans:
+            plan = self._plans[key]
+            self._plans.move_to_end(key)
+        else:
+            # length of half sided spectrum and highest frequency
+            n_fft = n_samples//2 + 1
+            f_max = sampling_rate / n_samples * (n_fft - 1)
+            # get the frequency values
+            if self._fscale == "linear":
+                # linearly spaced frequencies
+                f_query = pf.dsp.fft.rfftfreq(n_samples, sampling_rate)
+                f_base = self._f_in
+            else:
+                # logarithmically scaled frequencies between 0 and
+                # log10(n_fft)
+                f_query = np.log10(np.arange(1, n_fft+1))
+                f_base = np.log10(self._f_in / f_max * (n_fft - 1) + 1)
+
+            # get interpolation ranges
+            ranges = (f_query < f_base[0],
+                      np.logical_and(f_query >= f_base[0],
+                                     f_query <= f_base[-1]),
+                      f_query > f_base[-1])
+
+            # get the interpolators, which only depend on the frequency grid
+            # for logarithmic frequency scales
+            if self._fscale == "linear" and self._plans:
+                interpolators = next(iter(self._plans.values()))[3]
+            else:
+                interpolators = self._get_interpolators(f_base)
+
+            plan = (f_query, f_base, ranges, interpolators)
+            if len(self._plans) >= self._max_plans:
+                # remove the least recently used plan
+                self._plans.popitem(last=False)
+            self._plans[key] = plan
+
+        # store last frequency grids for testing
+        self._f_query, self._f_base = plan[:2]
+        self._freq_range = [self._f_base[0], self._f_base[-1]]
+
+        return plan
+
+    def _get_interpolators(self, f_base):
+        """Get the interpolators below, within, and above the input data."""
+        interpolators = []
+        for d in self._data:
+            interpolators.append([])
+            for idx, k in enumerate(self._kind):
+                if idx == 1:
+                    interpolators[-1].append(interp1d(
+                        f_base, d, k, copy=False))
+                else:
+                    interpolators[-1].append(interp1d(
+                        f_base, d, k, copy=False, fill_value="extrapolate"))
+        return interpolators
+
+    def _interpolate(self, plans):
+        """
+        Interpolate the data at the query frequencies of plans that share the
+        same interpolators in one pass.
+        """
+        interpolators = plans[0][3]
+
+        # query frequencies of all plans below, within, and above the input
+        # data
+        queries = [np.concatenate([plan[0][plan[2][rr]] for plan in plans])
+                   for rr in range(3)]
+        splits = [np.cumsum([np.sum(plan[2][rr]) for plan in plans])[:-1]
+                  for rr in range(3)]
+
+        # interpolate the data
+        interpolated = [[] for _ in plans]
+        for data in interpolators:
+            values = [np.split(data[rr](queries[rr]), splits[rr], axis=-1)
+                      for rr in range(3)]
+            for pp in range(len(plans)):
+                interpolated[pp].append(np.concatenate(
+                    [values[rr][pp] for rr in range(3)], axis=-1))
+
+        return interpolated
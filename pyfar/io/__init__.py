@@ -1,6 +1,6 @@
-from .io import (read, write,
-                 read_sofa, convert_sofa,
-                 read_audio, write_audio,
+from .io import (read, write, list_objects, info,
+                 read_sofa, convert_sofa, SofaReader,
+                 read_audio, write_audio, stream_audio, AudioWriter,
                  audio_subtypes, audio_formats, default_audio_subtype,
                  read_comsol, read_comsol_header)
 
@@ -8,10 +8,15 @@ from .io import (read, write,
 __all__ = [
     'read',
     'write',
+    'list_objects',
+    'info',
     'read_sofa',
     'convert_sofa',
+    'SofaReader',
     'read_audio',
     'write_audio',
+    'stream_audio',
+    'AudioWriter',
     'audio_subtypes',
     'audio_formats',
     'default_audio_subtype',
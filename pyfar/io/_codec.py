@@ -131,14 +131,15 @@ Names, Type Hints and Zippath
 
 """
 
-import io
 import sys
 import json
+import struct
+import zipfile as zf
 import numpy as np
 from copy import deepcopy
 
 
-def _decode(obj, zipfile):
+def _decode(obj, zipfile, mmap_mode=None):
     """
     This function is exclusively used by `io.read` and enables recursive
     decoding for objects of varying depth.
@@ -150,18 +151,21 @@ def _decode(obj, zipfile):
     zipfile: zipfile-object.
         The zipfile object is looped in the recursive structure
         e.g. to decode ndarrays when they occur.
+
+    mmap_mode: None, str
+        Passed to `_decode_ndarray`.
     """
     if isinstance(obj, dict):
         for key in obj.keys():
-            _inner_decode(obj, key, zipfile)
+            _inner_decode(obj, key, zipfile, mmap_mode)
     elif any([isinstance(obj, x) for x in [list, tuple, set, frozenset]]):
         for i in range(0, len(obj)):
-            _inner_decode(obj, i, zipfile)
+            _inner_decode(obj, i, zipfile, mmap_mode)
 
     return obj
 
 
-def _inner_decode(obj, key, zipfile):
+def _inner_decode(obj, key, zipfile, mmap_mode=None):
     """
     This function is exclusively used by `_codec._encode` and casts the obj
     in case it was not JSON-serializable back into ther original type
@@ -179,17 +183,20 @@ def _inner_decode(obj, key, zipfile):
         iterated.
 
     zipfile: zipfile
+
+    mmap_mode: None, str
+        Passed to `_decode_ndarray`.
     """
     if not _is_type_hint(obj[key]):
-        _decode(obj[key], zipfile)
+        _decode(obj[key], zipfile, mmap_mode)
     elif _is_pyfar_type(obj[key][0][1:]):
         PyfarType = _str_to_type(obj[key][0][1:])
         obj[key] = PyfarType._decode(obj[key][1])
-        _decode(obj[key].__dict__, zipfile)
+        _decode(obj[key].__dict__, zipfile, mmap_mode)
     elif obj[key][0][1:] == 'dtype':
         obj[key] = getattr(np, obj[key][1])
     elif obj[key][0][1:] == 'ndarray':
-        obj[key] = _decode_ndarray(obj[key][1], zipfile)
+        obj[key] = _decode_ndarray(obj[key][1], zipfile, mmap_mode)
     elif obj[key][0][1:] == 'complex':
         obj[key] = complex(obj[key][1][0], obj[key][1][1])
     elif obj[key][0][1:] == 'tuple':
@@ -216,19 +223,91 @@ def _decode_numpy_scalar(obj, key):
         obj[key] = numpy_scalar(obj[key][1])
 
 
-def _decode_ndarray(obj, zipfile):
+def _decode_ndarray(obj, zipfile, mmap_mode=None):
     """ This function is exclusively used by `io._inner_decode` and
-    decodes `numpy.ndarrays` from a memfile.
+    decodes `numpy.ndarrays` from the zipfile.
+
+    If `mmap_mode` is not None and the array is stored uncompressed in a
+    zipfile on disk, the array is memory-mapped instead of being read (see
+    `numpy.memmap`). Otherwise the array is read directly from the archive
+    without intermediate copies.
+    """
+    with zipfile.open(obj) as member:
+        if mmap_mode is None \
+                or zipfile.getinfo(obj).compress_type != zf.ZIP_STORED \
+                or not isinstance(zipfile.filename, str):
+            return np.lib.format.read_array(member, allow_pickle=False)
+
+        shape, fortran_order, dtype = _read_ndarray_header(member)
+        header_size = member.tell()
+
+        # empty arrays can not be memory-mapped
+        if dtype.hasobject or not np.prod(shape, dtype=int):
+            member.seek(0)
+            return np.lib.format.read_array(member, allow_pickle=False)
+
+    return np.memmap(
+        zipfile.filename, dtype=dtype, mode=mmap_mode, shape=shape,
+        order='F' if fortran_order else 'C',
+        offset=_member_offset(zipfile, obj) + header_size)
+
+
+def _read_ndarray_header(member):
+    """ Read the header of `.npy` data from an opened zipfile member.
+
+    Returns the shape, the memory order (True for Fortran order), and the
+    dtype of the array. The member is positioned at the start of the data.
+    """
+    version = np.lib.format.read_magic(member)
+    if version == (1, 0):
+        return np.lib.format.read_array_header_1_0(member)
+    if version == (2, 0):
+        return np.lib.format.read_array_header_2_0(member)
+    raise ValueError(
+        f"Arrays in .npy format version {version} can not be memory-mapped")
+
+
+def _ndarray_info(obj, zipfile):
+    """ Return the shape and dtype of an encoded `numpy.ndarray` without
+    reading its data.
     """
-    # Numpy.load is applied on a memory file instead of a physical file
-    memfile = io.BytesIO()
-    nd_bytes = zipfile.read(obj)
-    memfile.write(nd_bytes)
-    memfile.seek(0)
-    return np.load(memfile, allow_pickle=False)
+    with zipfile.open(obj) as member:
+        shape, _, dtype = _read_ndarray_header(member)
+    return {'shape': shape, 'dtype': dtype.name}
 
 
-def _decode_object_json_aided(name, type_hint, zipfile):
+def _ndarray_paths(obj):
+    """ Return the zip paths of all `numpy.ndarrays` referenced in an encoded
+    object, i.e., in the JSON representation written by
+    `_encode_object_json_aided`.
+    """
+    if _is_type_hint(obj) and obj[0] == '$ndarray':
+        return [obj[1]]
+    if isinstance(obj, dict):
+        obj = list(obj.values())
+    if isinstance(obj, list):
+        return [path for item in obj for path in _ndarray_paths(item)]
+    return []
+
+
+def _member_offset(zipfile, name):
+    """ Return the position of the data of a zipfile member in the file.
+
+    The position follows from the local file header, which can contain other
+    extra fields than the central directory (see the zip file specification).
+    """
+    info = zipfile.getinfo(name)
+    with open(zipfile.filename, 'rb') as file:
+        file.seek(info.header_offset)
+        header = file.read(zf.sizeFileHeader)
+    if header[:4] != zf.stringFileHeader:
+        raise zf.BadZipFile(f'Bad local file header of {name}')
+    # length of the file name and extra field
+    name_size, extra_size = struct.unpack('<HH', header[26:30])
+    return info.header_offset + zf.sizeFileHeader + name_size + extra_size
+
+
+def _decode_object_json_aided(name, type_hint, zipfile, mmap_mode=None):
     """
     Decodes composed objects with the help of JSON.
 
@@ -240,10 +319,12 @@ def _decode_object_json_aided(name, type_hint, zipfile):
         The object's type hint, starts with '$'.
     zipfile: zipfile
         The zipfile from where we'd like to read data.
+    mmap_mode: None, str
+        Passed to `_decode_ndarray`.
     """
     json_str = zipfile.read(f'{name}/{type_hint}').decode('UTF-8')
     obj_dict_encoded = json.loads(json_str)
-    obj_dict = _decode(obj_dict_encoded, zipfile)
+    obj_dict = _decode(obj_dict_encoded, zipfile, mmap_mode)
     ObjType = _str_to_type(type_hint[1:])
     try:
         return ObjType._decode(obj_dict)
@@ -316,7 +397,7 @@ def _inner_encode(obj, key, zip_path, zipfile):
     if _is_dtype(obj[key]):
         obj[key] = ['$dtype', obj[key].__name__]
     elif isinstance(obj[key], np.ndarray):
-        zipfile.writestr(zip_path, _encode_ndarray(obj[key]))
+        _encode_ndarray(obj[key], zip_path, zipfile)
         obj[key] = ['$ndarray', zip_path]
     elif _is_pyfar_type(obj[key]):
         obj[key] = [f'${type(obj[key]).__name__}', obj[key]._encode()]
@@ -333,7 +414,7 @@ def _inner_encode(obj, key, zip_path, zipfile):
         _encode(obj[key], zip_path, zipfile)
 
 
-def _encode_ndarray(ndarray):
+def _encode_ndarray(ndarray, zip_path, zipfile):
     """
     The encoding of objects that are composed of primitive and numpy types
     utilizes `obj.__dict__()` and numpy encoding methods.
@@ -342,20 +423,21 @@ def _encode_ndarray(ndarray):
     ----------
     ndarray: numpy.array.
 
-    Returns
-    -------
-    bytes.
-        They bytes that where written by `numpy.save` into a memfile.
+    zip_path: str
+        The path of the array in the zipfile.
+
+    zipfile: zipfile
+        The zipfile to which the array is written in the `.npy` format.
 
     Note
     ----
     * Do not allow pickling. It is not safe!
+    * The array is streamed into the zipfile without copying it to memory
+      first. Zip64 extensions are forced because the size is not known
+      beforehand.
     """
-    # `Numpy.save` is applied on a memory file instead of a physical file
-    memfile = io.BytesIO()
-    np.save(memfile, ndarray, allow_pickle=False)
-    memfile.seek(0)
-    return memfile.read()
+    with zipfile.open(zip_path, 'w', force_zip64=True) as member:
+        np.lib.format.write_array(member, ndarray, allow_pickle=False)
 
 
 def _encode_object_json_aided(obj, name, zipfile):
@@ -8,13 +8,14 @@ imported and exported as audio files using :py:func:`read_audio` and
 :py:func:`write_audio`. :py:func:`read_sofa` provides functionality to read the
 data stored in a SOFA file.
 """
-import os.path
+import os
 import pathlib
+import tempfile
 
 import warnings
-import sofar as sf
 import zipfile
-import io
+import itertools
+import json
 import numpy as np
 import re
 
@@ -31,6 +32,11 @@ except (ModuleNotFoundError, OSError):
 from pyfar import Signal, FrequencyData, Coordinates, TimeData
 from . import _codec as codec
 import pyfar.classes.filter as fo
+from pyfar._utils import _file_mode
+
+
+# approximate number of values that are parsed at once by read_comsol
+_comsol_chunk_size = 2**20
 
 
 def read_sofa(filename, verify=True):
@@ -74,6 +80,8 @@ def read_sofa(filename, verify=True):
     Notes
     -----
     * This function uses the sofar package to read SOFA files [#]_.
+    * Use :py:class:`SofaReader` to read only selected measurements from
+      large SOFA files.
 
     References
     ----------
@@ -84,6 +92,7 @@ def read_sofa(filename, verify=True):
 
     """
 
+    import sofar as sf
     sofa = sf.read_sofa(filename, verify)
     return convert_sofa(sofa)
 
@@ -133,6 +142,8 @@ def convert_sofa(sofa):
     .. [#] https://pyfar.org
     """
 
+    import sofar as sf
+
     # check input
     if not isinstance(sofa, sf.Sofa):
         raise TypeError((
@@ -154,11 +165,9 @@ def convert_sofa(sofa):
     elif sofa.GLOBAL_DataType in ['TF', 'TF-E', 'TFE']:
         # order axis according to pyfar convention
         # frequencies go in last dimension)
+        freq = _sofa_complex(sofa.Data_Real, sofa.Data_Imag)
         if sofa.GLOBAL_DataType == 'TF-E':
-            freq = np.moveaxis(sofa.Data_Real, -1, 0) + \
-                1j * np.moveaxis(sofa.Data_Imag, -1, 0)
-        else:
-            freq = sofa.Data_Real + 1j * sofa.Data_Imag
+            freq = np.moveaxis(freq, -1, 0)
 
         # make FrequencyData
         signal = FrequencyData(freq, sofa.N)
@@ -167,29 +176,199 @@ def convert_sofa(sofa):
             f"DataType {sofa.GLOBAL_DataType} is not supported.")
 
     # Source
-    s_values = sofa.SourcePosition
-    s_domain, s_convention, s_unit = _sofa_pos(sofa.SourcePosition_Type)
-    source_coordinates = Coordinates(
-        s_values[:, 0],
-        s_values[:, 1],
-        s_values[:, 2],
-        domain=s_domain,
-        convention=s_convention,
-        unit=s_unit)
+    source_coordinates = _sofa_coordinates(
+        sofa.SourcePosition, sofa.SourcePosition_Type)
     # Receiver
-    r_values = sofa.ReceiverPosition
-    r_domain, r_convention, r_unit = _sofa_pos(sofa.ReceiverPosition_Type)
-    receiver_coordinates = Coordinates(
-        r_values[:, 0],
-        r_values[:, 1],
-        r_values[:, 2],
-        domain=r_domain,
-        convention=r_convention,
-        unit=r_unit)
+    receiver_coordinates = _sofa_coordinates(
+        sofa.ReceiverPosition, sofa.ReceiverPosition_Type)
 
     return signal, source_coordinates, receiver_coordinates
 
 
+class SofaReader():
+    """
+    Read selected measurements from a SOFA file.
+
+    Opening the file only reads the source and receiver positions. The audio
+    data of selected measurements is read upon request, which is much faster
+    than reading the entire file with :py:func:`read_sofa` if only a few
+    measurements are required from large files. In contrast to
+    :py:func:`read_sofa`, the file is not verified.
+
+    Parameters
+    ----------
+    filename : string, Path
+        Input SOFA file (cf. :py:func:`read_sofa`).
+
+    Examples
+    --------
+    Read the HRIRs for the ten source positions that are closest to the
+    frontal direction
+
+    >>> import pyfar as pf
+    >>> with pf.io.SofaReader('my_hrirs.sofa') as sofa:
+    >>>     index, _ = sofa.source_coordinates.find_nearest_k(
+    ...         1, 0, 0, k=10)
+    >>>     hrirs = sofa.read(index)
+    >>>     sources = sofa.source_coordinates[index]
+    """
+
+    def __init__(self, filename):
+        # netCDF4 is a dependency of sofar
+        import netCDF4
+
+        self._file = netCDF4.Dataset(filename, 'r')
+        self._file.set_auto_mask(False)
+
+        try:
+            self._data_type = self._file.getncattr('DataType')
+            if self._data_type not in ['FIR', 'FIR-E', 'FIRE',
+                                       'TF', 'TF-E', 'TFE']:
+                raise ValueError(
+                    f"DataType {self._data_type} is not supported.")
+
+            self._n_measurements = len(self._file.dimensions['M'])
+            self._source_coordinates = _sofa_coordinates(
+                self._file['SourcePosition'][:],
+                self._file['SourcePosition'].getncattr('Type'))
+            self._receiver_coordinates = _sofa_coordinates(
+                self._file['ReceiverPosition'][:],
+                self._file['ReceiverPosition'].getncattr('Type'))
+
+            if self._data_type.startswith('FIR'):
+                sampling_rate = np.unique(self._file['Data.SamplingRate'][:])
+                if sampling_rate.size != 1:
+                    raise ValueError(
+                        "The sampling rate must be the same for all "
+                        "measurements.")
+                self._sampling_rate = sampling_rate.item()
+            else:
+                self._frequencies = self._file['N'][:]
+        except BaseException:
+            self._file.close()
+            raise
+
+    @property
+    def n_measurements(self):
+        """The number of measurements `M` in the SOFA file."""
+        return self._n_measurements
+
+    @property
+    def source_coordinates(self):
+        """
+        The source positions as Coordinates object (see
+        :py:func:`read_sofa`).
+        """
+        return self._source_coordinates.copy()
+
+    @property
+    def receiver_coordinates(self):
+        """
+        The receiver positions as Coordinates object (see
+        :py:func:`read_sofa`).
+        """
+        return self._receiver_coordinates.copy()
+
+    def read(self, measurements=None):
+        """
+        Read the audio data of selected measurements.
+
+        Parameters
+        ----------
+        measurements : int, slice, array like, optional
+            Indices of the measurements to read. Indices are used to index
+            an array with the measurements along the first dimension, e.g.,
+            a list of integers, a boolean mask, or the index returned by
+            :py:meth:`~pyfar.classes.coordinates.Coordinates.find_nearest_k`
+            when searching the source positions. The default ``None`` reads
+            all measurements.
+
+        Returns
+        -------
+        audio : pyfar audio object
+            A Signal or FrequencyData object as returned by
+            :py:func:`read_sofa`. The dimension of the measurements `M` in
+            the `cshape` is replaced by the shape of the selected
+            measurements. This is the first dimension, except for the
+            DataTypes ``'FIR-E'`` and ``'TF-E'``, for which the emitters `E`
+            are moved to the first dimension as in :py:func:`read_sofa`.
+            Reading ``k`` measurements thus gives the `cshape` ``(k, R)`` in
+            general and ``(E, k, R)`` for ``'FIR-E'`` and ``'TF-E'`` data,
+            with `R` being the number of receivers.
+        """
+
+        if self._data_type.startswith('FIR'):
+            time = self._read_variable('Data.IR', measurements)
+            if self._data_type == 'FIR-E':
+                time = np.moveaxis(time, -1, 0)
+            return Signal(time, self._sampling_rate)
+
+        freq = _sofa_complex(
+            self._read_variable('Data.Real', measurements),
+            self._read_variable('Data.Imag', measurements))
+        if self._data_type == 'TF-E':
+            freq = np.moveaxis(freq, -1, 0)
+        return FrequencyData(freq, self._frequencies)
+
+    def _read_variable(self, name, measurements):
+        """Read selected measurements of a variable."""
+        variable = self._file[name]
+        if measurements is None:
+            return variable[:]
+
+        index = np.arange(self._n_measurements)[measurements]
+        # read each measurement once and in the order of the file
+        unique, inverse = np.unique(index, return_inverse=True)
+
+        chunking = variable.chunking()
+        if not unique.size:
+            data = np.empty((0, ) + variable.shape[1:], dtype=variable.dtype)
+        elif chunking == 'contiguous':
+            data = variable[unique]
+        else:
+            # compressed data is stored in chunks of several measurements.
+            # Reading the measurements of a chunk at once decompresses the
+            # chunk only once
+            data = []
+            for chunk in np.unique(unique // chunking[0]):
+                selected = unique[unique // chunking[0] == chunk]
+                block = variable[selected[0]:selected[-1] + 1]
+                data.append(block[selected - selected[0]])
+            data = np.concatenate(data)
+
+        return data[inverse].reshape(index.shape + data.shape[1:])
+
+    def close(self):
+        """Close the SOFA file."""
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _sofa_complex(real, imag):
+    """Combine real and imaginary part without temporary complex arrays."""
+    data = np.empty(np.shape(real), dtype=complex)
+    data.real = real
+    data.imag = imag
+    return data
+
+
+def _sofa_coordinates(values, pos_type):
+    """Convert SOFA positions of shape (N, 3) to Coordinates."""
+    domain, convention, unit = _sofa_pos(pos_type)
+    return Coordinates(
+        values[:, 0],
+        values[:, 1],
+        values[:, 2],
+        domain=domain,
+        convention=convention,
+        unit=unit)
+
+
 def _sofa_pos(pos_type):
     if pos_type == 'spherical':
         domain = 'sph'
@@ -204,7 +383,7 @@ def _sofa_pos(pos_type):
     return domain, convention, unit
 
 
-def read(filename):
+def read(filename, mmap_mode=None, names=None):
     """
     Read any compatible pyfar object or numpy array (.far file) from disk.
 
@@ -212,6 +391,21 @@ def read(filename):
     ----------
     filename : string, Path
         Input file. If no extension is provided, .far-suffix is added.
+    mmap_mode : None, 'r', 'c', optional
+        If not ``None``, arrays are memory-mapped instead of being read to
+        memory (see :py:class:`numpy.memmap`). The data of memory-mapped
+        arrays is only loaded from disk when it is accessed, which makes it
+        possible to work with files that are larger than the available
+        memory. ``'r'`` maps the arrays read-only and ``'c'`` maps them
+        copy-on-write, i.e., changes are kept in memory and not written to
+        the file. Memory-mapping requires uncompressed files (see
+        :py:func:`write`). Arrays of compressed files are always read to
+        memory. The default is ``None``.
+    names : str, list of str, optional
+        Names of the objects that are read. Other objects contained in the
+        file are not decoded. Use :py:func:`list_objects` to obtain the
+        names of all objects. The default is ``None``, which reads all
+        objects.
 
     Returns
     -------
@@ -226,38 +420,147 @@ def read(filename):
     >>> collection = pyfar.read('my_objs.far')
     >>> my_signal = collection['my_signal']
     >>> my_orientations = collection['my_orientations']
+
+    Memory-map the data of a large file
+
+    >>> collection = pyfar.read('my_large_objs.far', mmap_mode='c')
+
+    Read only the signal
+
+    >>> my_signal = pyfar.read('my_objs.far', names='my_signal')['my_signal']
     """
     # Check for .far file extension
     filename = pathlib.Path(filename).with_suffix('.far')
 
-    collection = {}
-    with open(filename, 'rb') as f:
-        zip_buffer = io.BytesIO()
-        zip_buffer.write(f.read())
-        with zipfile.ZipFile(zip_buffer) as zip_file:
-            zip_paths = zip_file.namelist()
-            obj_names_hints = [
-                path.split('/')[:2] for path in zip_paths if '/$' in path]
-            for name, hint in obj_names_hints:
-                if codec._is_pyfar_type(hint[1:]):
-                    obj = codec._decode_object_json_aided(name, hint, zip_file)
-                elif hint == '$ndarray':
-                    obj = codec._decode_ndarray(f'{name}/{hint}', zip_file)
-                else:
-                    raise TypeError(
-                        '.far-file contains unknown types.'
-                        'This might occur when writing and reading files with'
-                        'different versions of Pyfar.')
-                collection[name] = obj
+    if mmap_mode not in [None, 'r', 'c']:
+        raise ValueError(
+            f"mmap_mode is '{mmap_mode}' but must be None, 'r', or 'c'")
+    if isinstance(names, str):
+        names = [names]
 
-        if 'builtin_wrapper' in collection:
-            for key, value in collection['builtin_wrapper'].items():
-                collection[key] = value
-            collection.pop('builtin_wrapper')
+    collection = {}
+    # the data is read directly from the file to avoid copying it to memory
+    with zipfile.ZipFile(str(filename)) as zip_file:
+        for name, hint in _far_names_hints(zip_file):
+            # builtins are always decoded because they are stored together
+            if names is not None and name not in names \
+                    and name != 'builtin_wrapper':
+                continue
+            if codec._is_pyfar_type(hint[1:]):
+                obj = codec._decode_object_json_aided(
+                    name, hint, zip_file, mmap_mode)
+            elif hint == '$ndarray':
+                obj = codec._decode_ndarray(
+                    f'{name}/{hint}', zip_file, mmap_mode)
+            else:
+                raise TypeError(
+                    '.far-file contains unknown types.'
+                    'This might occur when writing and reading files with'
+                    'different versions of Pyfar.')
+            collection[name] = obj
+
+    if 'builtin_wrapper' in collection:
+        for key, value in collection['builtin_wrapper'].items():
+            collection[key] = value
+        collection.pop('builtin_wrapper')
+
+    if names is not None:
+        missing = [name for name in names if name not in collection]
+        if missing:
+            raise ValueError(
+                f"{filename} does not contain the objects {missing}")
+        collection = {name: collection[name] for name in names}
 
     return collection
 
 
+def list_objects(filename):
+    """
+    List the objects contained in a .far file without reading them.
+
+    Parameters
+    ----------
+    filename : string, Path
+        Input file. If no extension is provided, .far-suffix is added.
+
+    Returns
+    -------
+    objects : dict
+        The names of the objects as keys and the names of their types as
+        values, e.g., ``{'my_signal': 'Signal', 'my_array': 'ndarray'}``.
+
+    Examples
+    --------
+    >>> pyfar.io.list_objects('my_objs.far')
+    """
+    return {name: obj_info['type']
+            for name, obj_info in info(filename).items()}
+
+
+def info(filename):
+    """
+    Get information on the objects contained in a .far file.
+
+    The information is obtained from the type hints and the headers of the
+    arrays. No arrays are read, which makes it possible to quickly inspect
+    large files.
+
+    Parameters
+    ----------
+    filename : string, Path
+        Input file. If no extension is provided, .far-suffix is added.
+
+    Returns
+    -------
+    objects : dict
+        The names of the objects as keys and dictionaries with information
+        as values. The information contains the name of the object's type
+        (``'type'``). For numpy arrays, it contains their ``'shape'`` and
+        ``'dtype'``. For pyfar objects, it contains the shapes and dtypes of
+        all arrays of the object (``'arrays'``) with the path of the array
+        within the object as keys, e.g., ``'_data'`` for the data of a
+        :py:class:`~pyfar.Signal` object.
+
+    Examples
+    --------
+    Get the shape of the data of a signal
+
+    >>> pyfar.io.info('my_objs.far')['my_signal']['arrays']['_data']['shape']
+    """
+    # Check for .far file extension
+    filename = pathlib.Path(filename).with_suffix('.far')
+
+    objects = {}
+    with zipfile.ZipFile(str(filename)) as zip_file:
+        for name, hint in _far_names_hints(zip_file):
+            if hint == '$ndarray':
+                objects[name] = {
+                    'type': 'ndarray',
+                    **codec._ndarray_info(f'{name}/{hint}', zip_file)}
+            elif name == 'builtin_wrapper':
+                builtins = codec._decode_object_json_aided(
+                    name, hint, zip_file)
+                for key, value in builtins.items():
+                    objects[key] = {'type': type(value).__name__}
+            else:
+                obj_dict = json.loads(
+                    zip_file.read(f'{name}/{hint}').decode('UTF-8'))
+                objects[name] = {
+                    'type': hint[1:],
+                    'arrays': {
+                        path[len(name) + 1:]:
+                            codec._ndarray_info(path, zip_file)
+                        for path in codec._ndarray_paths(obj_dict)}}
+
+    return objects
+
+
+def _far_names_hints(zip_file):
+    """Return the names and type hints of the objects in a .far file."""
+    return [path.split('/')[:2]
+            for path in zip_file.namelist() if '/$' in path]
+
+
 def write(filename, compress=False, **objs):
     """
     Write any compatible pyfar object or numpy array and often used builtin
@@ -271,7 +574,8 @@ def write(filename, compress=False, **objs):
     compress : bool
         Default is ``False`` (uncompressed).
         Compressed files take less disk space but need more time for writing
-        and reading.
+        and reading. Uncompressed files can be memory-mapped when reading
+        (see :py:func:`read`).
     **objs:
         Objects to be saved as key-value arguments, e.g.,
         ``name1=object1, name2=object2``.
@@ -290,33 +594,45 @@ def write(filename, compress=False, **objs):
     -----
     * Supported builtin types are:
       bool, bytes, complex, float, frozenset, int, list, set, str and tuple
+    * The objects are directly written to the file, i.e., arrays are not
+      copied to memory before writing.
     """
     # Check for .far file extension
     filename = pathlib.Path(filename).with_suffix('.far')
-    compression = zipfile.ZIP_STORED if compress else zipfile.ZIP_DEFLATED
-    zip_buffer = io.BytesIO()
+    compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+
+    # write to a temporary file that replaces the target only on success to
+    # keep existing files if writing fails
+    file, tmp = tempfile.mkstemp(
+        suffix='.far', prefix=f'.{filename.stem}_', dir=filename.parent)
     builtin_wrapper = codec.BuiltinsWrapper()
-    with zipfile.ZipFile(zip_buffer, "a", compression) as zip_file:
-        for name, obj in objs.items():
-            if codec._is_pyfar_type(obj):
-                codec._encode_object_json_aided(obj, name, zip_file)
-            elif codec._is_numpy_type(obj):
-                codec._encode({f'${type(obj).__name__}': obj}, name, zip_file)
-            elif type(obj) in codec._supported_builtin_types():
-                builtin_wrapper[name] = obj
-            else:
-                error = (
-                    f'Objects of type {type(obj)} cannot be written to disk.')
-                if isinstance(obj, fo.Filter):
-                    error = f'{error}. Consider casting to {fo.Filter}'
-                raise TypeError(error)
+    try:
+        with os.fdopen(file, 'wb') as f, \
+                zipfile.ZipFile(f, "w", compression) as zip_file:
+            for name, obj in objs.items():
+                if codec._is_pyfar_type(obj):
+                    codec._encode_object_json_aided(obj, name, zip_file)
+                elif codec._is_numpy_type(obj):
+                    codec._encode(
+                        {f'${type(obj).__name__}': obj}, name, zip_file)
+                elif type(obj) in codec._supported_builtin_types():
+                    builtin_wrapper[name] = obj
+                else:
+                    error = (f'Objects of type {type(obj)} cannot be written '
+                             'to disk.')
+                    if isinstance(obj, fo.Filter):
+                        error = f'{error}. Consider casting to {fo.Filter}'
+                    raise TypeError(error)
 
-        if len(builtin_wrapper) > 0:
-            codec._encode_object_json_aided(
-                builtin_wrapper, 'builtin_wrapper', zip_file)
+            if len(builtin_wrapper) > 0:
+                codec._encode_object_json_aided(
+                    builtin_wrapper, 'builtin_wrapper', zip_file)
 
-    with open(filename, 'wb') as f:
-        f.write(zip_buffer.getvalue())
+        os.chmod(tmp, _file_mode(filename))
+        os.replace(tmp, filename)
+    except BaseException:
+        os.remove(tmp)
+        raise
 
 
 def read_audio(filename, dtype='float64', **kwargs):
@@ -418,20 +734,198 @@ def write_audio(signal, filename, subtype=None, overwrite=True, **kwargs):
             "File already exists,"
             "use overwrite option to disable error.")
     else:
-        # Only the subtypes FLOAT, DOUBLE, VORBIS are not clipped,
-        # see _clipped_audio_subtypes()
-        format = pathlib.Path(filename).suffix[1:]
-        if subtype is None:
-            subtype = default_audio_subtype(format)
-        if (np.any(data > 1.) and
-                subtype.upper() not in ['FLOAT', 'DOUBLE', 'VORBIS']):
-            warnings.warn(
-                f'{format}-files of subtype {subtype} are clipped to +/- 1.')
+        subtype = _audio_subtype(data, filename, subtype)
         soundfile.write(
             file=filename, data=data.T, samplerate=sampling_rate,
             subtype=subtype, **kwargs)
 
 
+def _audio_subtype(data, filename, subtype):
+    """
+    Return the subtype for writing data to an audio file and warn if the data
+    is clipped.
+    """
+    # Only the subtypes FLOAT, DOUBLE, VORBIS are not clipped,
+    # see _clipped_audio_subtypes()
+    format = pathlib.Path(filename).suffix[1:]
+    if subtype is None:
+        subtype = default_audio_subtype(format)
+    if (np.any(data > 1.) and
+            subtype.upper() not in ['FLOAT', 'DOUBLE', 'VORBIS']):
+        warnings.warn(
+            f'{format}-files of subtype {subtype} are clipped to +/- 1.')
+    return subtype
+
+
+def stream_audio(filename, block_size, overlap=0, dtype='float64', **kwargs):
+    """
+    Read an audio file block by block.
+
+    Only a single block is kept in memory at a time, which makes it possible
+    to process long audio files with bounded memory. Use
+    :py:class:`AudioWriter` to write the processed blocks to disk.
+
+    Parameters
+    ----------
+    filename : string, Path
+        Input file.
+    block_size : int
+        The number of samples per block. The last block can be shorter.
+    overlap : int, optional
+        The number of samples by which consecutive blocks overlap. Must be
+        smaller than `block_size`. The default is ``0``.
+    dtype : {'float64', 'float32', 'int32', 'int16'}, optional
+        Data type to which the data in the file is casted. See
+        :py:func:`read_audio`. The default is ``'float64'``.
+    **kwargs
+        Other keyword arguments to be passed to
+        :py:class:`soundfile.SoundFile`. This is needed, e.g, to read RAW audio
+        files.
+
+    Yields
+    ------
+    block : Signal
+        :py:class:`~pyfar.classes.audio.Signal` object containing a block of
+        the audio data. The comment of the block is the comment stored in
+        the audio file if it exists.
+
+    Notes
+    -----
+    This function is based on :py:meth:`soundfile.SoundFile.blocks`.
+
+    Examples
+    --------
+    Compute the RMS of an audio file in blocks of one second
+
+    >>> import pyfar as pf
+    >>> for block in pf.io.stream_audio('my_file.wav', 44100):
+    >>>     print(pf.dsp.rms(block))
+    """
+    if not soundfile_imported:
+        warnings.warn(soundfile_warning)
+        return
+
+    if not isinstance(block_size, int) or block_size < 1:
+        raise ValueError("block_size must be a positive integer")
+    if not isinstance(overlap, int) or not 0 <= overlap < block_size:
+        raise ValueError(
+            "overlap must be a non-negative integer smaller than block_size")
+
+    with soundfile.SoundFile(filename, **kwargs) as file:
+        comment = file.comment if file.comment else None
+        for block in file.blocks(
+                blocksize=block_size, overlap=overlap, dtype=dtype,
+                always_2d=True):
+            yield Signal(block.T, file.samplerate, comment=comment)
+
+
+class AudioWriter():
+    """
+    Write :py:class:`~pyfar.classes.audio.Signal` objects block by block to
+    an audio file.
+
+    The audio file is created when the first block is written and all blocks
+    must have the same sampling rate and number of channels. Signals are
+    flattened before writing as in :py:func:`write_audio`.
+
+    Examples
+    --------
+    Filter an audio file block by block
+
+    >>> import pyfar as pf
+    >>> lowpass = pf.dsp.filter.butterworth(None, 4, 1000, 'lowpass', 44100)
+    >>> blocks = pf.io.stream_audio('my_file.wav', 4096)
+    >>> with pf.io.AudioWriter('my_filtered_file.wav') as writer:
+    >>>     for block in lowpass.process_blocks(blocks):
+    >>>         writer.write(block)
+    """
+
+    def __init__(self, filename, subtype=None, overwrite=True, **kwargs):
+        """
+        Initialize the writer.
+
+        Parameters
+        ----------
+        filename : string, Path
+            Output file. The format is determined from the file extension.
+            See :py:func:`audio_formats` for all possible formats.
+        subtype : str, optional
+            The subtype of the sound file, the default value depends on the
+            selected `format` (see :py:func:`default_audio_subtype`).
+            See :py:func:`audio_subtypes` for all possible subtypes for
+            a given ``format``.
+        overwrite : bool
+            Select wether to overwrite the audio file, if it already exists.
+            The default is ``True``.
+        **kwargs
+            Other keyword arguments to be passed to
+            :py:class:`soundfile.SoundFile`.
+        """
+        if not soundfile_imported:
+            raise ModuleNotFoundError(soundfile_warning)
+
+        if overwrite is False and os.path.isfile(filename):
+            raise FileExistsError(
+                "File already exists,"
+                "use overwrite option to disable error.")
+
+        self._filename = filename
+        self._subtype = subtype
+        self._kwargs = kwargs
+        self._file = None
+
+    @property
+    def n_samples(self):
+        """The number of samples that were written."""
+        return 0 if self._file is None else self._file.frames
+
+    def write(self, signal):
+        """
+        Append a signal to the audio file.
+
+        Parameters
+        ----------
+        signal : Signal
+            The signal to be written.
+        """
+        if not isinstance(signal, Signal):
+            raise ValueError("The input must be a Signal object.")
+
+        data = signal.time.reshape(-1, signal.n_samples)
+
+        if self._file is None:
+            if len(signal.cshape) != 1:
+                warnings.warn(f"Signal flattened to {data.shape[0]} channels.")
+            self._subtype = _audio_subtype(
+                data, self._filename, self._subtype)
+            self._file = soundfile.SoundFile(
+                self._filename, mode='w', samplerate=signal.sampling_rate,
+                channels=data.shape[0], subtype=self._subtype,
+                **self._kwargs)
+        else:
+            if signal.sampling_rate != self._file.samplerate:
+                raise ValueError(
+                    "The sampling rate must be the same for all signals.")
+            if data.shape[0] != self._file.channels:
+                raise ValueError(
+                    "The number of channels must be the same for all signals.")
+            # warn if the data is clipped
+            _audio_subtype(data, self._filename, self._subtype)
+
+        self._file.write(data.T)
+
+    def close(self):
+        """Close the audio file."""
+        if self._file is not None:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
 def audio_formats():
     """Return a dictionary of available audio formats.
 
@@ -617,94 +1111,105 @@ def read_comsol(filename, expressions=None, parameters=None):
             "Input path must be a .txt, .csv or .dat file"
             f"but is of type {str(suffix)}"))
 
-    # get header
-    all_expressions, units, all_parameters, domain, domain_data \
-        = read_comsol_header(filename)
-    if 'dB' in units:
+    with open(filename) as f:
+        # get header and meta data
+        metadata, header, first_line = _read_comsol_preamble(f, suffix)
+        all_expressions, units, all_parameters, domain, domain_data \
+            = _read_comsol_parse_header(header)
+        if 'dB' in units:
+            warnings.warn(
+                r'The data contains values in dB. Consider to use '
+                r'de-logarithmize data, such as sound pressure, if possible. '
+                r'otherwise any further processing of the data might lead to '
+                r'erroneous results.')
+        is_complex = 'i' in first_line
+        delimiter = ',' if ',' in first_line else None
+
+        # set default variables
+        if expressions is None:
+            expressions = all_expressions.copy()
+        if parameters is None:
+            parameters = all_parameters.copy()
+
+        n_dimension = metadata['Dimension']
+        n_nodes = metadata['Nodes']
+
+        # Define pattern for regular expressions, see test files for examples
+        domain_str = domain if domain == 'freq' else 't'
+        exp_pattern = r'([\w\/\^\*\(\)_.]+) \('
+        domain_pattern = domain_str + r'=([0-9.]+)'
+        value_pattern = r'=([0-9.]+)'
+
+        # index of each data column in the output, -1 if it is not selected
+        expression_idx = _read_comsol_index(
+            re.findall(exp_pattern, header), expressions)
+        domain_idx = _read_comsol_index(
+            [float(x) for x in re.findall(domain_pattern, header)],
+            domain_data)
+        parameter_idx = [_read_comsol_index(
+            [float(x) for x in re.findall(key + value_pattern, header)],
+            parameters[key]) for key in parameters]
+
+        selected = (expression_idx >= 0) & (domain_idx >= 0)
+        for idx in parameter_idx:
+            selected &= idx >= 0
+        columns = np.flatnonzero(selected)
+
+        # final data shape
+        parameter_shape = [len(parameters[key]) for key in parameters]
+        final_shape = [n_nodes, len(expressions), *parameter_shape,
+                       len(domain_data)]
+
+        # flat index of the selected columns in the output per node
+        n_combinations = int(np.prod(parameter_shape))
+        combination_idx = np.ravel_multi_index(
+            tuple(idx[columns] for idx in parameter_idx), parameter_shape) \
+            if parameters else np.zeros(columns.size, dtype=int)
+        target_idx = np.ravel_multi_index(
+            (expression_idx[columns], combination_idx, domain_idx[columns]),
+            (len(expressions), n_combinations, len(domain_data)))
+
+        # read data in chunks of lines, only the coordinates and the selected
+        # columns are converted
+        dtype = complex if is_complex else float
+        data_out = np.full(final_shape, np.nan, dtype=dtype)
+        data_flat = data_out.reshape(n_nodes, -1)
+        coords_data = np.zeros((n_nodes, n_dimension))
+        usecols = list(range(n_dimension)) + list(columns + n_dimension)
+        n_lines = max(1, _comsol_chunk_size // max(1, len(usecols)))
+
+        lines = itertools.chain([first_line], f)
+        row = 0
+        while usecols:
+            chunk = list(itertools.islice(lines, n_lines))
+            if not chunk:
+                break
+            if is_complex:
+                chunk = [line.replace('i', 'j') for line in chunk]
+            values = np.loadtxt(
+                chunk, dtype=dtype, comments='%', delimiter=delimiter,
+                usecols=usecols, ndmin=2)
+            if row + values.shape[0] > n_nodes:
+                break
+            coords_data[row:row + values.shape[0]] = np.real(
+                values[:, :n_dimension])
+            data_flat[row:row + values.shape[0], target_idx] = \
+                values[:, n_dimension:]
+            row += values.shape[0]
+
+    if usecols and (row != n_nodes or chunk):
+        raise ValueError((
+            f"The number of data lines in {filename} does not match the "
+            f"number of nodes ({n_nodes}) given in the header."))
+
+    # missing parameter combinations
+    filled = np.zeros(data_flat.shape[1], dtype=bool)
+    filled[target_idx] = True
+    if not np.all(filled) and parameters == all_parameters:
         warnings.warn(
-            r'The data contains values in dB. Consider to use de-logarithmize '
-            r'data, such as sound pressure, if possible. otherwise any '
-            r'further processing of the data might lead to erroneous results.')
-    header, is_complex, delimiter = _read_comsol_get_headerline(filename)
-
-    # set default variables
-    if expressions is None:
-        expressions = all_expressions.copy()
-    if parameters is None:
-        parameters = all_parameters.copy()
-
-    # get meta data
-    metadata = _read_comsol_metadata(filename)
-    n_dimension = metadata['Dimension']
-    n_nodes = metadata['Nodes']
-    n_entries = metadata['Expressions']
-
-    # read data
-    dtype = complex if is_complex else float
-    domain_str = domain if domain == 'freq' else 't'
-    raw_data = np.loadtxt(
-        filename, dtype=dtype, comments='%', delimiter=delimiter,
-        converters=lambda s: s.replace('i', 'j'), encoding=None)
-    # force raw_data to 2D
-    raw_data = np.reshape(raw_data, (n_nodes, n_entries+n_dimension))
-
-    # Define pattern for regular expressions, see test files for examples
-    exp_pattern = r'([\w\/\^\*\(\)_.]+) \('
-    domain_pattern = domain_str + r'=([0-9.]+)'
-    value_pattern = r'=([0-9.]+)'
-
-    # read parameter and header data
-    expressions_header = np.array(re.findall(exp_pattern, header))
-    domain_header = np.array(
-        [float(x) for x in re.findall(domain_pattern, header)])
-    parameter_header = dict()
-    for key in parameters:
-        parameter_header[key] = np.array(
-            [float(x) for x in re.findall(key+value_pattern, header)])
-
-    # final data shape
-    final_shape = [n_nodes, len(expressions)]
-    for key in parameters:
-        final_shape.append(len(parameters[key]))
-    final_shape.append(len(domain_data))
-
-    # temporary shape
-    n_combinations = np.prod(final_shape[2:-1]) if parameters else 1
-    temp_shape = [n_nodes, len(expressions), n_combinations, len(domain_data)]
-
-    # create pairs of parameter values
-    pairs = np.meshgrid(*[x for x in parameters.values()])
-    parameter_pairs = dict()
-    for idx, key in enumerate(parameters):
-        parameter_pairs[key] = pairs[idx].T.flatten()
-
-    # loop over expressions, domain, parameters
-    # extract the data by comparing with header
-    # first fill the array with temporary shape, then reshape
-    data_in = raw_data[:, -n_entries:]
-    data_out = np.full(temp_shape, np.nan, dtype=dtype)
-    for expression_idx, expression_key in enumerate(expressions):
-        expression_mask = expressions_header == expression_key
-        for parameter_idx in range(temp_shape[2]):
-            parameter_mask = np.full_like(expression_mask, True)
-            for key in parameters:
-                parameter_mask &= parameter_header[key] \
-                    == parameter_pairs[key][parameter_idx]
-            for domain_idx, domain_value in enumerate(domain_data):
-                domain_mask = domain_header == domain_value
-                mask = parameter_mask & domain_mask & expression_mask
-                if any(mask):
-                    data_out[:, expression_idx, parameter_idx, domain_idx] \
-                        = data_in[:, mask].flatten()
-                else:
-                    if parameters == all_parameters:
-                        warnings.warn(
-                            r'Specific combinations is set in the Parametric '
-                            r'Sweep in Comsol. Missing data is filled with '
-                            r'nans.')
-
-    # reshape data to final shape
-    data_out = np.reshape(data_out, final_shape)
+            r'Specific combinations is set in the Parametric '
+            r'Sweep in Comsol. Missing data is filled with '
+            r'nans.')
 
     # create object
     comment = ', '.join(' '.join(x) for x in zip(all_expressions, units))
@@ -715,7 +1220,6 @@ def read_comsol(filename, expressions=None, parameters=None):
 
     # create coordinates
     if n_dimension > 0:
-        coords_data = np.real(raw_data[:, 0:n_dimension])
         x = coords_data[:, 0]
         y = coords_data[:, 1] if n_dimension > 1 else np.zeros_like(x)
         z = coords_data[:, 2] if n_dimension > 2 else np.zeros_like(x)
@@ -799,8 +1303,14 @@ def read_comsol_header(filename):
             f"but is of type {str(suffix)}"))
 
     # read header
-    header, _, _ = _read_comsol_get_headerline(filename)
+    with open(filename) as f:
+        _, header, _ = _read_comsol_preamble(f, suffix)
+
+    return _read_comsol_parse_header(header)
+
 
+def _read_comsol_parse_header(header):
+    """Get expressions, units, parameters, and domain from the header line."""
     # Define pattern for regular expressions, see test files for examples
     exp_unit_pattern = r'([\w\(\)\/\^\*. ]+) @'
     exp_pattern = r'([\w\/\^\*\(\)_.]+) \('
@@ -847,24 +1357,39 @@ def read_comsol_header(filename):
     return expressions, units, parameters, domain, domain_data
 
 
-def _read_comsol_metadata(filename):
-    suffix = pathlib.Path(filename).suffix
+def _read_comsol_preamble(f, suffix):
+    """
+    Read the lines starting with % from an open file.
+
+    Returns the meta data, the header line (last line starting with %), and
+    the first data line. The file is read up to the first data line.
+    """
     metadata = dict()
+    header = []
     # loop over meta data lines (starting with %)
     number_names = ['Dimension', 'Nodes', 'Expressions']
-    with open(filename) as f:
-        for line in f.readlines():
-            if line[0] != '%':
-                break
-            elif any(n in line for n in number_names):
-                # character replacements, splits
-                line = line.lstrip('% ')
-                if suffix == '.csv':
-                    line = line.replace('"', '').split(',')
-                elif suffix in ['.dat', '.txt']:
-                    line = line.replace(',', ';').replace(':', ',').split(',')
-                metadata[line[0]] = int(line[-1])
-    return metadata
+    for line in f:
+        if not line.startswith('%'):
+            break
+        header = line
+        if any(n in line for n in number_names):
+            # character replacements, splits
+            line = line.lstrip('% ')
+            if suffix == '.csv':
+                line = line.replace('"', '').split(',')
+            elif suffix in ['.dat', '.txt']:
+                line = line.replace(',', ';').replace(':', ',').split(',')
+            metadata[line[0]] = int(line[-1])
+    else:
+        line = ''
+    return metadata, header, line
+
+
+def _read_comsol_index(values, selection):
+    """Index of each value in the selection or -1 if it is not selected."""
+    values = np.asarray(values)
+    match = values[:, np.newaxis] == np.asarray(selection)[np.newaxis, :]
+    return np.where(np.any(match, axis=1), np.argmax(match, axis=1), -1)
 
 
 def _unique_strings(expression_list):
@@ -873,18 +1398,3 @@ def _unique_strings(expression_list):
         if e not in unique:
             unique.append(e)
     return unique
-
-
-def _read_comsol_get_headerline(filename):
-    header = []
-    with open(filename) as f:
-        last_line = []
-        for line in f.readlines():
-            if not line.startswith('%'):
-                header = last_line
-                break
-            last_line = line
-
-    is_complex = 'i' in line
-    delimiter = ',' if ',' in line else None
-    return header, is_complex, delimiter
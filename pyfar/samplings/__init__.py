@@ -9,6 +9,7 @@ from .samplings import (
     cart_equidistant_cube, sph_dodecahedron, sph_icosahedron, sph_equiangular,
     sph_gaussian, sph_extremal, sph_t_design, sph_equal_angle,
     sph_great_circle, sph_lebedev, sph_fliege, sph_equal_area)
+from ._grid_store import set_grid_store, grid_store_info
 
 
 __all__ = [
@@ -26,4 +27,6 @@ __all__ = [
     'sph_great_circle',
     'sph_lebedev',
     'sph_fliege',
-    'sph_equal_area']
+    'sph_equal_area',
+    'set_grid_store',
+    'grid_store_info']
@@ -0,0 +1,292 @@
+"""
+Local store for sampling grids that are downloaded from external sources.
+
+All grids are kept in a single archive ``samplings_grids.npz`` inside the
+store directory. The archive contains one array per grid and the SHA-256
+checksums of all grids, which are verified when a grid is read. Grids that
+are not contained in the archive are downloaded from the original source or
+from a mirror and added to the archive. The archive is replaced atomically,
+so concurrent processes never read a partially written archive. Updates of
+the archive are guarded by a lock file, so grids that are added by
+concurrent processes are not lost. Grids that were read once are kept in
+memory.
+"""
+import os
+import json
+import hashlib
+import time
+import tempfile
+import threading
+import contextlib
+from functools import lru_cache
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+import numpy as np
+from pyfar._utils import _file_mode
+
+
+_default_directory = os.path.join(os.path.dirname(__file__), "external")
+_archive_name = "samplings_grids.npz"
+
+# original sources and number of columns of the grids
+_sources = {
+    'extremal': {
+        'url': "https://web.maths.unsw.edu.au/~rsw/Sphere/S2Pts/MD/",
+        'columns': 4},
+    't_design': {
+        'url': ("http://web.maths.unsw.edu.au/~rsw/Sphere/Points/SF/"
+                "SF29-Nov-2012/"),
+        'columns': 3},
+}
+
+_store = {'directory': _default_directory, 'url': None}
+_lock = threading.Lock()
+# seconds to wait for the lock file of the archive
+_lock_timeout = 60
+
+
+def set_grid_store(directory=None, url=None):
+    """
+    Set the location of the sampling grid store.
+
+    Grids for :py:func:`~sph_extremal` and :py:func:`~sph_t_design` are
+    downloaded only once and saved to a single archive in the store
+    directory. Grids are downloaded from the original sources unless a
+    mirror is given. This makes it possible to use the grids on machines
+    without internet access: Either copy the archive
+    ``samplings_grids.npz`` to the store directory or point `url` to a local
+    copy of the original grid files.
+
+    Parameters
+    ----------
+    directory : str, optional
+        Directory containing the archive. The directory is created if it does
+        not exist. The default ``None`` uses the directory
+        ``pyfar/samplings/external``.
+    url : str, optional
+        URL of a mirror of the original grid files, e.g.,
+        ``'file:///data/grids/'`` or ``'https://example.com/grids/'``. The
+        mirror must contain the files in a single directory using the
+        original file names, e.g., ``'md001.00004'`` (extremal) and
+        ``'sf001.00003'`` (t-design). The default ``None`` downloads the
+        grids from the original sources.
+
+    Examples
+    --------
+    Use grids that were copied to a shared directory
+
+    >>> import pyfar as pf
+    >>> pf.samplings.set_grid_store(url='file:///data/grids/')
+    >>> sampling = pf.samplings.sph_extremal(sh_order=10)
+    """
+    directory = _default_directory if directory is None else str(directory)
+    if url is not None and not str(url).endswith('/'):
+        url = str(url) + '/'
+
+    with _lock:
+        _store['directory'] = directory
+        _store['url'] = url
+        _read_grid.cache_clear()
+
+
+def grid_store_info():
+    """
+    Get information about the sampling grid store.
+
+    See :py:func:`~set_grid_store` for more information.
+
+    Returns
+    -------
+    info : dict
+        Dictionary with the keys ``'directory'`` (directory of the store),
+        ``'url'`` (URL of the mirror or ``None`` if the original sources are
+        used), ``'archive'`` (path to the archive), and ``'grids'`` (sorted
+        list with the names of the grids in the archive, e.g.,
+        ``'extremal_md001.00004'``).
+    """
+    with _lock:
+        directory, url = _store['directory'], _store['url']
+    archive = os.path.join(directory, _archive_name)
+    return {'directory': directory, 'url': url, 'archive': archive,
+            'grids': sorted(_read_checksums(archive))}
+
+
+def load(kind, filename):
+    """
+    Get a sampling grid from the store.
+
+    Parameters
+    ----------
+    kind : str
+        ``'extremal'`` or ``'t_design'``.
+    filename : str
+        Original file name of the grid, e.g., ``'md001.00004'``.
+
+    Returns
+    -------
+    grid : numpy array
+        The read-only grid of shape ``(n_points, n_columns)``.
+    """
+    with _lock:
+        directory, url = _store['directory'], _store['url']
+    return _read_grid(kind, filename, directory, url)
+
+
+def download(kind, filenames):
+    """
+    Add sampling grids to the store if they are not yet contained.
+
+    Parameters
+    ----------
+    kind : str
+        ``'extremal'`` or ``'t_design'``.
+    filenames : list of str
+        Original file names of the grids.
+    """
+    with _lock:
+        directory, url = _store['directory'], _store['url']
+    _download(kind, filenames, directory, url)
+
+
+def _download(kind, filenames, directory, url):
+    """Add missing grids to the archive in `directory`."""
+    archive = os.path.join(directory, _archive_name)
+
+    checksums = _read_checksums(archive)
+    missing = [f for f in filenames if f"{kind}_{f}" not in checksums]
+    if not missing:
+        return
+
+    grids = {}
+    for n, filename in enumerate(missing):
+        print(f'Loading file {n + 1}/{len(missing)}')
+        data = _fetch(kind, filename, directory, url)
+        grids[f"{kind}_{filename}"] = np.array(
+            data.decode().split(), dtype=np.double).reshape(
+                -1, _sources[kind]['columns'])
+
+    _write_archive(archive, grids)
+
+
+@lru_cache(maxsize=None)
+def _read_grid(kind, filename, directory, url):
+    """Read a grid from the archive and download it first if required."""
+    archive = os.path.join(directory, _archive_name)
+    name = f"{kind}_{filename}"
+
+    if name not in _read_checksums(archive):
+        _download(kind, [filename], directory, url)
+
+    with np.load(archive) as data:
+        checksums = json.loads(str(data['checksums']))
+        grid = data[name]
+
+    if _checksum(grid) != checksums[name]:
+        raise ValueError((
+            f"The checksum of the sampling grid '{name}' in {archive} does "
+            "not match. Delete the archive to download the grids again."))
+
+    grid.flags.writeable = False
+    return grid
+
+
+def _read_checksums(archive):
+    """Read the checksums of all grids contained in the archive."""
+    if not os.path.isfile(archive):
+        return {}
+    with np.load(archive) as data:
+        return json.loads(str(data['checksums']))
+
+
+def _write_archive(archive, grids):
+    """
+    Add grids to the archive. The archive is written to a temporary file
+    that replaces the old archive, which makes the update atomic.
+    """
+    directory = os.path.dirname(archive)
+    os.makedirs(directory, exist_ok=True)
+
+    checksums = {name: _checksum(grid) for name, grid in grids.items()}
+
+    with _archive_lock(archive):
+        # read the archive after locking it to keep grids that were added by
+        # other processes in the meantime. The checksums of stored grids are
+        # kept to not hide corrupted data
+        if os.path.isfile(archive):
+            with np.load(archive) as data:
+                stored = {key: data[key] for key in data.files
+                          if key != 'checksums'}
+                stored_checksums = json.loads(str(data['checksums']))
+            stored.update(grids)
+            stored_checksums.update(checksums)
+            grids, checksums = stored, stored_checksums
+
+        file, tmp = tempfile.mkstemp(suffix='.npz', dir=directory)
+        try:
+            with os.fdopen(file, 'wb') as f:
+                np.savez_compressed(
+                    f, checksums=np.array(json.dumps(checksums)), **grids)
+            os.chmod(tmp, _file_mode(archive))
+            os.replace(tmp, archive)
+        except BaseException:
+            os.remove(tmp)
+            raise
+
+
+@contextlib.contextmanager
+def _archive_lock(archive):
+    """
+    Lock the archive against updates from other processes and threads by
+    exclusively creating a lock file.
+    """
+    lock_file = archive + '.lock'
+    start = time.monotonic()
+    while True:
+        try:
+            os.close(os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            break
+        except FileExistsError:
+            if time.monotonic() - start > _lock_timeout:
+                raise TimeoutError((
+                    f"The sampling grid store is locked by {lock_file}. "
+                    "Delete the file if no other process is adding grids to "
+                    "the store."))
+            time.sleep(.1)
+    try:
+        yield
+    finally:
+        os.remove(lock_file)
+
+
+def _fetch(kind, filename, directory, url):
+    """
+    Get the content of an original grid file from a file that was
+    downloaded by earlier versions of pyfar, the mirror, or the original
+    source.
+    """
+    # files downloaded by pyfar <= 0.5
+    legacy = os.path.join(directory, f"samplings_{kind}_{filename}")
+    if os.path.isfile(legacy):
+        with open(legacy, 'rb') as f:
+            return f.read()
+
+    url = (_sources[kind]['url'] if url is None else url) + filename
+
+    if urlparse(url).scheme == 'file':
+        with open(url2pathname(urlparse(url).path), 'rb') as f:
+            return f.read()
+
+    # urllib3 is only imported if required to speed up importing pyfar
+    import urllib3
+    http = urllib3.PoolManager(cert_reqs=False)
+    http_data = http.urlopen('GET', url)
+    if http_data.status != 200:
+        raise ConnectionError(
+            "Connection error. Please check your internet connection.")
+    return http_data.data
+
+
+def _checksum(grid):
+    """SHA-256 checksum of a grid."""
+    return hashlib.sha256(
+        np.ascontiguousarray(grid, dtype=np.double).tobytes()).hexdigest()
@@ -1,10 +1,10 @@
 import numpy as np
-import urllib3
 import os
 import scipy.io as sio
 import pyfar
 
 from . import external
+from . import _grid_store
 
 
 def cart_equidistant_cube(n_points):
@@ -338,9 +338,9 @@ def sph_extremal(n_points=None, sh_order=None, radius=1.):
 
     Notes
     -----
-    This implementation uses precalculated sets of points from [#]_. The data
-    up to ``sh_order = 99`` are loaded the first time this function is called.
-    The remaining data is loaded upon request.
+    This implementation uses precalculated sets of points from [#]_. Each
+    grid is downloaded upon the first request and saved to the local grid
+    store (see :py:func:`set_grid_store`).
 
     References
     ----------
@@ -370,25 +370,9 @@ def sph_extremal(n_points=None, sh_order=None, radius=1.):
             raise ValueError('invalid value for n_points')
         sh_order = np.sqrt(n_points) - 1
 
-    # download data if necessary
-    filename = "samplings_extremal_md%03d.%05d" % (sh_order, n_points)
-    filename = os.path.join(os.path.dirname(__file__), "external",  filename)
-    if not os.path.exists(filename):
-        if sh_order < 100:
-            _sph_extremal_load_data('all')
-        else:
-            _sph_extremal_load_data(sh_order)
-
-    # open data
-    with open(filename, 'rb') as f:
-        file_data = f.read()
-
-    # format data
-    file_data = file_data.decode()
-    file_data = np.fromstring(
-        file_data,
-        dtype='double',
-        sep=' ').reshape((int(n_points), 4))
+    # get data from the grid store (downloads data if necessary)
+    file_data = _grid_store.load(
+        'extremal', "md%03d.%05d" % (sh_order, n_points))
 
     # normalize weights
     weights = file_data[:, 3] / 4 / np.pi
@@ -449,9 +433,9 @@ def sph_t_design(degree=None, sh_order=None, criterion='const_energy',
 
     Notes
     -----
-    This function downloads a pre-calculated set of points from [#]_ . The data
-    up to ``degree = 99`` are loaded the first time this function is called.
-    The remaining data is loaded upon request.
+    This function downloads a pre-calculated set of points from [#]_ . Each
+    grid is downloaded upon the first request and saved to the local grid
+    store (see :py:func:`set_grid_store`).
 
     References
     ----------
@@ -504,25 +488,8 @@ def sph_t_design(degree=None, sh_order=None, criterion='const_energy',
     if degree in n_points_exceptions:
         n_points = n_points_exceptions[degree]
 
-    # download data if neccessary
-    filename = "samplings_t_design_sf%03d.%05d" % (degree, n_points)
-    filename = os.path.join(os.path.dirname(__file__), "external",  filename)
-    if not os.path.exists(filename):
-        if degree < 100:
-            _sph_t_design_load_data('all')
-        else:
-            _sph_t_design_load_data(degree)
-
-    # open data
-    with open(filename, 'rb') as f:
-        file_data = f.read()
-
-    # format data
-    file_data = file_data.decode()
-    points = np.fromstring(
-        file_data,
-        dtype=np.double,
-        sep=' ').reshape((n_points, 3))
+    # get data from the grid store (downloads data if necessary)
+    points = _grid_store.load('t_design', "sf%03d.%05d" % (degree, n_points))
 
     # generate Coordinates object
     sampling = pyfar.Coordinates(
@@ -985,7 +952,7 @@ def sph_equal_area(n_points, radius=1.):
 
 
 def _sph_extremal_load_data(orders='all'):
-    """Download extremal sampling grids.
+    """Download extremal sampling grids to the grid store.
 
     orders = 'all' : load all samplings up to SH order 99
     orders = int, list : load sampling of specified SH order(s)
@@ -1003,34 +970,12 @@ def _sph_extremal_load_data(orders='all'):
         https://web.maths.unsw.edu.au/~rsw/Sphere/MaxDet/. \
         This might take a while but is only done once.")
 
-    http = urllib3.PoolManager(cert_reqs=False)
-    prefix = 'samplings_extremal_'
-
-    for sh_order in orders:
-        # number of sampling points
-        n_points = (sh_order + 1)**2
-
-        # load the data
-        filename = "md%03d.%05d" % (sh_order, n_points)
-        url = "https://web.maths.unsw.edu.au/~rsw/Sphere/S2Pts/MD/"
-        fileurl = url + filename
-
-        http_data = http.urlopen('GET', fileurl)
-
-        # save the data
-        if http_data.status == 200:
-            save_name = os.path.join(
-                os.path.dirname(__file__), "external", prefix + filename)
-            print(f'Loading file {sh_order}/{len(orders)}')
-            with open(save_name, 'wb') as out:
-                out.write(http_data.data)
-        else:
-            raise ConnectionError(
-                "Connection error. Please check your internet connection.")
+    _grid_store.download('extremal', [
+        "md%03d.%05d" % (sh_order, (sh_order + 1)**2) for sh_order in orders])
 
 
 def _sph_t_design_load_data(degrees='all'):
-    """Download t-design sampling grids.
+    """Download t-design sampling grids to the grid store.
 
     degrees = 'all' : load all samplings up to degree 99
     degrees = number : load sampling of specified degree
@@ -1048,32 +993,14 @@ def _sph_t_design_load_data(degrees='all'):
         https://web.maths.unsw.edu.au/~rsw/Sphere/EffSphDes/sf.html. \
         This might take a while but is only done once.")
 
-    http = urllib3.PoolManager(cert_reqs=False)
-    prefix = 'samplings_t_design_'
-
     n_points_exceptions = {3: 8, 5: 18, 7: 32, 9: 50, 11: 72, 13: 98, 15: 128}
 
+    filenames = []
     for degree in degrees:
         # number of sampling points
         n_points = int(np.ceil((degree + 1)**2 / 2) + 1)
         if degree in n_points_exceptions:
             n_points = n_points_exceptions[degree]
+        filenames.append("sf%03d.%05d" % (degree, n_points))
 
-        # load the data
-        filename = "sf%03d.%05d" % (degree, n_points)
-        url = "http://web.maths.unsw.edu.au/~rsw/Sphere/Points/SF/"\
-              "SF29-Nov-2012/"
-        fileurl = url + filename
-
-        http_data = http.urlopen('GET', fileurl)
-
-        # save the data
-        if http_data.status == 200:
-            save_name = os.path.join(
-                os.path.dirname(__file__), "external", prefix + filename)
-            print(f'Loading file {degree}/{len(degrees)}')
-            with open(save_name, 'wb') as out:
-                out.write(http_data.data)
-        else:
-            raise ConnectionError(
-                "Connection error. Please check your internet connection.")
+    _grid_store.download('t_design', filenames)
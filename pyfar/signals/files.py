@@ -12,24 +12,217 @@ Quick listening is, e.g., possible with `sounddevice
 >>> speech = pf.signals.files.speech()
 >>> pf.plot.spectrogram(speech)
 >>> sd.play(speech.time.T, speech.sampling_rate)
+
+Data that is resampled to a sampling rate other than the original sampling
+rate is saved to a cache on disk, which makes repeated calls fast. The
+location and size of the cache can be changed with :py:func:`set_cache`.
 """
 import os
+import glob
+import json
+import hashlib
+import inspect
+import tempfile
+import warnings
+import zipfile
+import functools
 import numpy as np
 
-import urllib3
-from urllib3.exceptions import InsecureRequestWarning
-from urllib3 import disable_warnings
-
 import pyfar as pf
+from pyfar._utils import _file_mode
 
-# disable warning about non-certified connection
-disable_warnings(InsecureRequestWarning)
 # path for saving/reading files
 file_dir = os.path.join(os.path.dirname(__file__), 'files')
 if not os.path.isdir(file_dir):
     os.mkdir(file_dir)
 
+# location and maximum size in bytes of the cache for resampled data
+_cache = {'directory': os.path.join(file_dir, 'cache'), 'maxsize': 2**28}
+
+
+def set_cache(directory=None, maxsize=2**28):
+    """
+    Set the location and size of the cache for resampled data.
+
+    Data that is requested at a sampling rate other than the original
+    sampling rate of the data is resampled once and saved to the cache as a
+    ``.far`` file (see :py:func:`pyfar.io.write`). The cache is identified by
+    the function, sampling rate, and all other parameters, e.g., the
+    positions of head-related impulse responses. Files are written
+    atomically, which makes it possible to share the cache between
+    processes. The least recently used files are deleted if the size of the
+    cache exceeds `maxsize`.
+
+    Parameters
+    ----------
+    directory : str, optional
+        The directory of the cache. It is created if it does not exist. The
+        default ``None`` uses the sub-directory ``cache`` of the directory
+        that contains the data.
+    maxsize : int, optional
+        The maximum size of the cache in bytes. ``0`` disables the cache. The
+        default is ``2**28`` (256 MiB).
+
+    Examples
+    --------
+    Use a cache of 1 GiB in the home directory
+
+    >>> import pyfar as pf
+    >>> import os
+    >>> pf.signals.files.set_cache(
+    ...     os.path.join(os.path.expanduser('~'), '.pyfar_cache'), 2**30)
+    """
+    if not isinstance(maxsize, int) or isinstance(maxsize, bool) \
+            or maxsize < 0:
+        raise ValueError("maxsize must be a non-negative integer")
+
+    _cache['directory'] = os.path.join(file_dir, 'cache') \
+        if directory is None else str(directory)
+    _cache['maxsize'] = maxsize
+    _evict_cache()
+
+
+def cache_info():
+    """
+    Get information about the cache for resampled data.
+
+    See :py:func:`set_cache` for more information.
+
+    Returns
+    -------
+    info : dict
+        Dictionary with the keys ``'directory'`` (directory of the cache),
+        ``'maxsize'`` (maximum size in bytes), ``'currsize'`` (current size
+        in bytes), and ``'files'`` (number of cached files).
+    """
+    files = _cache_files()
+    return {'directory': _cache['directory'], 'maxsize': _cache['maxsize'],
+            'currsize': sum(size for _, _, size in files),
+            'files': len(files)}
+
 
+def clear_cache():
+    """
+    Delete all files from the cache for resampled data.
+
+    See :py:func:`set_cache` for more information.
+    """
+    for file, _, _ in _cache_files():
+        try:
+            os.remove(file)
+        except FileNotFoundError:
+            # deleted by another process
+            pass
+
+
+def _cached(sampling_rate_data):
+    """
+    Decorate a function to cache its output if the requested sampling rate
+    differs from the original sampling rate `sampling_rate_data` of the data.
+    """
+    def decorator(function):
+        signature = inspect.signature(function)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            parameters = signature.bind(*args, **kwargs)
+            parameters.apply_defaults()
+            parameters = parameters.arguments
+
+            if parameters['sampling_rate'] == sampling_rate_data \
+                    or _cache['maxsize'] == 0:
+                return function(*args, **kwargs)
+
+            # identify the cached data by the function and its parameters
+            key = json.dumps(
+                [function.__name__, parameters], sort_keys=True,
+                default=lambda value: np.asarray(value).tolist())
+            key = hashlib.sha256(key.encode()).hexdigest()[:32]
+            filename = os.path.join(
+                _cache['directory'], f"{function.__name__}_{key}.far")
+
+            try:
+                data = pf.io.read(filename)
+                # mark the file as recently used
+                os.utime(filename)
+            except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+                # file does not exist or can not be read
+                data = None
+
+            if data is not None:
+                if 'result' in data:
+                    return data['result']
+                return tuple(data[f'result_{n}'] for n in range(len(data)))
+
+            result = function(*args, **kwargs)
+            if isinstance(result, tuple):
+                _write_cache(filename, **{
+                    f'result_{n}': r for n, r in enumerate(result)})
+            else:
+                _write_cache(filename, result=result)
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def _write_cache(filename, **objs):
+    """
+    Write objects to the cache. The data is written to a temporary file that
+    is renamed afterwards to not expose incomplete files to other processes.
+    """
+    directory = os.path.dirname(filename)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        file, tmp = tempfile.mkstemp(
+            prefix='.tmp_', suffix='.far', dir=directory)
+        os.close(file)
+        try:
+            pf.io.write(tmp, **objs)
+            os.chmod(tmp, _file_mode(filename))
+            os.replace(tmp, filename)
+        finally:
+            if os.path.isfile(tmp):
+                os.remove(tmp)
+    except OSError as error:
+        warnings.warn(
+            f"Resampled data could not be written to the cache: {error}")
+        return
+
+    _evict_cache()
+
+
+def _evict_cache():
+    """Delete least recently used files until the cache is small enough."""
+    files = sorted(_cache_files(), key=lambda file: file[1])
+    size = sum(size for _, _, size in files)
+    for file, _, file_size in files:
+        if size <= _cache['maxsize']:
+            break
+        try:
+            os.remove(file)
+        except FileNotFoundError:
+            # deleted by another process
+            pass
+        size -= file_size
+
+
+def _cache_files():
+    """List (filename, time of last use, size) for all cached files."""
+    files = []
+    for file in glob.glob(os.path.join(_cache['directory'], '*.far')):
+        try:
+            stat = os.stat(file)
+        except FileNotFoundError:
+            # deleted by another process
+            continue
+        files.append((file, stat.st_mtime, stat.st_size))
+    return files
+
+
+@_cached(44100)
 def castanets(sampling_rate=44100):
     """
     Get an anechoic castanet sample.
@@ -74,6 +267,7 @@ def castanets(sampling_rate=44100):
     return castanets
 
 
+@_cached(48000)
 def drums(sampling_rate=48000):
     """
     Get a dry drum sample.
@@ -116,6 +310,7 @@ def drums(sampling_rate=48000):
     return drums
 
 
+@_cached(48000)
 def guitar(sampling_rate=48000):
     """
     Get an anechoic guitar sample.
@@ -164,6 +359,7 @@ def guitar(sampling_rate=48000):
     return guitar
 
 
+@_cached(44100)
 def speech(voice="female", sampling_rate=44100):
     """
     Get an anechoic speech sample.
@@ -219,6 +415,7 @@ def speech(voice="female", sampling_rate=44100):
     return speech
 
 
+@_cached(48000)
 def binaural_room_impulse_response(
         diffuse_field_compensation=False, sampling_rate=48000):
     """
@@ -285,6 +482,7 @@ def binaural_room_impulse_response(
     return brir
 
 
+@_cached(44100)
 def headphone_impulse_responses(sampling_rate=44100):
     """
     Get Headphone Impulse Responses (HpIRs).
@@ -327,6 +525,7 @@ def headphone_impulse_responses(sampling_rate=44100):
     return hpirs
 
 
+@_cached(44100)
 def head_related_impulse_responses(
         position=[[0, 0]], diffuse_field_compensation=False,
         sampling_rate=44100):
@@ -434,6 +633,7 @@ def head_related_impulse_responses(
     return hrirs, sources
 
 
+@_cached(48000)
 def room_impulse_response(sampling_rate=48000):
     """
     Get a room impulse response (RIR).
@@ -516,6 +716,11 @@ def _load_files(data):
     # download files
     print(f"Loading {data} data. This is only done once.")
 
+    # urllib3 is only imported if required to speed up importing pyfar
+    import urllib3
+    # disable warning about non-certified connection
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
     http = urllib3.PoolManager(cert_reqs=False)
     url = 'https://pyfar.org/wp-content/uploads/pyfar_files/'
 
@@ -45,6 +45,13 @@ def test_data_frequency_init_dtype():
     it is called during initialization)
     """
 
+    # single precision
+    data = FrequencyData([1, 2, 3], [1, 2, 3], dtype=np.float32)
+    assert data.freq.dtype == np.float32
+    data.freq = [1+1j, 2+2j, 3+3j]
+    assert data.freq.dtype == np.complex64
+    assert data[0].dtype == np.float32
+
     # integer to float casting
     data = FrequencyData([1, 2, 3], [1, 2, 3])
     assert data.freq.dtype.kind == "f"
@@ -80,6 +80,56 @@ def test_data_frequency_init_dtype():
         Signal(["1", "2", "3"], 44100, 4, "freq")
 
 
+@pytest.mark.parametrize("dtype, complex_dtype", [
+    (np.float64, np.complex128), (np.float32, np.complex64),
+    ('float32', np.complex64)])
+@pytest.mark.parametrize("fft_norm", ['none', 'rms', 'power'])
+def test_signal_dtype(dtype, complex_dtype, fft_norm):
+    """Test that the precision is kept across domains and normalizations."""
+    signal = Signal([1, 2, 3, 4], 44100, fft_norm=fft_norm, dtype=dtype)
+    assert signal.dtype == np.dtype(dtype).type
+    assert signal.time.dtype == dtype
+    assert signal.freq_raw.dtype == complex_dtype
+    assert signal.freq.dtype == complex_dtype
+    assert signal.time.dtype == dtype
+
+    # setting data keeps the precision
+    signal.freq = [1, 2, 3]
+    assert signal.freq_raw.dtype == complex_dtype
+    signal.freq_raw = np.array([1, 2, 3], dtype=complex)
+    assert signal.freq_raw.dtype == complex_dtype
+    signal.time = np.array([1, 2, 3, 4], dtype=np.float64)
+    assert signal.time.dtype == dtype
+
+    # slicing keeps the precision
+    assert signal[0].dtype == signal.dtype
+
+
+def test_signal_dtype_numpy_backend():
+    """Test that the precision is kept by FFT backends working in double."""
+    with pf.dsp.fft.options(backend='numpy'):
+        signal = Signal([1, 2, 3, 4], 44100, dtype=np.float32)
+        assert signal.freq.dtype == np.complex64
+        assert signal.time.dtype == np.float32
+
+
+def test_signal_dtype_setter():
+    """Test converting the precision of an existing signal."""
+    signal = Signal([1, 2, 3, 4], 44100)
+    signal.cache_domains = True
+    signal.freq
+    signal.dtype = np.float32
+    assert signal.freq_raw.dtype == np.complex64
+    assert signal.time.dtype == np.float32
+    npt.assert_allclose(signal.time, [[1, 2, 3, 4]], rtol=1e-6)
+
+
+@pytest.mark.parametrize("dtype", [np.complex64, np.int32, 'bla'])
+def test_signal_dtype_errors(dtype):
+    with pytest.raises(ValueError, match="dtype must be numpy.float64 or"):
+        Signal([1, 2, 3, 4], 44100, dtype=dtype)
+
+
 def test_signal_comment():
     signal = Signal([1, 2, 3], 44100, comment='Bla')
     assert signal.comment == 'Bla'
@@ -507,3 +557,81 @@ def test_setter_freq_raw_dtype():
     # object array
     with pytest.raises(ValueError, match="frequency data is"):
         signal.freq_raw = ["1", "2", "3"]
+
+
+def test_cache_domains():
+    """Test caching the data in the time and frequency domain."""
+    signal = pf.signals.noise(128, seed=1)
+    assert signal.cache_domains is False
+    signal.cache_domains = True
+
+    time = signal.time.copy()
+    freq = signal.freq_raw.copy()
+    assert signal._cached_data is not None
+    # cached data is swapped and read-only
+    npt.assert_array_equal(signal.time, time)
+    assert signal._data is not time
+    assert not signal.time.flags.writeable
+    with pytest.raises(ValueError, match="read-only"):
+        signal.time[..., 0] = 1
+    npt.assert_array_equal(signal.freq_raw, freq)
+
+    # setting the data discards the cache
+    signal.time = time
+    assert signal._cached_data is None
+    assert signal.time.flags.writeable
+
+    # setting channels discards the cache
+    signal.freq_raw
+    signal.time
+    other = pf.signals.noise(128, seed=2)
+    signal[0] = other
+    assert signal._cached_data is None
+    npt.assert_array_equal(signal.time, other.time)
+
+    # disabling the cache discards it
+    signal.freq_raw
+    signal.time
+    signal.cache_domains = False
+    assert signal._cached_data is None
+    assert signal.time.flags.writeable
+
+    with pytest.raises(TypeError, match="must be a bool"):
+        signal.cache_domains = 1
+
+
+def test_cache_domains_edit_then_switch():
+    """Test that arrays returned before caching do not change the signal."""
+    signal = pf.signals.noise(128, seed=1)
+    reference = signal.copy()
+    signal.cache_domains = True
+
+    time = signal.time
+    assert time.flags.writeable
+    signal.freq_raw
+    time[..., :10] = 0
+    npt.assert_array_equal(signal.time, reference.time)
+    npt.assert_array_equal(signal.freq_raw, reference.freq_raw)
+
+
+def test_cache_domains_does_not_lock_input():
+    data = np.ones((1, 8))
+    signal = Signal(data, 44100)
+    signal.cache_domains = True
+    signal.freq_raw
+    assert data.flags.writeable
+
+
+def test_cache_domains_copy_and_equality():
+    signal = pf.signals.noise(128, seed=1)
+    signal.cache_domains = True
+    signal.freq_raw
+    signal.time
+
+    copied = signal.copy()
+    assert copied._cached_data is None
+    assert copied.cache_domains
+    assert copied.time.flags.writeable
+    assert signal == copied
+    assert signal == pf.signals.noise(128, seed=1)
+    assert '_cached_data' not in signal._encode()
@@ -756,3 +756,24 @@ def test_matrix_multiplication_undocumented():
     y = np.ones((3, 2, 10)) * np.array([[1, 2], [3, 4], [5, 6]])[..., None]
     pf.matrix_multiplication(
         (x, y), domain='time', axes=[(-2, -1), (-3, -2), (-2, -1)])
+
+
+@pytest.mark.parametrize("audio", [
+    Signal([1, 2, 3], 44100), TimeData([1, 2, 3], [1, 2, 3]),
+    FrequencyData([1, 2, 3], [1, 2, 3])])
+def test_arithmetic_dtype(audio):
+    """Test that single precision is kept only for single precision inputs."""
+    domain = 'time' if isinstance(audio, TimeData) else 'freq'
+    single = audio.copy()
+    single.dtype = np.float32
+
+    # single precision is kept with array likes
+    result = pf.add((single, np.ones(3)), domain)
+    assert result.dtype == np.float32
+    assert result._data.dtype in [np.float32, np.complex64]
+    result = pf.multiply((single, single), domain)
+    assert result.dtype == np.float32
+
+    # double precision if any audio object is double precision
+    result = pf.add((single, audio), domain)
+    assert result.dtype == np.float64
@@ -31,6 +31,15 @@ def test_data_time_init_wrong_dtype():
         TimeData(np.arange(2).astype(complex), [0, 1])
 
 
+def test_data_time_init_single_precision():
+    """Test that single precision is kept by the time setter."""
+    data = TimeData([1, 2, 3], [0, 1, 2], dtype=np.float32)
+    assert data.dtype == np.float32
+    assert data.time.dtype == np.float32
+    data.time = np.array([1, 2, 3], dtype=np.float64)
+    assert data.time.dtype == np.float32
+
+
 def test_data_time_init_wrong_number_of_times():
     """Test if entering a wrong number of times raises an assertion."""
     data = [1, 0, -1]
@@ -509,6 +509,125 @@ def test_find_nearest_k():
     plt.close("all")
 
 
+def test_find_nearest():
+    """Test batched search of nearest points."""
+    x = np.arange(6)
+    coords = Coordinates(x, 0, 0)
+
+    # single point
+    distance, index = coords.find_nearest(Coordinates(1.2, 0, 0))
+    npt.assert_allclose(distance, [.2])
+    npt.assert_equal(index, [1])
+
+    # multidimensional query in another coordinate system
+    find = Coordinates([[0, 0], [0, 0]], 0, [[1.2, 2.1], [3.9, 5]],
+                       'sph', 'top_elev')
+    distance, index = coords.find_nearest(find)
+    assert index.shape == (2, 2)
+    npt.assert_equal(index, [[1, 2], [4, 5]])
+    npt.assert_allclose(distance, [[.2, .1], [.1, 0]], atol=1e-14)
+
+    # k nearest points
+    distance, index = coords.find_nearest(find, k=2, workers=-1)
+    assert index.shape == (2, 2, 2)
+    npt.assert_equal(index[0, 0], [1, 2])
+    npt.assert_allclose(distance[0, 0], [.2, .8])
+
+    # assertions
+    with raises(ValueError, match="find must be"):
+        coords.find_nearest([1, 0, 0])
+    with raises(ValueError, match="k must be"):
+        coords.find_nearest(find, k=7)
+
+
+def test_kdtree_cache():
+    """Test that the search tree is reused until the points change."""
+    coords = Coordinates(np.arange(6), 0, 0)
+    coords.find_nearest_k(1, 0, 0)
+    kdtree = coords._kdtree
+    assert kdtree is not None
+    coords.find_nearest(Coordinates(1, 0, 0))
+    assert coords._kdtree is kdtree
+
+    # copies and slices are equal but do not share the tree
+    assert coords.copy()._kdtree is None
+    assert coords.copy() == coords
+    assert coords[:3]._kdtree is None
+    assert coords[:3].find_nearest_k(5, 0, 0)[0] == 2
+
+    # the tree is discarded if the points change
+    coords.rotate('z', 90)
+    assert coords._kdtree is None
+    npt.assert_equal(coords.find_nearest_k(0, 1, 0)[0], 1)
+    coords.set_sph(np.pi, np.pi / 2, np.arange(6))
+    npt.assert_equal(coords.find_nearest_k(-1, 0, 0)[0], 1)
+    coords.set_cyl(0, 0, np.arange(6))
+    npt.assert_equal(coords.find_nearest_k(1, 0, 0)[0], 1)
+    coords.set_cart(0, 0, np.arange(6))
+    npt.assert_equal(coords.find_nearest_k(0, 0, 4)[0], 4)
+
+
+def test_systems_are_cached():
+    """Test that the systems are made once and can not be changed."""
+    coords = Coordinates()
+    assert coords._systems() is Coordinates._systems()
+    with raises(TypeError, match="read-only"):
+        coords._systems()['cart'] = {}
+    with raises(TypeError, match="read-only"):
+        coords._systems()['sph']['top_colat']['units'] = []
+    with raises(TypeError):
+        coords._systems()['sph']['top_colat']['units'][0][0] = 'meters'
+
+    # made systems are equal but independent
+    system = coords._make_system('sph', 'top_elev', 'deg')
+    assert system == coords._make_system('sph', 'top_elev', 'deg')
+    system['unit'] = 'rad'
+    system['units'][0] = 'radians'
+    assert coords._make_system('sph', 'top_elev', 'deg')['unit'] == 'deg'
+    assert coords._make_system('sph', 'top_elev', 'deg')['units'][0] == \
+        'degrees'
+
+
+def test_converted_points_cache():
+    """Test that converted points are reused until the points change."""
+    coords = Coordinates([1, 0, -1], [0, 1, 0], 0)
+    sph = coords.get_sph('top_elev', 'deg')
+    key = ('sph', 'top_elev', 'deg')
+    assert not np.shares_memory(
+        coords.get_sph('top_elev', 'deg'), coords._converted_points[key])
+    assert not coords._converted_points[key].flags.writeable
+    npt.assert_allclose(sph[:, 0], [0, 90, 180], atol=1e-12)
+    # returned points can be changed without changing the cache
+    assert sph.flags.writeable
+    sph[..., 2] *= 2
+    npt.assert_allclose(coords.get_sph('top_elev', 'deg')[:, 2], 1)
+    # points in the stored system are not cached
+    assert coords.get_cart().flags.writeable
+    # other systems are cached separately
+    assert ('sph', 'top_elev', 'rad') not in coords._converted_points
+    coords.get_sph('top_elev', 'rad')
+    assert ('sph', 'top_elev', 'rad') in coords._converted_points
+
+    # copies and slices do not share the converted points
+    assert coords.copy()._converted_points == {}
+    assert coords.copy() == coords
+    assert coords[0]._converted_points == {}
+
+    # converted points are discarded if the points change
+    coords.rotate('z', 90)
+    sph_rotated = coords.get_sph('top_elev', 'deg')
+    npt.assert_allclose(sph_rotated[:, 0], [90, 180, 270], atol=1e-12)
+    coords.set_cart([0, 0, 0], [0, 0, 0], [1, 2, 3])
+    npt.assert_allclose(
+        coords.get_sph('top_elev', 'deg')[:, 1], [90, 90, 90])
+
+    # conversion of the internal state
+    cyl = coords.get_cyl()
+    coords.get_cyl(convert=True)
+    assert coords._converted_points == {}
+    npt.assert_allclose(coords.get_cyl(), cyl)
+
+
 def test_find_nearest_cart():
     """Tests returns of find_nearest_cart."""
     # test only 1D case since most of the code from self.find_nearest_k is used
@@ -306,6 +306,52 @@ def test_time_shift_multi_dim(shift_samples):
     npt.assert_allclose(shifted.time, ref.time, atol=1e-16)
 
 
+@pytest.mark.parametrize("mode", ["cyclic", "linear"])
+def test_time_shift_channels(mode):
+    """Test individual shifts of many channels against a loop over channels"""
+    rng = np.random.default_rng(0)
+    signal = pf.Signal(rng.standard_normal((4, 25, 32)), 44100)
+    shift = rng.integers(-32, 33, signal.cshape)
+
+    shifted = dsp.time_shift(signal, shift, mode)
+
+    for ch in np.ndindex(signal.cshape):
+        reference = np.roll(signal.time[ch], shift[ch])
+        if mode == "linear" and shift[ch] > 0:
+            reference[:shift[ch]] = 0
+        elif mode == "linear" and shift[ch] < 0:
+            reference[shift[ch]:] = 0
+        npt.assert_equal(shifted.time[ch], reference)
+
+
+def test_time_shift_inplace():
+    """Test shifting the input signal"""
+    signal = impulse(10, delay=2, amplitude=np.ones(3))
+    shifted = dsp.time_shift(signal, [1, 2, 3])
+    assert shifted is not signal
+    npt.assert_equal(signal.time, impulse(10, 2, np.ones(3)).time)
+
+    shifted_inplace = dsp.time_shift(signal, [1, 2, 3], inplace=True)
+    assert shifted_inplace is signal
+    assert shifted_inplace == shifted
+
+
+def test_time_shift_nan():
+    """Test padding NaNs with and without shifting the input signal"""
+    signal = impulse(10, delay=2, amplitude=np.ones(3))
+    signal.dtype = np.float32
+    reference = signal.copy()
+
+    shifted = dsp.time_shift(signal, 2, 'linear', pad_value=np.nan)
+    assert type(shifted) is pf.TimeData
+    assert shifted.dtype == np.float32
+    assert np.all(np.isnan(shifted.time[..., :2]))
+
+    with pytest.raises(ValueError, match="contains NaNs"):
+        dsp.time_shift(signal, 2, 'linear', pad_value=np.nan, inplace=True)
+    assert signal == reference
+
+
 def test_time_shift_assertions():
     """Test assertions for shift_time"""
 
@@ -636,6 +682,37 @@ def test_impulse_response_delay_sinc():
     npt.assert_allclose(start_samples, delay_samples, atol=1e-3, rtol=1e-4)
 
 
+def test_impulse_response_delay_fft_options():
+    """Test that the delay does not depend on the FFT options"""
+    ir = pf.dsp.fractional_time_shift(
+        pf.signals.impulse(256, amplitude=np.ones(3)), [20.3, 41.7, 60.5])
+    start_samples = dsp.find_impulse_response_delay(ir)
+
+    with pf.dsp.fft.options(backend='numpy'):
+        npt.assert_allclose(
+            dsp.find_impulse_response_delay(ir), start_samples, atol=1e-10)
+    with pf.dsp.fft.options(workers=2):
+        npt.assert_allclose(
+            dsp.find_impulse_response_delay(ir), start_samples, atol=1e-10)
+
+
+def test_impulse_response_delay_fft_options_threads(monkeypatch):
+    """Test that the FFT options are applied in parallel jobs"""
+    options = []
+
+    def find_delay(time, N):
+        options.append(pf.dsp.fft.get_options())
+        return np.zeros(time.shape[0])
+
+    monkeypatch.setattr(pf.dsp.dsp, '_find_impulse_response_delay', find_delay)
+    ir = pf.signals.impulse(2**17, amplitude=np.ones(4))
+    with pf.dsp.fft.options(backend='numpy', workers=1):
+        dsp.find_impulse_response_delay(ir, workers=2)
+
+    assert len(options) == 2
+    assert all(o == {'backend': 'numpy', 'workers': 1} for o in options)
+
+
 def test_impulse_response_delay_multidim():
     """Ideal multi-dimensional Signal of ideal impulses"""
     n_samples = 2**10
@@ -652,6 +729,27 @@ def test_impulse_response_delay_multidim():
     npt.assert_allclose(start_sample_est, start_sample, atol=1e-2)
 
 
+@pytest.mark.parametrize("workers", [1, 2])
+def test_impulse_response_delay_channels(workers):
+    """Test many channels against processing the channels individually"""
+    delays = np.linspace(20, 80, 600).reshape(20, 30)
+    ir = pf.dsp.fractional_time_shift(
+        pf.signals.impulse(2**10, amplitude=np.ones(delays.shape)), delays)
+
+    start_sample_est = dsp.find_impulse_response_delay(ir, workers=workers)
+
+    assert start_sample_est.shape == ir.cshape
+    for ch in [(0, 0), (7, 11), (19, 29)]:
+        npt.assert_allclose(
+            start_sample_est[ch],
+            dsp.find_impulse_response_delay(ir[ch])[0], atol=1e-10)
+
+
+def test_impulse_response_delay_workers_error():
+    with pytest.raises(ValueError, match="workers must be -1"):
+        dsp.find_impulse_response_delay(pf.signals.impulse(64), workers=0)
+
+
 def test_impulse_response_start_insufficient_snr():
     n_samples = 2**9
     snr = 15
@@ -805,3 +903,62 @@ def test_convolve_method_error():
 
     with pytest.raises(ValueError, match='Invalid method'):
         dsp.convolve(x, y, method='invalid')
+
+
+@pytest.mark.parametrize('block_size', [1, 7, 64, 1000])
+@pytest.mark.parametrize('cshapes', [
+    [(1, ), (1, )], [(2, ), (2, )], [(3, 2), (2, )], [(2, ), (3, 2)],
+    [(3, 1), (1, 2)]])
+def test_convolver(block_size, cshapes):
+    """Test the block-wise convolution against the full convolution."""
+    # input signal with zeros appended to obtain the tail of the convolution
+    signal = pf.signals.noise(300, rms=np.ones(cshapes[0]), seed=1)
+    signal = dsp.pad_zeros(signal, 129)
+    rir = pf.signals.noise(130, rms=np.ones(cshapes[1]), seed=2)
+    rir.fft_norm = 'none'
+
+    # reference
+    x = signal.time
+    h = rir.time
+    ndim = max(x.ndim, h.ndim)
+    x = x.reshape((1, ) * (ndim - x.ndim) + x.shape)
+    h = h.reshape((1, ) * (ndim - h.ndim) + h.shape)
+    desired = sgn.fftconvolve(x, h, axes=-1)[..., :signal.n_samples]
+
+    convolver = dsp.Convolver(rir, block_size)
+    assert convolver.n_partitions == int(np.ceil(130 / block_size))
+    blocks = [convolver(signal[..., n:n+block_size])
+              for n in range(0, signal.n_samples, block_size)]
+    for block in blocks:
+        assert block.fft_norm == 'rms'
+    actual = np.concatenate([block.time for block in blocks], axis=-1)
+    npt.assert_allclose(actual, desired, atol=1e-12)
+
+
+def test_convolver_reset():
+    signal = pf.signals.noise(64, seed=1)
+    convolver = dsp.Convolver(pf.signals.impulse(10, 2), 16)
+    first = convolver(signal[..., :16])
+    convolver(signal[..., 16:32])
+    convolver.reset()
+    npt.assert_array_equal(convolver(signal[..., :16]).time, first.time)
+
+
+def test_convolver_assertions():
+    with pytest.raises(ValueError, match="must be a Signal"):
+        dsp.Convolver([1, 0, 0], 16)
+    with pytest.raises(ValueError, match="positive integer"):
+        dsp.Convolver(pf.signals.impulse(10), 0)
+
+    convolver = dsp.Convolver(pf.signals.impulse(10, amplitude=[1, 1]), 4)
+    with pytest.raises(ValueError, match="must be a Signal"):
+        convolver([1, 2, 3, 4])
+    with pytest.raises(ValueError, match="sampling rates"):
+        convolver(pf.signals.impulse(4, sampling_rate=48000))
+    with pytest.raises(ValueError, match="block size"):
+        convolver(pf.signals.impulse(5))
+    with pytest.raises(ValueError, match="can not be broadcasted"):
+        convolver(pf.signals.impulse(4, amplitude=[1, 1, 1]))
+    convolver(pf.signals.impulse(4))
+    with pytest.raises(ValueError, match="Call reset"):
+        convolver(pf.signals.impulse(4, amplitude=[1, 1]))
@@ -71,6 +71,44 @@ def test_smooth_fractional_octave_num_fractions(num_fractions):
     npt.assert_allclose(smoothed.time.flatten(), reference)
 
 
+@pytest.mark.parametrize("mode", ("magnitude", "complex"))
+def test_smooth_fractional_octave_channels(mode):
+    """
+    Test smoothing many channels at once against smoothing the channels
+    individually and the reuse of the smoothing operators.
+    """
+    signal = pf.signals.noise(256, rms=np.ones((3, 4)), seed=1)
+    operators = pf.dsp.interpolation._fractional_octave_smoothing_operator
+    operators.cache_clear()
+
+    smoothed, _ = smooth_fractional_octave(signal, 3, mode)
+    for ch in [(0, 0), (1, 2), (2, 3)]:
+        reference, _ = smooth_fractional_octave(
+            pf.Signal(signal.time[ch], signal.sampling_rate), 3, mode)
+        npt.assert_allclose(
+            smoothed.freq_raw[ch], reference.freq_raw[0], atol=1e-12)
+
+    assert operators.cache_info().misses == 1
+    assert operators.cache_info().hits == 3
+
+
+@pytest.mark.parametrize("n_points", [4, 5, 64])
+def test_bspline_design_matrix(n_points):
+    """Test the design matrix of cubic B-splines against scipy."""
+    from scipy.interpolate import BSpline as bspline
+    if not hasattr(bspline, "design_matrix"):
+        pytest.skip("BSpline.design_matrix requires scipy>=1.8")
+    x = np.arange(n_points) + 1.
+    knots = np.concatenate(([x[0]] * 4, x[2:-2], [x[-1]] * 4))
+    x_new = np.clip(n_points**((x - 1) / (n_points - 1)), x[0], x[-1])
+
+    for points in [x, x_new]:
+        npt.assert_allclose(
+            pf.dsp.interpolation._bspline_design_matrix(
+                points, knots).toarray(),
+            bspline.design_matrix(points, knots, 3).toarray(), atol=1e-15)
+
+
 def test_smooth_fractional_octave_window_parameter():
     """
     Test the returned window paramters. Only the types are tested. Testing
@@ -354,6 +392,51 @@ def test_interpolate_spectrum_fscale(
                             interpolator._f_base[[0, -1]])
 
 
+@pytest.mark.parametrize("fscale", ["linear", "log"])
+@pytest.mark.parametrize("clip", [False, (1, 1.5)])
+def test_interpolate_spectrum_batch(fscale, clip):
+    """Test batch interpolation and caching against single calls"""
+    data = pf.FrequencyData(
+        [[1, 2, 1, 2, 1], [2, 1, 2, 1, 2]], [100, 300, 1000, 3000, 10000])
+    interpolator = InterpolateSpectrum(
+        data, "magnitude_phase", ("nearest", "cubic", "linear"), fscale,
+        clip)
+
+    n_samples = [64, 65, 128]
+    sampling_rates = [44100, 48000, 44100]
+    signals = interpolator.batch(n_samples, sampling_rates)
+    assert len(signals) == 3
+
+    for signal, n, sampling_rate in zip(signals, n_samples, sampling_rates):
+        reference = InterpolateSpectrum(
+            data, "magnitude_phase", ("nearest", "cubic", "linear"), fscale,
+            clip)(n, sampling_rate)
+        assert signal == reference
+
+    # frequency grids and interpolators are reused
+    assert len(interpolator._plans) == 3
+    assert interpolator(64, 44100) == signals[0]
+    assert len(interpolator._plans) == 3
+    # all interpolators are shared for linear frequency scales
+    n_interpolators = len(
+        {id(plan[3]) for plan in interpolator._plans.values()})
+    assert n_interpolators == (1 if fscale == "linear" else 3)
+
+    # the least recently used plans are removed
+    interpolator._max_plans = 3
+    interpolator(65, 48000)
+    interpolator(32, 44100)
+    assert list(interpolator._plans) == [
+        (64, 44100), (65, 48000), (32, 44100)]
+    interpolator(128, 44100)
+    interpolator(16, 44100)
+    assert list(interpolator._plans) == [
+        (32, 44100), (128, 44100), (16, 44100)]
+
+    # broadcasting of n_samples and sampling_rate
+    assert len(interpolator.batch(64, [44100, 48000])) == 2
+
+
 def test_interpolate_spectrum_show():
     """Test plotting the results.
 
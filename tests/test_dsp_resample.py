@@ -1,6 +1,8 @@
 import pyfar as pf
 import pytest
 import numpy as np
+import numpy.testing as npt
+import scipy.signal as sgn
 
 
 @pytest.mark.parametrize('L', [2, 0.5])
@@ -157,3 +159,65 @@ def test_resample_suppress_aliasing():
     # below -50 dB possibly due to the finite length of the signal)
     idx_stop = diff.find_nearest_frequency(22050 * 1.05)
     assert np.all(mag[..., idx_stop + 1:] < -50)
+
+
+@pytest.mark.parametrize('sampling_rate', [48000, 22050, 44100, 96000])
+@pytest.mark.parametrize('block_size', [1, 100, 4096])
+def test_resampler_blocks(sampling_rate, block_size):
+    """Test if block-wise resampling equals resampling the entire signal"""
+    signal = pf.Signal(
+        np.random.default_rng(0).standard_normal((2, 3, 1000)), 44100)
+    resampler = pf.dsp.Resampler(44100, sampling_rate)
+
+    blocks = [resampler(signal[..., n:n + block_size])
+              for n in range(0, signal.n_samples, block_size)]
+    blocks.append(resampler.flush())
+    resampled = np.concatenate([block.time for block in blocks], -1)
+
+    reference = pf.dsp.resample(signal, sampling_rate)
+    assert all(block.sampling_rate == sampling_rate for block in blocks)
+    npt.assert_allclose(resampled, reference.time, atol=1e-12)
+
+
+def test_resampler_post_filter():
+    """Test the causal post filter of the resampler"""
+    signal = pf.signals.impulse(1024, 512)
+    resampler = pf.dsp.Resampler(44100, 48000, post_filter=True)
+    resampled = pf.Signal(np.concatenate(
+        (resampler(signal).time, resampler.flush().time), -1), 48000)
+
+    # the post filter is applied causally and only changes the phase
+    reference = pf.dsp.resample(signal, 48000, post_filter=False)
+    reference = pf.dsp.filter.elliptic(
+        reference, *_post_filter_parameters())
+    npt.assert_allclose(resampled.time, reference.time, atol=1e-12)
+
+
+def _post_filter_parameters():
+    """Parameters of the elliptic post filter for 44.1 kHz to 48 kHz"""
+    wp = 44100 / 48000
+    N, f_c = sgn.ellipord(wp, min(1, 1.05 * wp), .1, 30, fs=48000)
+    return N, .1, 30, f_c * 24000, 'lowpass'
+
+
+def test_resampler_state():
+    """Test reset and assertions of the resampler"""
+    resampler = pf.dsp.Resampler(44100, 48000)
+    assert (resampler.up, resampler.down) == (160, 147)
+
+    with pytest.raises(ValueError, match="No input was resampled"):
+        resampler.flush()
+    with pytest.raises(ValueError, match="must be a Signal"):
+        resampler(np.zeros(10))
+    with pytest.raises(ValueError, match="sampling rates do not match"):
+        resampler(pf.signals.impulse(10, sampling_rate=48000))
+
+    # the cshape must not change until reset
+    resampler(pf.signals.impulse(10))
+    with pytest.raises(ValueError, match="cshape of the input is"):
+        resampler(pf.signals.impulse(10, amplitude=[1, 1]))
+    resampler.reset()
+    resampler(pf.signals.impulse(10, amplitude=[1, 1]))
+
+    with pytest.raises(ValueError, match="match_amplitude is 'foo'"):
+        pf.dsp.Resampler(44100, 48000, match_amplitude='foo')
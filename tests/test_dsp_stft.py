@@ -0,0 +1,95 @@
+import pytest
+import numpy as np
+import numpy.testing as npt
+import scipy.signal as sgn
+import pyfar as pf
+
+
+@pytest.mark.parametrize("window_length, hop_size, n_fft", [
+    (1024, None, None), (1000, 300, 2048), (64, 64, None), (16, 1, None)])
+def test_stft_reconstruction(window_length, hop_size, n_fft):
+    """Test perfect reconstruction of multichannel signals"""
+    signal = pf.signals.noise(3000, rms=np.ones((2, 3)), seed=1)
+    window = 'hann' if hop_size != window_length else 'boxcar'
+    stft = pf.dsp.STFT(window_length, hop_size, window, n_fft)
+
+    spectra = stft.stft(signal)
+    hop_size = stft.hop_size
+    n_frames = (window_length - hop_size + signal.n_samples - 1) \
+        // hop_size + 1
+    assert spectra.shape == signal.cshape + (stft.n_bins, n_frames)
+    assert np.iscomplexobj(spectra)
+
+    reconstructed = stft.istft(spectra, signal.n_samples)
+    assert isinstance(reconstructed, pf.Signal)
+    npt.assert_allclose(reconstructed.time, signal.time, atol=1e-12)
+
+
+def test_stft_spectra():
+    """Test the spectra against the DFT of the windowed frames"""
+    signal = pf.signals.noise(256, seed=2)
+    stft = pf.dsp.STFT(64, 16, n_fft=128, sampling_rate=signal.sampling_rate)
+    spectra = stft.stft(signal)
+
+    # the third frame starts at sample 2 * 16 - (64 - 16)
+    frame = signal.time[0, :2 * 16 + 16] * sgn.get_window('hann', 64)[16:]
+    frame = np.concatenate((np.zeros(16), frame))
+    npt.assert_allclose(spectra[0, :, 2], np.fft.rfft(frame, 128), atol=1e-12)
+
+    npt.assert_allclose(stft.frequencies, np.fft.rfftfreq(128, 1 / 44100))
+    npt.assert_allclose(
+        stft.times(3), (np.arange(3) * 16 - 48 + 32) / 44100)
+
+
+def test_stft_streaming():
+    """Test frame-by-frame processing against processing the whole signal"""
+    signal = pf.signals.noise(2000, rms=[1, 2], seed=3)
+    stft = pf.dsp.STFT(128, 48)
+    spectra = stft.stft(signal)
+    reconstructed = stft.istft(spectra)
+
+    blocks = []
+    block_spectra = []
+    for n in range(0, signal.n_samples, 100):
+        block_spectra.append(stft.analyze(signal[..., n:n + 100]))
+        blocks.append(stft.synthesize(block_spectra[-1]).time)
+    block_spectra = np.concatenate(block_spectra, axis=-1)
+    blocks = np.concatenate(blocks, axis=-1)
+
+    n_frames = block_spectra.shape[-1]
+    npt.assert_allclose(block_spectra, spectra[..., :n_frames], atol=1e-12)
+    npt.assert_allclose(
+        blocks, reconstructed.time[..., :blocks.shape[-1]], atol=1e-12)
+
+    # cshape can only change after resetting
+    with pytest.raises(ValueError, match="Call reset()"):
+        stft.analyze(pf.signals.noise(100))
+    stft.reset()
+    # no frame is complete after 40 samples
+    assert stft.analyze(pf.signals.noise(40)).shape == (1, 65, 0)
+    assert stft.synthesize(np.zeros((1, 65, 0))).n_samples == 0
+
+
+def test_stft_assertions():
+    with pytest.raises(ValueError, match="window_length"):
+        pf.dsp.STFT(0)
+    with pytest.raises(ValueError, match="hop_size"):
+        pf.dsp.STFT(64, 65)
+    with pytest.raises(ValueError, match="n_fft"):
+        pf.dsp.STFT(64, n_fft=32)
+    with pytest.raises(ValueError, match="window must have 64"):
+        pf.dsp.STFT(64, window=np.ones(32))
+
+    stft = pf.dsp.STFT(64, 16)
+    with pytest.raises(ValueError, match="Signal object"):
+        stft.stft(np.zeros(100))
+    with pytest.raises(ValueError, match="sampling rates"):
+        stft.stft(pf.signals.noise(100, sampling_rate=48000))
+    with pytest.raises(ValueError, match="n_bins=33"):
+        stft.istft(np.zeros((32, 4)))
+
+    # hann window without overlap can not be inverted
+    stft = pf.dsp.STFT(64, 64)
+    spectra = stft.stft(pf.signals.noise(100))
+    with pytest.raises(ValueError, match="can not be inverted"):
+        stft.istft(spectra)
@@ -359,3 +359,126 @@ def test_rfft_normalization_sine(sine_stub):
     npt.assert_allclose(
         signal_spec, sine_stub.freq,
         rtol=1e-10, atol=1e-10)
+
+
+def test_fft_options_default():
+    assert fft.get_options() == {'backend': 'scipy', 'workers': -1}
+
+
+def test_fft_set_options():
+    try:
+        fft.set_options(backend='numpy', workers=1)
+        assert fft.get_options() == {'backend': 'numpy', 'workers': 1}
+        # None does not change the options
+        fft.set_options()
+        assert fft.get_options() == {'backend': 'numpy', 'workers': 1}
+    finally:
+        fft.set_options(backend='scipy', workers=-1)
+    assert fft.get_options() == {'backend': 'scipy', 'workers': -1}
+
+
+def test_fft_options_context():
+    data = np.random.default_rng(1).standard_normal((3, 64))
+    desired = fft.rfft(data, 64, 44100, 'none')
+    with fft.options(backend='numpy'):
+        assert fft.get_options() == {'backend': 'numpy', 'workers': -1}
+        with fft.options(workers=2):
+            assert fft.get_options() == {'backend': 'numpy', 'workers': 2}
+        spec = fft.rfft(data, 64, 44100, 'none')
+        npt.assert_allclose(fft.irfft(spec, 64, 44100, 'none'), data)
+    assert fft.get_options() == {'backend': 'scipy', 'workers': -1}
+    npt.assert_allclose(spec, desired)
+
+
+def test_fft_options_assertions():
+    with raises(ValueError, match="backend is 'fftw'"):
+        fft.set_options(backend='fftw')
+    with raises(ValueError, match="workers must be"):
+        fft.set_options(workers=0)
+    with raises(ValueError, match="workers must be"):
+        with fft.options(workers=1.5):
+            pass
+
+
+def test_fft_register_backend():
+    calls = []
+
+    class Backend():
+        @staticmethod
+        def fft(x, n=None, axis=-1, workers=None):
+            return np.fft.fft(x, n=n, axis=axis)
+
+        @staticmethod
+        def ifft(x, n=None, axis=-1, workers=None):
+            return np.fft.ifft(x, n=n, axis=axis)
+
+        @staticmethod
+        def rfft(x, n=None, axis=-1, workers=None):
+            calls.append(workers)
+            return np.fft.rfft(x, n=n, axis=axis)
+
+        @staticmethod
+        def irfft(x, n=None, axis=-1, workers=None):
+            return np.fft.irfft(x, n=n, axis=axis)
+
+    fft.register_backend('test', Backend)
+    try:
+        with fft.options(backend='test', workers=3):
+            fft.rfft(np.ones(8), 8, 44100, 'none')
+        assert calls == [3]
+    finally:
+        del fft._backends['test']
+
+    with raises(ValueError, match="must have a function 'fft'"):
+        fft.register_backend('test', np.linalg)
+    with raises(TypeError, match="must be a string"):
+        fft.register_backend(1, Backend)
+
+
+def test_fft_options_scipy_functions():
+    """Test that the options apply to functions using scipy.fft."""
+    import pyfar as pf
+    calls = []
+
+    class Backend():
+        @staticmethod
+        def fft(x, n=None, axis=-1, workers=None):
+            calls.append(('fft', workers))
+            return np.fft.fft(x, n=n, axis=axis)
+
+        @staticmethod
+        def ifft(x, n=None, axis=-1, workers=None):
+            calls.append(('ifft', workers))
+            return np.fft.ifft(x, n=n, axis=axis)
+
+        @staticmethod
+        def rfft(x, n=None, axis=-1, workers=None):
+            calls.append(('rfft', workers))
+            return np.fft.rfft(x, n=n, axis=axis)
+
+        @staticmethod
+        def irfft(x, n=None, axis=-1, workers=None):
+            calls.append(('irfft', workers))
+            return np.fft.irfft(x, n=n, axis=axis)
+
+    signal1 = pf.signals.noise(2**12, rms=[1, 2], seed=1)
+    signal2 = pf.signals.noise(2**10, seed=2)
+    desired = {method: pf.dsp.convolve(signal1, signal2, method=method)
+               for method in ['overlap_add', 'fft']}
+    desired_spectrogram = pf.dsp.spectrogram(signal2)[2]
+
+    fft.register_backend('test', Backend)
+    try:
+        with fft.options(backend='test', workers=3):
+            for method in ['overlap_add', 'fft']:
+                npt.assert_allclose(
+                    pf.dsp.convolve(signal1, signal2, method=method).time,
+                    desired[method].time, atol=1e-12)
+                assert ('rfft', 3) in calls and ('irfft', 3) in calls
+                calls.clear()
+
+            npt.assert_allclose(
+                pf.dsp.spectrogram(signal2)[2], desired_spectrogram)
+            assert calls == [('rfft', 3)]
+    finally:
+        del fft._backends['test']
@@ -287,3 +287,73 @@ def test_reconstructing_fractional_octave_bands_warning():
     with pytest.warns(UserWarning):
         x = pf.signals.impulse(2**12, sampling_rate=16e3)
         y, f = pfilt.reconstructing_fractional_octave_bands(x)
+
+
+def test_design_cache():
+    """Test hits, misses, and copies of the filter design cache."""
+    pfilt.clear_design_cache()
+    assert pfilt.design_cache_info() == {
+        'hits': 0, 'misses': 0, 'maxsize': 128, 'currsize': 0}
+
+    # repeated designs are taken from the cache
+    filters = [pfilt.butterworth(None, 4, 1000, 'lowpass', 44100)
+               for _ in range(3)]
+    assert pfilt.design_cache_info() == {
+        'hits': 2, 'misses': 1, 'maxsize': 128, 'currsize': 1}
+    npt.assert_equal(filters[0].coefficients, filters[2].coefficients)
+
+    # cached coefficients are not shared between filters
+    filters[0].coefficients[...] = 0
+    npt.assert_equal(
+        pfilt.butterworth(None, 4, 1000, 'lowpass', 44100).coefficients,
+        filters[1].coefficients)
+
+    # different parameters are designed separately
+    pfilt.butterworth(None, 4, 2000, 'lowpass', 44100)
+    pfilt.fractional_octave_bands(None, 3, sampling_rate=44100)
+    pfilt.reconstructing_fractional_octave_bands(None, sampling_rate=44100)
+    pfilt.GammatoneBands([0, 22050])
+    pfilt.GammatoneBands([0, 22050])
+    info = pfilt.design_cache_info()
+    assert info['misses'] == 5
+    assert info['hits'] == 4
+    assert info['currsize'] == 5
+
+    pfilt.clear_design_cache()
+    assert pfilt.design_cache_info() == {
+        'hits': 0, 'misses': 0, 'maxsize': 128, 'currsize': 0}
+
+
+def test_design_cache_warnings():
+    """Test that warnings are raised for cached designs."""
+    pfilt.clear_design_cache()
+    for _ in range(2):
+        with pytest.warns(UserWarning, match="Skipping bands"):
+            pfilt.reconstructing_fractional_octave_bands(
+                None, sampling_rate=16e3)
+    assert pfilt.design_cache_info()['hits'] == 1
+    pfilt.clear_design_cache()
+
+
+def test_design_cache_size():
+    """Test the size limit of the filter design cache."""
+    pfilt.clear_design_cache()
+    try:
+        pfilt.set_design_cache_size(2)
+        for frequency in [1000, 2000, 3000]:
+            pfilt.butterworth(None, 2, frequency, 'lowpass', 44100)
+        assert pfilt.design_cache_info()['currsize'] == 2
+        # the least recently used design was removed
+        pfilt.butterworth(None, 2, 1000, 'lowpass', 44100)
+        assert pfilt.design_cache_info()['hits'] == 0
+
+        # disable the cache
+        pfilt.set_design_cache_size(0)
+        pfilt.butterworth(None, 2, 1000, 'lowpass', 44100)
+        assert pfilt.design_cache_info()['currsize'] == 0
+
+        with pytest.raises(ValueError, match="non-negative integer"):
+            pfilt.set_design_cache_size(-1)
+    finally:
+        pfilt.set_design_cache_size(128)
+        pfilt.clear_design_cache()
@@ -465,3 +465,97 @@ def test_repr(capfd):
     out, _ = capfd.readouterr()
     assert out == \
         "SOS filter with 1 section and 1 channel @ 44100 Hz sampling rate\n"
+
+
+@pytest.mark.parametrize('Filter', [
+    (fo.FilterFIR([[1, -1], [1, .5]], 44100)),
+    (fo.FilterIIR([[1, -1], [1, -.5]], 44100)),
+    (fo.FilterSOS([[[1, -1, 0, 1, -.5, 0]], [[1, 0, 0, 1, .2, 0]]], 44100))])
+def test_process_blocks(Filter):
+    signal = pf.signals.noise(100, seed=1, rms=np.ones((2, 3)))
+    complete = Filter.process(signal, reset=True)
+
+    # blocks of varying length as Signals
+    blocks = [signal[..., :30], signal[..., 30:31], signal[..., 31:]]
+    filtered = list(Filter.process_blocks(blocks, reset=True))
+    assert len(filtered) == 3
+    for block in filtered:
+        assert isinstance(block, pf.Signal)
+        assert block.fft_norm == signal.fft_norm
+    npt.assert_array_equal(
+        np.concatenate([block.time for block in filtered], axis=-1),
+        complete.time)
+
+    # blocks as arrays. state is reset and then tracked
+    blocks = (signal.time[..., n:n+25] for n in range(0, 100, 25))
+    filtered = list(Filter.process_blocks(blocks, reset=True))
+    assert isinstance(filtered[0], np.ndarray)
+    npt.assert_array_equal(np.concatenate(filtered, axis=-1), complete.time)
+
+
+def test_process_blocks_init_state():
+    # state is initialized with zeros if it was not initialized before
+    filt = fo.FilterFIR([[1, -1]], 44100)
+    assert filt.state is None
+    filtered = list(filt.process_blocks([[1, 2, 3], [4, 5, 6]]))
+    npt.assert_array_equal(filtered[0], [1, 1, 1])
+    npt.assert_array_equal(filtered[1], [1, 1, 1])
+    npt.assert_array_equal(filt.state, [[[-6]]])
+
+
+def test_process_blocks_sampling_rate_mismatch():
+    filt = fo.FilterFIR([[1, -1]], 44100)
+    with pytest.raises(ValueError, match="sampling rates"):
+        list(filt.process_blocks([pf.Signal([1, 2, 3], 48000)]))
+
+
+@pytest.mark.parametrize('state', [False, True])
+def test_process_workers(state):
+    """Test that parallel processing yields the same result as serial."""
+    signal = pf.signals.noise(256, seed=1, rms=np.ones((2, 3)))
+    filt = pf.dsp.filter.fractional_octave_bands(
+        None, 1, 44100, (100, 8000))
+
+    if state:
+        filt.init_state(signal.cshape, 'zeros')
+    serial = filt.process(signal, reset=True)
+    serial_state = filt.state
+    parallel = filt.process(signal, reset=True, workers=4)
+
+    assert parallel.cshape == (filt.n_channels, 2, 3)
+    npt.assert_array_equal(parallel.time, serial.time)
+    if state:
+        npt.assert_array_equal(filt.state, serial_state)
+    else:
+        assert filt.state is None
+    # all cores
+    parallel = filt.process(signal, reset=True, workers=-1)
+    npt.assert_array_equal(parallel.time, serial.time)
+
+
+def test_process_workers_assertion():
+    filt = fo.FilterFIR([[1, -1]], 44100)
+    with pytest.raises(ValueError, match="workers must be"):
+        filt.process(pf.signals.impulse(10), workers=0)
+
+
+@pytest.mark.parametrize("filter_object", [
+    fo.FilterFIR([[1, -1]], 44100),
+    fo.FilterIIR([[1, 0], [1, -.5]], 44100),
+    fo.FilterSOS([[[1, 0, 0, 1, -.5, 0]]], 44100)])
+def test_process_single_precision(filter_object):
+    """Test that the precision of the input is kept."""
+    signal = pf.signals.impulse(10, amplitude=[1, 2])
+    signal.dtype = np.float32
+    filtered = filter_object.process(signal)
+    assert filtered.dtype == np.float32
+    assert filtered.time.dtype == np.float32
+    npt.assert_allclose(
+        filtered.time, filter_object.process(
+            pf.signals.impulse(10, amplitude=[1, 2])).time, rtol=1e-6)
+
+    # blocks of arrays
+    filter_object.init_state((2, ), 'zeros')
+    for block in filter_object.process_blocks(
+            [np.ones((2, 5), dtype=np.float32)]):
+        assert block.dtype == np.float32
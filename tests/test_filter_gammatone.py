@@ -129,9 +129,50 @@ def test_gammatone_bands_reset_state():
     npt.assert_array_equal(imag_b.time, imag.time[:, -2**11:])
 
 
+def test_gammatone_bands_sos():
+    """Test the precomputed second order sections"""
+    GFB = filter.GammatoneBands([0, 22050])
+    assert GFB._sos.shape == (GFB.n_bands, 4, 6)
+
+    bb = 3
+    sos = np.tile(np.atleast_2d(
+        [1, 0, 0, 1, -GFB.coefficients[bb], 0]), (4, 1))
+    sos[3, 0] = GFB.normalizations[bb]
+    npt.assert_array_equal(GFB._sos[bb], sos)
+
+
+def test_gammatone_bands_workers_and_dtype():
+    """Test parallel processing and single precision"""
+    GFB = filter.GammatoneBands([0, 22050])
+    signal = pf.signals.noise(2**10, seed=1, rms=np.ones((2, 3)))
+
+    real, imag = GFB.process(signal)
+    real_w, imag_w = GFB.process(signal, workers=4)
+    npt.assert_array_equal(real_w.time, real.time)
+    npt.assert_array_equal(imag_w.time, imag.time)
+
+    real_s, imag_s = GFB.process(signal, dtype='single')
+    assert GFB._state[0].dtype == np.complex64
+    assert real_s.dtype == np.float32
+    assert imag_s.time.dtype == np.float32
+    npt.assert_allclose(real_s.time, real.time, atol=1e-5)
+    npt.assert_allclose(imag_s.time, imag.time, atol=1e-5)
+
+    # state is reset if the precision changes
+    GFB.process(signal, reset=False)
+    assert GFB._state[0].dtype == complex
+
+
 def test_gammatone_bands_assertions():
     """Test all assertions"""
 
+    # wrong dtype and workers
+    GFB = filter.GammatoneBands([0, 22050])
+    with pytest.raises(ValueError, match="dtype must be"):
+        GFB.process(pf.signals.impulse(10), dtype='float')
+    with pytest.raises(ValueError, match="workers must be"):
+        GFB.process(pf.signals.impulse(10), workers=0)
+
     # wrong values in freq_range
     with pytest.raises(ValueError, match="Values in freq_range must be"):
         filter.GammatoneBands([-1, 22050])
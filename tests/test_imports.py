@@ -1,4 +1,6 @@
 import importlib
+import subprocess
+import sys
 
 
 def test_import_importlib():
@@ -45,3 +47,41 @@ def test_import_submodules():
     assert pyfar.samplings
     assert pyfar.plot
     assert pyfar.signals
+
+
+def test_import_lazy_subpackages():
+    """Test that subpackages with costly imports are loaded on access."""
+    lazy = ['pyfar.plot', 'pyfar.io', 'pyfar.samplings', 'pyfar.signals']
+    code = (
+        "import sys\n"
+        "import pyfar\n"
+        f"assert not [m for m in {lazy} if m in sys.modules]\n"
+        "pyfar.plot, pyfar.io, pyfar.samplings, pyfar.signals\n"
+        f"assert all(m in sys.modules for m in {lazy})\n"
+        "assert 'plot' in dir(pyfar)\n")
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_import_time():
+    """
+    Benchmark importing pyfar and make sure that costly modules are not
+    imported. Checking the imported modules instead of the import time makes
+    the test independent of the machine.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import pyfar'],
+        capture_output=True, text=True, check=True)
+
+    # parse lines 'import time: self [us] | cumulative | imported package'
+    times = {}
+    for line in result.stderr.splitlines()[1:]:
+        _, cumulative, module = line.split(':', 1)[1].split('|')
+        times[module.strip()] = int(cumulative)
+    import_time = f"{times['pyfar'] / 1e3:.1f} ms"
+
+    for module in ['matplotlib', 'sofar', 'soundfile', 'urllib3',
+                   'pyfar.plot', 'pyfar.io', 'pyfar.samplings',
+                   'pyfar.signals']:
+        assert module not in times, (
+            f"{module} is imported with pyfar (importing pyfar took "
+            f"{import_time})")
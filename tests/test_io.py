@@ -8,7 +8,9 @@ from pyfar.testing.stub_utils import stub_str_to_type, stub_is_pyfar_type
 
 import os.path
 import pathlib
+import zipfile
 import soundfile
+import sofar as sf
 
 from pyfar import io
 from pyfar import Signal
@@ -76,6 +78,64 @@ def test_convert_sofa_assertion():
         io.convert_sofa("test")
 
 
+@pytest.mark.parametrize('convention', [
+    'GeneralFIR', 'GeneralTF', 'GeneralFIR-E', 'GeneralTF-E'])
+@pytest.mark.parametrize('measurements', [
+    None, 3, slice(1, 4), [4, 0, 0], np.array([[1, 2], [3, 0]]), [],
+    np.array([True, False, True, False, False])])
+def test_sofa_reader(convention, measurements, tmpdir):
+    """Test reading selected measurements with SofaReader"""
+    filename = os.path.join(tmpdir, 'test.sofa')
+    rng = np.random.default_rng(1)
+    shape = (5, 2, 8, 3) if convention.endswith('-E') else (5, 2, 8)
+
+    sofa = sf.Sofa(convention)
+    if 'FIR' in convention:
+        sofa.Data_IR = rng.standard_normal(shape)
+        sofa.Data_Delay = np.zeros((1, ) + shape[1:2] + shape[3:])
+        sofa.Data_SamplingRate = 48000
+    else:
+        sofa.Data_Real = rng.standard_normal(shape)
+        sofa.Data_Imag = rng.standard_normal(shape)
+        sofa.N = np.arange(8)
+    sofa.SourcePosition = rng.standard_normal((5, 3))
+    sofa.SourcePosition_Type = 'cartesian'
+    sofa.SourcePosition_Units = 'metre'
+    sf.write_sofa(filename, sofa)
+
+    reference, sources, receivers = io.read_sofa(filename)
+    index = slice(None) if measurements is None else measurements
+    if convention.endswith('-E'):
+        index = (slice(None), index)
+
+    with io.SofaReader(filename) as reader:
+        assert reader.n_measurements == 5
+        assert reader.source_coordinates == sources
+        assert reader.receiver_coordinates == receivers
+
+        audio = reader.read(measurements)
+        assert type(audio) is type(reference)
+        if 'FIR' in convention:
+            assert audio.sampling_rate == 48000
+            npt.assert_array_equal(audio.time, reference.time[index])
+        else:
+            npt.assert_array_equal(audio.frequencies, np.arange(8))
+            npt.assert_array_equal(audio.freq, reference.freq[index])
+
+
+def test_sofa_reader_assertions(tmpdir):
+    """Test assertions of SofaReader"""
+    filename = os.path.join(tmpdir, 'test.sofa')
+    sofa = sf.Sofa('GeneralFIR')
+    sofa.Data_IR = np.zeros((3, 1, 4))
+    sofa.Data_Delay = np.zeros((1, 1))
+    sf.write_sofa(filename, sofa)
+
+    with io.SofaReader(filename) as reader:
+        with pytest.raises(IndexError):
+            reader.read(3)
+
+
 @patch('pyfar.io._codec._str_to_type', new=stub_str_to_type())
 @patch('pyfar.io._codec._is_pyfar_type', new=stub_is_pyfar_type())
 def test_write_read_flat_data(tmpdir, flat_data):
@@ -202,6 +262,133 @@ def test_write_read_signal(domain, sine, tmpdir):
     assert actual == sine
 
 
+@pytest.mark.parametrize("compress", [False, True])
+def test_write_compression(compress, sine, tmpdir):
+    """Check that the compression of the zip members matches `compress`."""
+    filename = os.path.join(tmpdir, 'signal.far')
+    io.write(filename, compress=compress, signal=sine)
+    expected = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    with zipfile.ZipFile(filename) as zip_file:
+        for info in zip_file.infolist():
+            assert info.compress_type == expected
+
+
+@pytest.mark.parametrize("mmap_mode", ['r', 'c'])
+def test_read_mmap_mode(mmap_mode, sine, coordinates, tmpdir):
+    """Check reading memory-mapped arrays from uncompressed files."""
+    filename = os.path.join(tmpdir, 'objects.far')
+    array = np.arange(12.).reshape((3, 4)).T
+    io.write(filename, signal=sine, coordinates=coordinates, array=array,
+             empty=np.zeros((0, 2)))
+    actual = io.read(filename, mmap_mode=mmap_mode)
+
+    assert isinstance(actual['signal']._data, np.memmap)
+    assert actual['signal'] == sine
+    assert actual['coordinates'] == coordinates
+    assert isinstance(actual['array'], np.memmap)
+    npt.assert_equal(actual['array'], array)
+    assert actual['array'].flags.f_contiguous
+    assert actual['empty'].shape == (0, 2)
+
+    # the file is not changed by writing to the data
+    if mmap_mode == 'c':
+        actual['signal'].time[..., 0] = 42
+        assert io.read(filename)['signal'] == sine
+    else:
+        with pytest.raises(ValueError, match="read-only"):
+            actual['signal'].time[..., 0] = 42
+
+
+def test_read_mmap_mode_compressed(sine, tmpdir):
+    """Check that arrays of compressed files are read to memory."""
+    filename = os.path.join(tmpdir, 'signal.far')
+    io.write(filename, compress=True, signal=sine)
+    actual = io.read(filename, mmap_mode='r')['signal']
+    assert not isinstance(actual._data, np.memmap)
+    assert actual == sine
+
+
+def test_read_mmap_mode_error(sine, tmpdir):
+    filename = os.path.join(tmpdir, 'signal.far')
+    io.write(filename, signal=sine)
+    with pytest.raises(ValueError, match="mmap_mode is 'r\\+'"):
+        io.read(filename, mmap_mode='r+')
+
+
+def test_read_names(sine, coordinates, tmpdir):
+    """Check reading selected objects."""
+    filename = os.path.join(tmpdir, 'objects.far')
+    io.write(filename, signal=sine, coordinates=coordinates, number=1,
+             array=np.arange(3))
+    actual = io.read(filename, names=['number', 'signal'])
+    assert list(actual.keys()) == ['number', 'signal']
+    assert actual['signal'] == sine
+    assert actual['number'] == 1
+
+    actual = io.read(filename, names='coordinates')
+    assert list(actual.keys()) == ['coordinates']
+    assert actual['coordinates'] == coordinates
+
+    with pytest.raises(ValueError, match="does not contain the objects"):
+        io.read(filename, names=['signal', 'sine'])
+
+
+def test_list_objects_and_info(sine, coordinates, tmpdir):
+    """Check obtaining information without reading the objects."""
+    filename = os.path.join(tmpdir, 'objects.far')
+    io.write(filename, signal=sine, coordinates=coordinates, number=1,
+             array=np.ones((3, 4), dtype=np.float32))
+
+    assert io.list_objects(filename) == {
+        'signal': 'Signal', 'coordinates': 'Coordinates', 'array': 'ndarray',
+        'number': 'int'}
+
+    info = io.info(filename)
+    assert info['array'] == {
+        'type': 'ndarray', 'shape': (3, 4), 'dtype': 'float32'}
+    assert info['signal']['type'] == 'Signal'
+    assert info['signal']['arrays']['_data'] == {
+        'shape': sine.time.shape, 'dtype': 'float64'}
+    assert info['coordinates']['arrays']['_points']['shape'] == \
+        coordinates._points.shape
+    assert info['number'] == {'type': 'int'}
+
+
+def test_write_error_removes_file(sine, tmpdir):
+    """Check that no incomplete file remains if writing fails."""
+    filename = os.path.join(tmpdir, 'signal.far')
+    with pytest.raises(TypeError, match="cannot be written"):
+        io.write(filename, signal=sine, generator=(n for n in range(3)))
+    assert not os.path.exists(filename)
+    assert os.listdir(tmpdir) == []
+
+
+def test_write_error_keeps_file(sine, tmpdir):
+    """Check that existing files are kept if writing fails."""
+    filename = os.path.join(tmpdir, 'signal.far')
+    io.write(filename, signal=sine)
+    with pytest.raises(TypeError, match="cannot be written"):
+        io.write(filename, signal=object())
+    assert io.read(filename)['signal'] == sine
+    assert os.listdir(tmpdir) == ['signal.far']
+
+
+def test_write_file_mode(sine, tmpdir):
+    """Check the permissions of new and replaced files."""
+    filename = os.path.join(tmpdir, 'signal.far')
+    umask = os.umask(0o027)
+    try:
+        io.write(filename, signal=sine)
+    finally:
+        os.umask(umask)
+    assert os.stat(filename).st_mode & 0o777 == 0o640
+
+    # replaced files keep their permissions
+    os.chmod(filename, 0o600)
+    io.write(filename, signal=sine)
+    assert os.stat(filename).st_mode & 0o777 == 0o600
+
+
 def test_write_read_timedata(time_data, tmpdir):
     """ TimeData
     Make sure `read` understands the bits written by `write`
@@ -544,6 +731,61 @@ def test_write_audio_overwrite(noise, tmpdir):
     io.write_audio(noise, filename, overwrite=True)
 
 
+@pytest.mark.parametrize("overlap", [0, 100])
+def test_stream_audio(overlap, noise_two_by_three_channel, tmpdir):
+    """Test reading audio blocks and writing them with AudioWriter."""
+    signal = pyfar.Signal(
+        noise_two_by_three_channel.time[0] / 10, 44100)
+    filename = os.path.join(tmpdir, 'test_wav.wav')
+    io.write_audio(signal, filename, subtype='DOUBLE')
+
+    blocks = list(io.stream_audio(filename, 300, overlap))
+    hop = 300 - overlap
+    for idx, block in enumerate(blocks):
+        assert isinstance(block, pyfar.Signal)
+        assert block.sampling_rate == 44100
+        assert block.cshape == (3, )
+        npt.assert_allclose(
+            block.time, signal.time[..., idx * hop:idx * hop + 300])
+
+    filename_out = os.path.join(tmpdir, 'test_wav_out.wav')
+    with io.AudioWriter(filename_out, subtype='DOUBLE') as writer:
+        for block in io.stream_audio(filename, 300):
+            writer.write(block)
+        assert writer.n_samples == signal.n_samples
+    npt.assert_allclose(io.read_audio(filename_out).time, signal.time)
+
+
+def test_stream_audio_assertions(noise, tmpdir):
+    filename = os.path.join(tmpdir, 'test_wav.wav')
+    io.write_audio(noise, filename)
+    with pytest.raises(ValueError, match="block_size must be"):
+        next(io.stream_audio(filename, 0))
+    with pytest.raises(ValueError, match="overlap must be"):
+        next(io.stream_audio(filename, 10, 10))
+
+
+def test_audio_writer_assertions(noise, noise_two_by_three_channel, tmpdir):
+    filename = os.path.join(tmpdir, 'test_wav.wav')
+    io.write_audio(noise, filename)
+    with pytest.raises(FileExistsError):
+        io.AudioWriter(filename, overwrite=False)
+
+    with io.AudioWriter(filename) as writer:
+        with pytest.raises(ValueError, match="must be a Signal"):
+            writer.write(noise.time)
+        writer.write(noise)
+        with pytest.raises(ValueError, match="sampling rate"):
+            writer.write(pyfar.Signal(noise.time, 48000))
+        with pytest.raises(ValueError, match="number of channels"):
+            writer.write(noise_two_by_three_channel)
+
+    # signals are flattened
+    with pytest.warns(UserWarning, match='flattened'):
+        with io.AudioWriter(filename) as writer:
+            writer.write(noise_two_by_three_channel / 10)
+
+
 @patch('soundfile.write')
 def test_write_audio_kwargs(sf_write_mock, noise):
     pyfar.io.write_audio(
@@ -356,3 +356,55 @@ def test_read_comsol_check_specific_combination(filename, type):
         assert all(~np.isnan(data.freq[:, :, i, i, :]).flatten())
         data.freq[:, :, i, i, :] = np.nan
     assert all(np.isnan(data.freq.flatten()))
+
+
+@pytest.mark.parametrize("filename",  [
+    'intensity_parametric',
+    'pressure_acceleration_parametric_time',
+    'pressure_parametric_incomplete',
+    ])
+@pytest.mark.parametrize("type",  ['.txt', '.dat', '.csv'])
+def test_read_comsol_chunks(filename, type, monkeypatch):
+    """Test that the data does not depend on the number of parsed lines."""
+    path = os.path.join(os.getcwd(), 'tests', 'test_io_data', filename)
+    data, coordinates = io.read_comsol(path + type)
+    monkeypatch.setattr(io.io, '_comsol_chunk_size', 1)
+    data_chunks, coordinates_chunks = io.read_comsol(path + type)
+    np.testing.assert_array_equal(data_chunks._data, data._data)
+    assert coordinates_chunks == coordinates
+
+
+def test_read_comsol_three_parameters(tmp_path):
+    """Test order of the data for sweeps over three parameters."""
+    values = {'a': [1, 2], 'b': [3, 4, 5], 'c': [6, 7]}
+    columns = [f'pabe.p_t (Pa) @ freq=100, a={a}, b={b}, c={c}'
+               for a in values['a'] for b in values['b'] for c in values['c']]
+    filename = os.path.join(tmp_path, 'three_parameters.csv')
+    with open(filename, 'w') as f:
+        f.write('% Dimension,1\n% Nodes,2\n')
+        f.write(f'% Expressions,{len(columns)}\n')
+        f.write('% x,' + ','.join(columns) + '\n')
+        for x in range(2):
+            f.write(f'{x},' + ','.join(
+                f'{100 * x + a}{b}{c}' for a in values['a']
+                for b in values['b'] for c in values['c']) + '\n')
+
+    data, _ = io.read_comsol(filename)
+    assert data.cshape == (2, 1, 2, 3, 2)
+    assert data.freq[1, 0, 1, 2, 1, 0] == 10257
+    assert data.freq[0, 0, 0, 1, 0, 0] == 146
+
+    data, _ = io.read_comsol(
+        filename, parameters={'a': [2], 'b': [5, 3], 'c': [6]})
+    assert data.cshape == (2, 1, 1, 2, 1)
+    np.testing.assert_array_equal(
+        data.freq[:, 0, 0, :, 0, 0], [[256, 236], [10256, 10236]])
+
+
+def test_read_comsol_wrong_number_of_nodes(tmp_path):
+    filename = os.path.join(tmp_path, 'wrong_nodes.csv')
+    with open(filename, 'w') as f:
+        f.write('% Dimension,1\n% Nodes,3\n% Expressions,1\n')
+        f.write('% x,pabe.p_t (Pa) @ freq=100\n0,1\n1,2\n')
+    with pytest.raises(ValueError, match='number of nodes'):
+        io.read_comsol(filename)
@@ -1,5 +1,8 @@
+import os
+import threading
 import numpy as np
 import numpy.testing as npt
+import pytest
 from pytest import raises
 
 import pyfar
@@ -174,6 +177,95 @@ def test_sph_t_design():
         c = samplings.sph_t_design(2, criterion='const_thread')
 
 
+@pytest.fixture
+def grid_mirror(tmp_path):
+    """Use a local mirror with an extremal and a t-design grid."""
+    mirror = tmp_path / 'mirror'
+    mirror.mkdir()
+    # tetrahedron with equal weights
+    points = np.array([[1, 1, 1], [1, -1, -1], [-1, 1, -1], [-1, -1, 1]])
+    points = points / np.sqrt(3)
+    np.savetxt(mirror / 'md001.00004',
+               np.column_stack((points, np.full(4, np.pi))))
+    np.savetxt(mirror / 'sf002.00006', np.concatenate((np.eye(3), -np.eye(3))))
+
+    samplings.set_grid_store(tmp_path / 'store', mirror.as_uri())
+    yield tmp_path
+    samplings.set_grid_store()
+
+
+def test_grid_store(grid_mirror):
+    """Test loading grids from a local mirror into the grid store."""
+    c = samplings.sph_extremal(sh_order=1)
+    assert c.csize == 4
+    npt.assert_allclose(np.sum(c.weights), 1)
+    npt.assert_allclose(c.get_sph()[..., 2], 1)
+
+    c = samplings.sph_t_design(2, radius=2)
+    npt.assert_allclose(c.get_cart()[:3], 2 * np.eye(3))
+
+    info = samplings.grid_store_info()
+    assert info['directory'] == str(grid_mirror / 'store')
+    assert info['url'] == (grid_mirror / 'mirror').as_uri() + '/'
+    assert info['grids'] == ['extremal_md001.00004', 't_design_sf002.00006']
+
+    # grids are read from the store if the mirror is not available
+    for file in (grid_mirror / 'mirror').iterdir():
+        file.unlink()
+    samplings.set_grid_store(grid_mirror / 'store')
+    assert samplings.sph_extremal(4).csize == 4
+    with raises(FileNotFoundError):
+        samplings.set_grid_store(
+            grid_mirror / 'store', (grid_mirror / 'mirror').as_uri())
+        samplings.sph_extremal(9)
+
+
+def test_grid_store_checksum(grid_mirror):
+    """Test if corrupted grids are detected."""
+    samplings.sph_extremal(4)
+    archive = samplings.grid_store_info()['archive']
+    with np.load(archive) as data:
+        grids = dict(data)
+    grids['extremal_md001.00004'] = grids['extremal_md001.00004'] + 1
+    np.savez(archive, **grids)
+
+    samplings.set_grid_store(grid_mirror / 'store')
+    with raises(ValueError, match="checksum of the sampling grid"):
+        samplings.sph_extremal(4)
+
+
+def test_grid_store_lock(grid_mirror, monkeypatch):
+    """Test locking the grid store for updates."""
+    from pyfar.samplings import _grid_store
+    archive = samplings.grid_store_info()['archive']
+    lock_file = archive + '.lock'
+
+    # grids are not written while another process holds the lock
+    os.makedirs(os.path.dirname(archive))
+    open(lock_file, 'w').close()
+    monkeypatch.setattr(_grid_store, '_lock_timeout', .2)
+    with raises(TimeoutError, match="locked"):
+        samplings.sph_extremal(sh_order=1)
+    assert not os.path.isfile(archive)
+    os.remove(lock_file)
+
+    # updates wait for the lock and keep the grids in the archive
+    samplings.sph_extremal(sh_order=1)
+    thread = threading.Thread(target=_grid_store._write_archive, args=(
+        archive, {'t_design_sf002.00006': np.eye(3)}))
+    with _grid_store._archive_lock(archive):
+        thread.start()
+        thread.join(.05)
+        assert thread.is_alive()
+    thread.join()
+    assert samplings.grid_store_info()['grids'] == [
+        'extremal_md001.00004', 't_design_sf002.00006']
+    assert not os.path.isfile(lock_file)
+    umask = os.umask(0)
+    os.umask(umask)
+    assert os.stat(archive).st_mode & 0o777 == 0o666 & ~umask
+
+
 def test_sph_equal_angle():
     # test with tuple
     c = samplings.sph_equal_angle((10, 20))
@@ -248,6 +340,30 @@ def test_sph_lebedev():
     npt.assert_allclose(c.get_sph()[..., 2], 1.5, atol=1e-15)
 
 
+@pytest.mark.parametrize('n_points', [
+    6, 14, 26, 38, 50, 74, 86, 110, 146, 170, 194, 230, 266, 302, 350, 434,
+    590, 770, 974, 1202, 1454, 1730, 2030, 2354, 2702, 3074, 3470, 3890,
+    4334, 4802, 5294, 5810])
+def test_sph_lebedev_grids(n_points):
+    """Test the Lebedev grids that are read from disk"""
+    c = samplings.sph_lebedev(n_points)
+    assert c.csize == n_points
+    x, y, z = c.get_cart().T
+    npt.assert_allclose(c.get_sph()[..., 2], 1, atol=1e-14)
+    npt.assert_allclose(np.sum(c.weights), 1)
+    # integrate x^2 + y^2 - z^2 over the unit sphere (normalized by 4 pi)
+    npt.assert_allclose(np.sum((x**2 + y**2 - z**2) * c.weights), 1 / 3)
+
+    # grids are read once and must not be changed
+    leb = samplings.external.lebedev_sphere(n_points)
+    assert np.shares_memory(
+        leb['x'], samplings.external.lebedev_sphere(n_points)['x'])
+    assert not any(leb[key].flags.writeable for key in 'xyzw')
+
+    with raises(ValueError, match="Invalid degree"):
+        samplings.external.lebedev_sphere(n_points + 1)
+
+
 def test_sph_fliege():
     # test without parameters
     assert samplings.sph_fliege() is None
@@ -1,3 +1,4 @@
+import os
 import pytest
 import numpy as np
 import numpy.testing as npt
@@ -100,3 +101,79 @@ def test_hrirs_assertions():
     """Test assertions for getting HRIRs"""
     with pytest.raises(ValueError, match="HRIR for azimuth=1"):
         pf.signals.files.head_related_impulse_responses([[1, 0]])
+
+
+@pytest.fixture
+def files_cache(tmp_path, monkeypatch):
+    """Use a temporary cache and data directory with a castanets sample."""
+    monkeypatch.setattr(pf.signals.files, 'file_dir', str(tmp_path))
+    pf.io.write_audio(
+        pf.signals.noise(4410, seed=1), tmp_path / 'castanets.wav')
+    (tmp_path / 'castanets_license.txt').touch()
+
+    pf.signals.files.set_cache(str(tmp_path / 'cache'))
+    yield tmp_path
+    pf.signals.files.set_cache()
+
+
+def test_files_cache(files_cache):
+    """Test caching resampled data"""
+    # no caching at the original sampling rate
+    signal = pf.signals.files.castanets()
+    assert pf.signals.files.cache_info()['files'] == 0
+
+    # resampled data is cached
+    resampled = pf.signals.files.castanets(48000)
+    info = pf.signals.files.cache_info()
+    assert info['files'] == 1
+    assert info['directory'] == str(files_cache / 'cache')
+    assert info['currsize'] > 0
+    umask = os.umask(0)
+    os.umask(umask)
+    for file in (files_cache / 'cache').glob('*.far'):
+        assert file.stat().st_mode & 0o777 == 0o666 & ~umask
+
+    # cached data is read from disk and equals the resampled data
+    (files_cache / 'castanets.wav').unlink()
+    cached = pf.signals.files.castanets(sampling_rate=48000)
+    assert cached == resampled
+    assert cached == pf.dsp.resample(signal, 48000, post_filter=True)
+
+    pf.signals.files.clear_cache()
+    assert pf.signals.files.cache_info()['files'] == 0
+
+
+def test_files_cache_parameters(files_cache):
+    """Test cache keys, outputs of multiple objects, and the size limit"""
+    calls = []
+
+    @pf.signals.files._cached(44100)
+    def data(position=[[0, 0]], sampling_rate=44100):
+        calls.append(position)
+        return (pf.signals.impulse(10, sampling_rate=sampling_rate),
+                pf.Coordinates(*np.array(position).T, 0))
+
+    signal, sources = data([[1, 2]], 48000)
+    assert data(sampling_rate=48000, position=[[1, 2]]) == (signal, sources)
+    assert data(np.array([[1, 2]]), 48000) == (signal, sources)
+    assert len(calls) == 1
+
+    data([[2, 1]], 48000)
+    assert len(calls) == 2
+    assert pf.signals.files.cache_info()['files'] == 2
+
+    # the least recently used files are deleted if the cache is too large
+    size = pf.signals.files.cache_info()['currsize']
+    pf.signals.files.set_cache(str(files_cache / 'cache'), size - 1)
+    assert pf.signals.files.cache_info()['files'] == 1
+    data([[2, 1]], 48000)
+    assert len(calls) == 2
+
+    # disable the cache
+    pf.signals.files.set_cache(str(files_cache / 'cache'), 0)
+    data([[2, 1]], 48000)
+    assert len(calls) == 3
+    assert pf.signals.files.cache_info()['files'] == 0
+
+    with pytest.raises(ValueError, match="non-negative integer"):
+        pf.signals.files.set_cache(maxsize=-1)